@@ -9,11 +9,28 @@ class GameConfig:
     show_splash_video: bool = True
     splash_video_max_seconds: float = 8.0
     splash_video_path: str = "assets/video/into_vid.mp4"
+    # Decoded frames buffered ahead of playback by the splash decoder thread.
+    splash_queue_frames: int = 8
+    # Directory to keep decoded, pre-scaled splash frames in for instant
+    # replays (roughly 2 MB per frame), or None to decode every launch.
+    splash_frame_cache_dir: str | None = None
     show_host_intro: bool = True
+    # Simulate the whole episode headless first, then play it back from the
+    # recorded timeline with pause, seeking and rewind (see sim/timeline.py).
+    playback_mode: bool = False
 
     # Market phase
     # Default to an hour-long shopping period
     market_seconds: float = 60.0 * 60.0
+    # The market sim advances in fixed steps of this many sim seconds, so
+    # outcomes do not depend on frame rate; speed settings change how many
+    # steps run per frame. Sim time past the per-frame cap is dropped.
+    sim_step_s: float = 1.0 / 30.0
+    max_sim_steps_per_frame: int = 240
+    # Turbo modes (T key) run as many sim steps as fit in this much CPU time
+    # per frame and only redraw at turbo_render_fps or on a phase change.
+    turbo_cpu_budget_ms: float = 12.0
+    turbo_render_fps: float = 10.0
     team_speed_px_s: float = 160.0
     buy_radius_px: float = 28.0
     buy_decision_seconds_range: tuple[float, float] = (6.0, 12.0)
@@ -37,6 +54,13 @@ class GameConfig:
     # JSONL set, or a combination of both. Defaults to the generated JSONL set
     # so item images and metadata from data/items_100.jsonl are available in-game.
     item_source: str = "generated"
+    # Directory for cached generated markets (see sim/market_cache.py), or
+    # None to always regenerate. Handy when reloading the same seed often.
+    market_cache_dir: str | None = None
+    # Bidders per auction lot (see models/bidding.py); 0 keeps the classic
+    # single-draw sale and its cosmetic bid ticker, None defers to the balance
+    # config's auction_house.bidders.
+    auction_bidders: int | None = None
 
     # Show rules
     items_per_team: int = 3          # team purchases
@@ -47,3 +71,6 @@ class GameConfig:
     # Visual layout
     hud_w: int = 360
     margin: int = 18
+    # Present only the rects a screen reports as changed instead of flipping
+    # the whole window. Screens that report nothing still get a full flip.
+    dirty_rect_updates: bool = False
@@ -1,19 +1,64 @@
+import importlib
+import math
+import threading
+import time
+
 import pygame
 from config import GameConfig
-from sim.item_factory import configure_item_factory
-from ui.screens.market_screen import MarketScreen
-from ui.screens.intro_screens import (
-    HostWelcomeScreen,
-    ContestantIntroScreen,
-    ExpertAssignmentScreen,
-    MarketSendoffScreen,
-)
-from ui.screens.expert_budget_screen import ExpertBudgetScreen
-from ui.screens.expert_shopping_screen import ExpertShoppingScreen
-from ui.screens.expert_reveal_screen import ExpertRevealScreen
-from ui.screens.appraisal_screen import AppraisalScreen
-from ui.screens.auction_screen import AuctionScreen
-from ui.screens.results_screen import ResultsScreen
+from sim.dataset_registry import get_item_factory
+from sim.fixed_step import FixedStepClock
+from sim.market_cache import MarketCache
+
+# Phase -> (module, screen class, whether it takes the episode). Screens are
+# imported and built the first time their phase is entered, so startup only
+# pays for the first one.
+SCREEN_CLASSES = {
+    "INTRO_HOST": ("ui.screens.intro_screens", "HostWelcomeScreen", False),
+    "INTRO_CONTESTANTS": ("ui.screens.intro_screens", "ContestantIntroScreen", True),
+    "INTRO_EXPERTS": ("ui.screens.intro_screens", "ExpertAssignmentScreen", True),
+    "INTRO_MARKET": ("ui.screens.intro_screens", "MarketSendoffScreen", False),
+    "MARKET": ("ui.screens.market_screen", "MarketScreen", True),
+    "EXPERT_HANDOFF": ("ui.screens.expert_budget_screen", "ExpertBudgetScreen", True),
+    "EXPERT_SHOPPING": ("ui.screens.expert_shopping_screen", "ExpertShoppingScreen", True),
+    "EXPERT_REVEAL": ("ui.screens.expert_reveal_screen", "ExpertRevealScreen", True),
+    "APPRAISAL": ("ui.screens.appraisal_screen", "AppraisalScreen", True),
+    "AUCTION_TEAM": ("ui.screens.auction_screen", "AuctionScreen", True),
+    "AUCTION_EXPERT": ("ui.screens.auction_screen", "AuctionScreen", True),
+    "RESULTS": ("ui.screens.results_screen", "ResultsScreen", True),
+}
+
+
+class ScreenRegistry:
+    """Phase -> screen mapping that builds each screen on first access."""
+
+    def __init__(self, build):
+        self._build = build
+        self._screens = {}
+
+    def __getitem__(self, phase: str):
+        screen = self._screens.get(phase)
+        if screen is None:
+            if phase not in SCREEN_CLASSES:
+                raise KeyError(phase)
+            screen = self._screens[phase] = self._build(phase)
+        return screen
+
+    def __contains__(self, phase: str) -> bool:
+        return phase in SCREEN_CLASSES
+
+    def built(self) -> list[str]:
+        return list(self._screens)
+
+
+# Turbo speeds cycled with T; TURBO_INSTANT runs to the end of the current
+# phase as fast as the CPU budget allows, then drops back to normal speed.
+TURBO_INSTANT = math.inf
+TURBO_MODES = (100.0, 1000.0, TURBO_INSTANT)
+# Sim seconds handed to the timer-driven (non-market) screens per update
+# while running instantly; each update moves them at least one stage on.
+INSTANT_PHASE_STEP = 1.0
+SIM_RATE_WINDOW = 0.5
+
 
 class GameState:
     def __init__(self, cfg: GameConfig, seed: int, episode_idx: int):
@@ -21,46 +66,77 @@ class GameState:
         self.intro_enabled = cfg.show_host_intro
         self.phase = "INTRO_HOST" if self.intro_enabled else "MARKET"
         self.time_scale = 1.0
+        self.turbo: float | None = None
+        self.sim_rate = 0.0
+        self._rate_sim = 0.0
+        self._rate_wall = 0.0
+        self._last_render_at = -math.inf
+        self._rendered_phase = None
         play_rect = (0, 0, cfg.window_w - cfg.hud_w, cfg.window_h)
 
-        # Configure which item dataset should be used for this run before
-        # any items are generated.
-        configure_item_factory(cfg.item_source)
-
-        from models.episode import Episode
-        self.episode = Episode(
-            ep_idx=episode_idx,
-            seed=seed,
-            play_rect=play_rect,
-            items_per_team=cfg.items_per_team,
-            starting_budget=cfg.starting_budget,
-            expert_min_budget=cfg.expert_min_budget,
-            cfg=cfg,
+        # Loading the item catalog and generating the market happen on a
+        # background thread while the intro cards play; `episode` waits for
+        # it the first time something needs the episode.
+        self._episode = None
+        self._episode_error: BaseException | None = None
+        self._episode_args = (seed, episode_idx, play_rect)
+        self._episode_thread = threading.Thread(
+            target=self._setup_episode, args=self._episode_args, name="episode-setup", daemon=True
         )
-        self.episode.setup()
-        self.episode.time_scale = self.time_scale
+        if self.intro_enabled:
+            self._episode_thread.start()
 
         self.market_time_left = cfg.market_seconds
+        self.market_clock = FixedStepClock(step=cfg.sim_step_s, max_steps=cfg.max_sim_steps_per_frame)
         self.expert_budget_reserved = False
 
-        self.screens = {
-            "INTRO_HOST": HostWelcomeScreen(cfg),
-            "INTRO_CONTESTANTS": ContestantIntroScreen(cfg, self.episode),
-            "INTRO_EXPERTS": ExpertAssignmentScreen(cfg, self.episode),
-            "INTRO_MARKET": MarketSendoffScreen(cfg),
-            "MARKET": MarketScreen(cfg, self.episode),
-            "EXPERT_HANDOFF": ExpertBudgetScreen(cfg, self.episode),
-            "EXPERT_SHOPPING": ExpertShoppingScreen(cfg, self.episode),
-            "EXPERT_REVEAL": ExpertRevealScreen(cfg, self.episode),
-            "APPRAISAL": AppraisalScreen(cfg, self.episode),
-            "AUCTION_TEAM": AuctionScreen(cfg, self.episode),
-            "AUCTION_EXPERT": AuctionScreen(cfg, self.episode),
-            "RESULTS": ResultsScreen(cfg, self.episode),
-        }
+        self.screens = ScreenRegistry(self._build_screen)
         self.screen = self.screens[self.phase]
         if hasattr(self.screen, "reset"):
             self.screen.reset()
 
+    def _setup_episode(self, seed: int, episode_idx: int, play_rect):
+        try:
+            from models.episode import Episode
+
+            cfg = self.cfg
+            episode = Episode(
+                ep_idx=episode_idx,
+                seed=seed,
+                play_rect=play_rect,
+                items_per_team=cfg.items_per_team,
+                starting_budget=cfg.starting_budget,
+                expert_min_budget=cfg.expert_min_budget,
+                cfg=cfg,
+                item_factory=get_item_factory(cfg.item_source),
+                market_cache=MarketCache(cfg.market_cache_dir) if cfg.market_cache_dir else None,
+            )
+            episode.setup()
+            episode.time_scale = self.time_scale
+            self._episode = episode
+        except BaseException as exc:  # re-raised on the main thread by `episode`
+            self._episode_error = exc
+
+    @property
+    def episode(self):
+        if self._episode is None:
+            if self._episode_thread.is_alive():
+                self._episode_thread.join()
+            elif self._episode_error is None:
+                self._setup_episode(*self._episode_args)
+            if self._episode_error is not None:
+                raise self._episode_error
+        return self._episode
+
+    @episode.setter
+    def episode(self, episode):
+        self._episode = episode
+
+    def _build_screen(self, phase: str):
+        module, class_name, takes_episode = SCREEN_CLASSES[phase]
+        screen_cls = getattr(importlib.import_module(module), class_name)
+        return screen_cls(self.cfg, self.episode) if takes_episode else screen_cls(self.cfg)
+
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             if self.phase.startswith("INTRO"):
@@ -72,26 +148,41 @@ class GameState:
                     return
             elif event.key == pygame.K_SPACE:
                 # Skip forward quickly
-                if not (isinstance(self.screen, AuctionScreen) and getattr(self.screen, "flow_state", "") == "summary"):
+                in_auction = self.phase in ("AUCTION_TEAM", "AUCTION_EXPERT")
+                if not (in_auction and getattr(self.screen, "flow_state", "") == "summary"):
                     self._advance_phase(force=True)
             elif event.key == pygame.K_f:
+                self.turbo = None
                 self._toggle_speed()
+            elif event.key == pygame.K_t:
+                self._toggle_turbo()
         self.screen.handle_event(event)
 
-    def update(self, dt: float):
+    def update(self, dt: float) -> float:
+        """Advance by `dt` wall seconds; returns the sim seconds simulated."""
         if self.phase.startswith("INTRO"):
-            return
+            return 0.0
 
-        dt *= self.time_scale
-        if self.phase == "MARKET":
-            self.market_time_left -= dt
-            self.episode.update_market_ai(dt, cfg=self.cfg)
-            self.screen.update(dt)
-            self.screen.set_time_left(self.market_time_left)
+        if self.turbo is None:
+            sim_dt = self._update_phase(dt * self.time_scale)
+        else:
+            sim_dt = self._update_turbo(dt)
+        self._track_sim_rate(sim_dt, dt)
+        return sim_dt
 
-            if self.market_time_left <= 0 or self._market_shopping_done():
-                self.market_time_left = min(self.market_time_left, 0)
-                self._enter_expert_handoff_phase()
+    def _update_phase(self, dt: float) -> float:
+        """Advance the current phase by `dt` sim seconds; returns the sim time
+        actually simulated (the market runs in whole fixed steps)."""
+        if self.phase == "MARKET":
+            market_screen = self.screen
+            steps = 0
+            for _ in range(self.market_clock.advance(dt)):
+                self._step_market(self.market_clock.step)
+                steps += 1
+                if self.phase != "MARKET":
+                    break
+            market_screen.set_interpolation(self.market_clock.alpha)
+            return steps * self.market_clock.step
 
         elif self.phase in ("EXPERT_HANDOFF", "EXPERT_SHOPPING"):
             self.screen.update(dt)
@@ -114,7 +205,74 @@ class GameState:
                 self._advance_phase()
 
         elif self.phase == "RESULTS":
-            pass
+            return 0.0
+        return dt
+
+    def _update_turbo(self, dt: float) -> float:
+        """Run as much sim as fits in the per-frame CPU budget."""
+        deadline = time.perf_counter() + self.cfg.turbo_cpu_budget_ms / 1000.0
+        instant = self.turbo == TURBO_INSTANT
+        start_phase = self.phase
+        simulated = 0.0
+
+        if self.phase == "MARKET":
+            clock = self.market_clock
+            due = math.inf if instant else clock.advance(dt * self.turbo, max_steps=2**31)
+            market_screen = self.screen
+            steps = 0
+            while steps < due and self.phase == "MARKET":
+                self._step_market(clock.step)
+                steps += 1
+                if time.perf_counter() >= deadline:
+                    break
+            if steps < due and not instant:
+                # Over budget: the rest of this frame's sim time is skipped,
+                # which shows up as a lower achieved rate in the HUD.
+                clock.dropped += (due - steps) * clock.step
+            market_screen.set_interpolation(1.0)
+            simulated = steps * clock.step
+        elif instant:
+            while self.phase == start_phase and self.phase != "RESULTS":
+                simulated += self._update_phase(INSTANT_PHASE_STEP)
+                if time.perf_counter() >= deadline:
+                    break
+        else:
+            simulated = self._update_phase(dt * self.turbo)
+
+        if instant and self.phase != start_phase:
+            self.turbo = None
+        return simulated
+
+    def _toggle_turbo(self):
+        if self.turbo not in TURBO_MODES:
+            self.turbo = TURBO_MODES[0]
+        else:
+            idx = TURBO_MODES.index(self.turbo)
+            self.turbo = TURBO_MODES[idx + 1] if idx + 1 < len(TURBO_MODES) else None
+        self.market_clock.reset()
+
+    def _track_sim_rate(self, sim_dt: float, wall_dt: float):
+        self._rate_sim += sim_dt
+        self._rate_wall += wall_dt
+        if self._rate_wall >= SIM_RATE_WINDOW:
+            self.sim_rate = self._rate_sim / self._rate_wall
+            self._rate_sim = self._rate_wall = 0.0
+
+    def should_render(self) -> bool:
+        """Whether this frame should be drawn; turbo modes throttle redraws."""
+        if self.turbo is None or self.phase != self._rendered_phase:
+            return True
+        return time.perf_counter() - self._last_render_at >= 1.0 / self.cfg.turbo_render_fps
+
+    def _step_market(self, dt: float):
+        self.market_time_left -= dt
+        self.episode.update_market_ai(dt, cfg=self.cfg)
+        self.screen.update(dt)
+        self.screen.set_time_left(self.market_time_left)
+
+        if self.market_time_left <= 0 or self._market_shopping_done():
+            self.market_time_left = min(self.market_time_left, 0)
+            self._enter_expert_handoff_phase()
 
     def _advance_phase(self, force=False):
         if self.phase.startswith("INTRO"):
@@ -181,8 +339,14 @@ class GameState:
         self.episode.time_scale = self.time_scale
 
     def render(self, screen):
-        self.episode.time_scale = self.time_scale
-        self.screen.render(screen)
+        # The intro's first card does not need the episode, so don't wait on it.
+        if self._episode is not None:
+            self._episode.time_scale = self.time_scale
+        self.screen.turbo = self.turbo
+        self.screen.sim_rate = self.sim_rate
+        self._last_render_at = time.perf_counter()
+        self._rendered_phase = self.phase
+        return self.screen.render(screen)
 
     def _advance_intro_sequence(self):
         intro_flow = ["INTRO_HOST", "INTRO_CONTESTANTS", "INTRO_EXPERTS", "INTRO_MARKET"]
@@ -30,6 +30,17 @@ def parse_args():
         action="store_true",
         help="Regenerate the expert roster file (dev-only)",
     )
+    parser.add_argument(
+        "--playback",
+        action="store_true",
+        help="Simulate the episode first, then play it back with pause, seek and rewind",
+    )
+    parser.add_argument(
+        "--bidders",
+        type=int,
+        default=None,
+        help="Bidders per auction lot for the ascending-bid model (default: the balance config's, 0 is the classic sale)",
+    )
     return parser.parse_args()
 
 
@@ -42,4 +53,6 @@ if __name__ == "__main__":
         market_seconds=market_seconds,
         item_source=args.item_source,
         regen_experts=args.regen_experts,
+        playback=args.playback,
+        bidders=args.bidders,
     )
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+from models.bidding import BidderRoom, LotResult
 from sim.balance_config import BalanceConfig
 
+_default_config: BalanceConfig | None = None
+
+
+def _defaults() -> BalanceConfig:
+    """The default config, built once for callers that pass none; it is
+    only ever read here."""
+    global _default_config
+    if _default_config is None:
+        _default_config = BalanceConfig()
+    return _default_config
+
 
 class AuctionHouse:
-    def __init__(self, demand_by_category: dict, mood: str = "mixed"):
+    def __init__(self, demand_by_category: dict, mood: str = "mixed", bidders: int = 0):
         self.demand_by_category = demand_by_category
         self.mood = mood
+        # Bidders per lot; with any, lots resolve through a BidderRoom.
+        self.bidders = bidders
 
     @classmethod
-    def generate(cls, rng, cfg: BalanceConfig | None = None):
-        cfg = cfg or BalanceConfig()
+    def generate(cls, rng, cfg: BalanceConfig | None = None, bidders: int | None = None):
+        cfg = cfg or _defaults()
         ah_cfg = cfg.auction_house
         # Demand multipliers by category (episode-level)
         cats = ah_cfg.categories
@@ -30,23 +44,77 @@ class AuctionHouse:
                     break
         else:
             mood = "mixed"
-        return cls(demand_by_category=demand, mood=mood)
+        return cls(
+            demand_by_category=demand,
+            mood=mood,
+            bidders=ah_cfg.bidders if bidders is None else bidders,
+        )
 
-    def sell(self, item, rng, cfg: BalanceConfig | None = None) -> float:
-        cfg = cfg or BalanceConfig()
+    def _sale_terms(self, cfg: BalanceConfig):
         ah_cfg = cfg.auction_house
+        mood_tuning = ah_cfg.moods.get(self.mood, ah_cfg.moods.get("mixed"))
+        clamp_hi = ah_cfg.clamp_multiplier
+        return ah_cfg, mood_tuning.multiplier, mood_tuning.sigma, 1.0 / clamp_hi, clamp_hi
 
+    def _multiplier(self, item, ah_cfg, mood_mult: float) -> float:
+        """Demand, condition and mood, before any noise."""
         demand = self.demand_by_category.get(item.category, 1.0)
         condition_mult = ah_cfg.condition_base + ah_cfg.condition_scale * item.condition
+        return demand * condition_mult * mood_mult
 
-        mood_tuning = ah_cfg.moods.get(self.mood, ah_cfg.moods.get("mixed"))
-        mood_mult = mood_tuning.multiplier
-        sigma = mood_tuning.sigma
-
-        noise = rng.lognormal(0.0, sigma)
-        multiplier = demand * condition_mult * mood_mult * noise
-        clamp_hi = ah_cfg.clamp_multiplier
-        clamp_lo = 1.0 / clamp_hi
+    def _price(self, item, noise: float, ah_cfg, mood_mult: float, clamp_lo: float, clamp_hi: float) -> float:
+        multiplier = self._multiplier(item, ah_cfg, mood_mult) * noise
         multiplier = max(clamp_lo, min(multiplier, clamp_hi))
         price = max(1.0, item.true_value * multiplier)
         return float(round(price, 2))
+
+    def sell(self, item, rng, cfg: BalanceConfig | None = None) -> float:
+        if self.bidders:
+            return self.open_room(item, rng, cfg).sealed().price
+        ah_cfg, mood_mult, sigma, clamp_lo, clamp_hi = self._sale_terms(cfg or _defaults())
+        noise = rng.lognormal(0.0, sigma)
+        return self._price(item, noise, ah_cfg, mood_mult, clamp_lo, clamp_hi)
+
+    def open_room(self, item, rng, cfg: BalanceConfig | None = None) -> BidderRoom:
+        """The bidder room for one lot. Every bidder values it from the same
+        demand, condition and mood multiplier as a single-draw sale, with
+        their own noise at the mood's sigma. The valuations come from a seed
+        drawn here, so every lot takes exactly one draw from `rng` whatever
+        the room size."""
+        ah_cfg, mood_mult, sigma, clamp_lo, clamp_hi = self._sale_terms(cfg or _defaults())
+        seed = rng.randint(0, 2**31 - 1)
+        return BidderRoom.draw(
+            item.true_value,
+            self._multiplier(item, ah_cfg, mood_mult),
+            sigma,
+            self.bidders,
+            ah_cfg.opening_ratio,
+            seed,
+            (clamp_lo, clamp_hi),
+        )
+
+    def auction(self, item, rng, cfg: BalanceConfig | None = None, max_steps: int | None = None) -> LotResult:
+        """Resolve one lot by ascending bids, for showing them. The price is
+        the one `sell` returns for the same RNG state."""
+        return self.open_room(item, rng, cfg).ascending(max_steps)
+
+    def sell_many(self, items, rng, cfg: BalanceConfig | None = None, *, assign: bool = True) -> list[float]:
+        """Sell `items` in order, setting each `auction_price` in place
+        (unless `assign` is False).
+
+        Config and mood are resolved once and the noise is drawn in one
+        batch; every lot shares the mood's sigma, so the draws (and prices)
+        are exactly those of calling `sell` on each item in turn. Bidder
+        rooms resolve lot by lot (sealed), also matching `sell`.
+        """
+        cfg = cfg or _defaults()
+        if self.bidders:
+            prices = [self.sell(item, rng, cfg) for item in items]
+        else:
+            ah_cfg, mood_mult, sigma, clamp_lo, clamp_hi = self._sale_terms(cfg)
+            noises = rng.lognormal_many(len(items), 0.0, sigma)
+            prices = [self._price(item, noise, ah_cfg, mood_mult, clamp_lo, clamp_hi) for item, noise in zip(items, noises)]
+        if assign:
+            for item, price in zip(items, prices):
+                item.auction_price = price
+        return prices
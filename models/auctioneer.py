@@ -16,14 +16,32 @@ class Auctioneer:
         self.accuracy = accuracy
         self.bias = bias or {}
 
-    def appraise(self, item, rng, cfg: BalanceConfig | None = None) -> float:
-        cfg = cfg or BalanceConfig()
+    def _noise_sigma(self, cfg: BalanceConfig) -> float:
         auctioneer_cfg = cfg.auctioneer
         accuracy = self.accuracy if self.accuracy is not None else auctioneer_cfg.default_accuracy
-
         # Higher accuracy means a tighter distribution around the true value.
-        noise_sigma = max(auctioneer_cfg.sigma_floor, (1.0 - accuracy) * auctioneer_cfg.sigma_scale)
-        est = item.true_value * rng.lognormal(0.0, noise_sigma)
-        est *= self.bias.get(item.category, auctioneer_cfg.bias_by_category.get(item.category, 1.0))
+        return max(auctioneer_cfg.sigma_floor, (1.0 - accuracy) * auctioneer_cfg.sigma_scale)
+
+    def _estimate(self, item, noise: float, cfg: BalanceConfig) -> float:
+        est = item.true_value * noise
+        est *= self.bias.get(item.category, cfg.auctioneer.bias_by_category.get(item.category, 1.0))
         est = clamp_appraisal(est, item, cfg)
         return float(round(est, 2))
+
+    def appraise(self, item, rng, cfg: BalanceConfig | None = None) -> float:
+        cfg = cfg or BalanceConfig()
+        return self._estimate(item, rng.lognormal(0.0, self._noise_sigma(cfg)), cfg)
+
+    def appraise_many(self, items, rng, cfg: BalanceConfig | None = None) -> list[float]:
+        """Appraise `items` in order, setting each `appraised_value` in place.
+
+        Draws the same noise, in the same order, as calling `appraise` on
+        each item, so batch and per-item appraisals agree exactly.
+        """
+        cfg = cfg or BalanceConfig()
+        noises = rng.lognormal_many(len(items), 0.0, self._noise_sigma(cfg))
+        values = []
+        for item, noise in zip(items, noises):
+            item.appraised_value = self._estimate(item, noise, cfg)
+            values.append(item.appraised_value)
+        return values
@@ -0,0 +1,140 @@
+"""Ascending-bid auctions resolved over a room of private-valuation bidders.
+
+Each lot gets a room of bidders with independent private valuations: the
+item's value scaled by category demand, condition and the auction-house
+mood, times each bidder's own lognormal noise. Bidding is proxy-style on an
+increment ladder: a
+challenger raises to one increment above the current leader's valuation,
+capped at their own, so every shown bid changes the leader and the hammer
+falls at the runner-up's valuation plus one increment.
+
+Only the strongest bidders can ever lead, so `ascending` heapifies the
+room once and pops the top k contenders, O(n + k log n) for k bid steps.
+`sealed` is the fast path for headless runs: it reads the top two
+valuations and returns the same hammer price without any bid steps.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import random
+from dataclasses import dataclass, field
+
+# (price below, increment); prices at or above the last limit use TOP_INCREMENT.
+INCREMENT_LADDER = (
+    (20.0, 1.0),
+    (100.0, 5.0),
+    (500.0, 10.0),
+    (1000.0, 25.0),
+    (5000.0, 50.0),
+)
+TOP_INCREMENT = 100.0
+
+BIDDER_CHANNELS = (
+    "Gallery rep",
+    "Local dealer",
+    "Phone bidder",
+    "Online proxy",
+    "Vintage scout",
+    "Museum intern",
+)
+
+
+def bid_increment(price: float) -> float:
+    for limit, step in INCREMENT_LADDER:
+        if price < limit:
+            return step
+    return TOP_INCREMENT
+
+
+def bidder_name(bidder: int) -> str:
+    return f"{BIDDER_CHANNELS[bidder % len(BIDDER_CHANNELS)]} #{bidder + 1}"
+
+
+@dataclass(frozen=True)
+class Bid:
+    bidder: int
+    amount: float
+
+    @property
+    def name(self) -> str:
+        return bidder_name(self.bidder)
+
+
+@dataclass
+class LotResult:
+    price: float
+    winner: int
+    bidders: int
+    # Empty for sealed-bid resolution.
+    bids: list[Bid] = field(default_factory=list)
+
+
+class BidderRoom:
+    def __init__(self, valuations: list[float], opening: float):
+        self.valuations = valuations
+        # Someone must be willing to open, or the lot would never sell.
+        self.opening = min(opening, max(valuations))
+
+    @classmethod
+    def draw(
+        cls,
+        value: float,
+        multiplier: float,
+        sigma: float,
+        bidders: int,
+        opening_ratio: float,
+        seed: int,
+        clamp: tuple[float, float] = (0.0, math.inf),
+    ) -> "BidderRoom":
+        """A room of `bidders` private valuations, each `value` times
+        `multiplier` times the bidder's own lognormal(0, `sigma`) noise, with
+        the combined multiplier clamped to `clamp`. Bidding opens at
+        `opening_ratio` of `value * multiplier`. Valuations come from their
+        own stream seeded by `seed`, so the room size never changes the
+        caller's RNG."""
+        lo, hi = clamp
+        noise = random.Random(seed).lognormvariate
+        valuations = [
+            max(1.0, value * max(lo, min(multiplier * noise(0.0, sigma), hi))) for _ in range(max(1, bidders))
+        ]
+        return cls(valuations, value * multiplier * opening_ratio)
+
+    def _hammer(self, top: float, second: float | None) -> float:
+        if second is None or second < self.opening:
+            price = self.opening
+        else:
+            price = min(top, second + bid_increment(second))
+        return float(round(max(1.0, price), 2))
+
+    def sealed(self) -> LotResult:
+        """Second-price resolution: same price and winner as `ascending`."""
+        vals = self.valuations
+        top = heapq.nlargest(2, range(len(vals)), key=vals.__getitem__)
+        second = vals[top[1]] if len(top) > 1 else None
+        return LotResult(self._hammer(vals[top[0]], second), top[0], len(vals))
+
+    def ascending(self, max_steps: int | None = None) -> LotResult:
+        """Play the bidding out. Only the strongest `max_steps` contenders
+        are shown; the weakest of them opens."""
+        vals = self.valuations
+        heap = [(-v, i) for i, v in enumerate(vals) if v >= self.opening]
+        heapq.heapify(heap)
+        k = len(heap) if max_steps is None else max(1, min(max_steps, len(heap)))
+        # The runner-up sets the price even when only the winner is shown.
+        contenders = [heapq.heappop(heap) for _ in range(min(len(heap), max(k, 2)))]
+        shown = contenders[:k]
+
+        neg_v, leader = shown[-1]
+        amount = self.opening
+        bids = [Bid(leader, float(round(max(1.0, amount), 2)))]
+        for neg_c, challenger in reversed(shown[:-1]):
+            lead_v = -neg_v
+            amount = max(amount, min(-neg_c, lead_v + bid_increment(lead_v)))
+            bids.append(Bid(challenger, float(round(max(1.0, amount), 2))))
+            neg_v, leader = neg_c, challenger
+        second = -contenders[1][0] if len(contenders) > 1 else None
+        price = self._hammer(-contenders[0][0], second)
+        bids[-1] = Bid(leader, price)
+        return LotResult(price, leader, len(vals), bids)
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import copy
+import pickle
 from dataclasses import dataclass
 from constants import (
     TEAM_A,
@@ -17,6 +19,11 @@ from models.item import Item
 from models.expert import ExpertProfile
 from models.auctioneer import Auctioneer
 from models.auction_house import AuctionHouse
+from sim.balance_config import BalanceConfig
+from sim.item_factory import ItemFactory
+from sim.market_cache import MarketCache
+from sim.episode_events import EpisodeListener
+from sim.state_hash import StateHasher
 from sim.pricing import negotiate
 from sim.scoring import compute_team_totals, golden_gavel
 from ai.strategy_value import ValueHunterStrategy
@@ -32,6 +39,31 @@ class AuctionLot:
     team_total: int
     is_bonus: bool
 
+@dataclass
+class ExpertPickDecision:
+    include: bool
+    score: float
+    performance: float
+    rapport: float
+    liking: float
+    expert_margin: float
+
+
+@dataclass(frozen=True)
+class EpisodeSnapshot:
+    """An episode's mutable state, pickled (see Episode.snapshot)."""
+    data: bytes
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+
+# Left out of snapshots: read-only inputs every fork can share, and the
+# recorder and hasher, which belong to the run that attached them.
+_SNAPSHOT_SHARED = ("cfg", "balance", "item_factory", "market_cache", "recorder", "hasher")
+
+
 @dataclass
 class Host:
     x: float
@@ -50,15 +82,30 @@ class Episode:
     starting_budget: float
     expert_min_budget: float = 1.0
     cfg: GameConfig | None = None
+    # Economy tuning for markets and sales; defaults to BalanceConfig().
+    balance: BalanceConfig | None = None
     time_scale: float = 1.0
     host: Host | None = None
+    item_factory: ItemFactory | None = None
+    market_cache: MarketCache | None = None
+    # Optional event listener (see sim/episode_events.py), e.g. the binary
+    # event log's EpisodeRecorder, attached before setup.
+    recorder: EpisodeListener | None = None
+    # Optional per-tick state hasher (see sim/state_hash.py), attached after setup.
+    hasher: StateHasher | None = None
 
     def setup(self):
         self.cfg = self.cfg or GameConfig()
         cfg = self.cfg
+        self.balance = self.balance or BalanceConfig()
         self.rng = RNG(self.seed)
-        self.market = Market.generate(self.rng, self.play_rect)
-        self.auction_house = AuctionHouse.generate(self.rng)
+        if self.market_cache is not None:
+            self.market = self.market_cache.generate(
+                self.rng, self.play_rect, factory=self.item_factory, cfg=self.balance
+            )
+        else:
+            self.market = Market.generate(self.rng, self.play_rect, factory=self.item_factory, cfg=self.balance)
+        self.auction_house = AuctionHouse.generate(self.rng, cfg=self.balance, bidders=cfg.auction_bidders)
         self.auctioneer = Auctioneer("Chloe", accuracy=0.83, bias={"silverware": 1.05})
 
         # Experts
@@ -128,6 +175,58 @@ class Episode:
         self.auction_stage = "team"
         self.auction_label = "Team items first"
         self.last_sold = None
+        if self.recorder is not None:
+            self.recorder.begin(self)
+
+    def snapshot(self) -> EpisodeSnapshot:
+        """Capture teams, market stock, RNG state, host and auction progress.
+
+        The snapshot is immutable bytes, so one can be kept around and
+        restored or forked any number of times (and sent to worker
+        processes) without copying the live object graph.
+        """
+        state = {k: v for k, v in self.__dict__.items() if k not in _SNAPSHOT_SHARED}
+        return EpisodeSnapshot(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def restore(self, snapshot: EpisodeSnapshot):
+        """Return this episode to the state captured in `snapshot`."""
+        state = pickle.loads(snapshot.data)
+        # Drop attributes set after the snapshot was taken (e.g. results).
+        for key in [k for k in self.__dict__ if k not in state and k not in _SNAPSHOT_SHARED]:
+            del self.__dict__[key]
+        self.__dict__.update(state)
+
+    def fork(self, snapshot: EpisodeSnapshot | None = None) -> "Episode":
+        """A new, independent episode in the state of `snapshot` (default:
+        now), sharing this one's config and item factory but not its
+        recorder or hasher."""
+        snapshot = snapshot or self.snapshot()
+        other = copy.copy(self)
+        other.recorder = None
+        other.hasher = None
+        other.restore(snapshot)
+        return other
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: EpisodeSnapshot,
+        cfg: GameConfig | None = None,
+        item_factory: ItemFactory | None = None,
+        balance: BalanceConfig | None = None,
+    ) -> "Episode":
+        """Rebuild an episode from a snapshot alone, e.g. in a worker process."""
+        episode = cls.__new__(cls)
+        episode.__dict__.update(
+            cfg=cfg or GameConfig(),
+            balance=balance or BalanceConfig(),
+            item_factory=item_factory,
+            market_cache=None,
+            recorder=None,
+            hasher=None,
+        )
+        episode.restore(snapshot)
+        return episode
 
     def update_market_ai(
         self,
@@ -211,6 +310,11 @@ class Episode:
 
             self._update_member_positions(team, dt, paced_speed)
 
+        if self.recorder is not None:
+            self.recorder.tick(self, dt)
+        if self.hasher is not None:
+            self.hasher.tick(self)
+
     def update_host(self, dt: float, cfg: GameConfig | None = None):
         cfg = cfg or self.cfg or GameConfig()
         if not self.host or self.host.state == "GONE":
@@ -501,6 +605,7 @@ class Episode:
     def _complete_purchase(self, team, target, item):
         # negotiate (expert helps)
         neg_bonus = team.negotiation_bonus(team.expert.negotiation_bonus)
+        listed = item.shop_price
         did, disc = negotiate(
             item,
             self.rng,
@@ -508,23 +613,36 @@ class Episode:
             target.discount_min,
             target.discount_max,
             expert_bonus=neg_bonus,
+            cfg=self.balance,
         )
         item.was_negotiated = did
+        self.buy(team, target, item, listed, disc)
+
+    def buy(self, team, stall, item, listed: float | None = None, discount: float = 0.0) -> bool:
+        """Move `item` from `stall` to `team` at its current shop price.
+
+        Refuses (returning False) if the team cannot afford it or the buy
+        would eat into the `expert_min_budget` reserve. `listed` is the price
+        before any negotiated `discount`, for the recorder.
+        """
         reserve_needed = self.expert_min_budget if team.team_item_count < self.items_per_team else 0.0
         if item.shop_price > team.budget_left:
             team.last_action = "Couldn't afford after negotiation"
-            return
+            return False
         remaining_after_buy = round(team.budget_left - item.shop_price, 2)
         if remaining_after_buy < reserve_needed:
             team.last_action = f"Need ${reserve_needed:0.0f} saved for expert"
-            team.stall_cooldowns[target.stall_id] = 2.5
+            team.stall_cooldowns[stall.stall_id] = 2.5
             team.target_stall_id = None
-            return
-        target.items.remove(item)
+            return False
+        self.market.remove_item(item)
         team.items_bought.append(item)
         team.budget_left = remaining_after_buy
-        neg_txt = f" (-{disc*100:.0f}%)" if did else ""
+        if self.recorder is not None:
+            self.recorder.purchase(team, stall, item, item.shop_price if listed is None else listed, discount)
+        neg_txt = f" (-{discount*100:.0f}%)" if item.was_negotiated else ""
         team.last_action = f"Bought: {item.name} ${item.shop_price:.0f}{neg_txt}"
+        return True
 
     def _move_towards(self, team, tx, ty, dt, speed):
         dx, dy = tx - team.x, ty - team.y
@@ -594,6 +712,10 @@ class Episode:
             team.expert_pick_item = None
             team.expert_pick_included = False if team.expert_pick_budget < self.expert_min_budget else None
             team.last_action = f"Reserved ${team.expert_pick_budget:0.0f} for expert"
+            if self.recorder is not None:
+                self.recorder.reserve(team)
+        if self.hasher is not None:
+            self.hasher.checkpoint(self, "expert budgets reserved")
 
     def prepare_expert_picks(self):
         """Hand the remaining budget to experts and let them shop within it."""
@@ -616,18 +738,61 @@ class Episode:
             else:
                 team.last_action = "Expert couldn't find an item"
             self.expert_purchase_events.append({"team": team, "item": pick, "budget": leftover})
-
-    def mark_expert_choice(self, team: Team, include: bool):
-        """Record whether a team wants to include their expert item in scoring."""
+            if self.recorder is not None:
+                self.recorder.expert_pick(team, pick)
+        if self.hasher is not None:
+            self.hasher.checkpoint(self, "expert picks")
+
+    def mark_expert_choice(self, team: Team, include: bool, score: float = 0.0):
+        """Record whether a team wants to include their expert item in scoring
+        (`score` is the decision score, if one was computed)."""
         if not team.expert_pick_item:
             team.expert_pick_included = False
             return
         team.expert_pick_included = include
+        if self.recorder is not None:
+            self.recorder.expert_choice(team, include, score)
+        if self.hasher is not None:
+            self.hasher.checkpoint(self, f"expert choice ({team.name})")
         if include:
             team.last_action = f"Including expert pick: {team.expert_pick_item.name}"
         else:
             team.last_action = "Declined the expert item"
 
+    def decide_expert_pick(self, team: Team) -> ExpertPickDecision:
+        """Score whether a team keeps its expert's pick, from how its items
+        sold, its trust in the expert, taste for the piece and the expert's
+        own estimate, plus a little noise."""
+        pick = team.expert_pick_item
+        perf = self._performance_signal(team)
+        rapport = self._rapport_signal(team)
+        liking = max(0.0, min(1.0, team.style_affinity(pick)))
+        est = pick.attributes.get("expert_estimate", pick.shop_price)
+        expert_margin = max(-0.5, min(0.8, (est - pick.shop_price) / max(1.0, pick.shop_price)))
+        noise = (self.rng.random() - 0.5) * 0.1
+
+        score = 0.35 * expert_margin + 0.25 * liking + 0.2 * rapport + 0.15 * perf + noise
+        return ExpertPickDecision(score >= 0.05, score, perf, rapport, liking, expert_margin)
+
+    @staticmethod
+    def _performance_signal(team: Team) -> float:
+        margins = []
+        for it in team.team_items:
+            if it.auction_price is None:
+                continue
+            margins.append((it.auction_price - it.shop_price) / max(1.0, it.shop_price))
+        if not margins:
+            return 0.0
+        avg_margin = sum(margins) / len(margins)
+        return max(-0.5, min(0.5, avg_margin))
+
+    @staticmethod
+    def _rapport_signal(team: Team) -> float:
+        # Confidence in the expert + track record of accuracy.
+        trust = (team.average_confidence - 0.5) * 0.6
+        expert_trust = (team.expert.appraisal_accuracy - 0.75) * 0.8
+        return max(-0.4, min(0.6, trust + expert_trust))
+
     def expert_choices_done(self) -> bool:
         for team in self.teams:
             if team.expert_pick_item and team.expert_pick_included is None:
@@ -638,13 +803,19 @@ class Episode:
         return any(team.expert_pick_included and team.expert_pick_item for team in self.teams)
 
     def start_appraisal(self):
-        # appraise all items (team items + expert pick candidate)
+        # appraise all items (team items + expert pick candidate) in one batch
+        held = []
         for team in self.teams:
-            for item in team.items_bought:
-                item.appraised_value = self.auctioneer.appraise(item, self.rng)
+            held.extend((team, item) for item in team.items_bought)
             if team.expert_pick_item:
-                team.expert_pick_item.appraised_value = self.auctioneer.appraise(team.expert_pick_item, self.rng)
+                held.append((team, team.expert_pick_item))
+        self.auctioneer.appraise_many([item for _, item in held], self.rng, self.balance)
+        if self.recorder is not None:
+            for team, item in held:
+                self.recorder.appraisal(team, item)
         self.appraisal_done = True
+        if self.hasher is not None:
+            self.hasher.checkpoint(self, "appraisal")
 
     def _reset_auction_state(self, lots, label: str, stage: str):
         self.auction_queue = lots
@@ -691,6 +862,10 @@ class Episode:
         """Record the result of an auction lot without advancing RNG twice."""
         lot.item.auction_price = sale_price
         self.last_sold = lot
+        if self.recorder is not None:
+            self.recorder.sale(self.auction_stage, lot, sale_price)
+        if self.hasher is not None:
+            self.hasher.checkpoint(self, f"sale of item {lot.item.item_id} (${sale_price:.2f})")
         self.auction_cursor += 1
         if self.auction_cursor >= len(self.auction_queue):
             self.auction_done = True
@@ -700,9 +875,24 @@ class Episode:
             self.auction_done = True
             return
         lot = self.auction_queue[self.auction_cursor]
-        sale_price = self.auction_house.sell(lot.item, self.rng)
+        sale_price = self.auction_house.sell(lot.item, self.rng, self.balance)
         self.finalize_auction_sale(lot, sale_price)
 
+    def sell_remaining_lots(self) -> list[tuple[AuctionLot, float]]:
+        """Sell every lot left in the current auction as one batch.
+
+        Prices match stepping through the lots one by one (and the auction
+        screen, which sells lot by lot), since no other draws interleave.
+        """
+        lots = self.auction_queue[self.auction_cursor:]
+        # finalize_auction_sale assigns each price, so hash checkpoints see
+        # the lots sold one at a time, as in the per-lot path.
+        prices = self.auction_house.sell_many([lot.item for lot in lots], self.rng, self.balance, assign=False)
+        for lot, price in zip(lots, prices):
+            self.finalize_auction_sale(lot, price)
+        self.auction_done = True
+        return list(zip(lots, prices))
+
     def compute_results(self):
         for team in self.teams:
             compute_team_totals(team)
@@ -710,3 +900,7 @@ class Episode:
         # winner by profit
         self.winner = max(self.teams, key=lambda t: t.profit)
         self.results_done = True
+        if self.recorder is not None:
+            self.recorder.results(self)
+        if self.hasher is not None:
+            self.hasher.checkpoint(self, "results")
@@ -1,27 +1,114 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+
+_ITEM_FIELDS = (
+    "item_id",
+    "name",
+    "category",
+    "era",
+    "condition",
+    "rarity",
+    "style_score",
+    "true_value",
+    "shop_price",
+    "appraised_value",
+    "auction_price",
+    "is_expert_pick",
+    "was_negotiated",
+    "description",
+    "image_path",
+)
 
 
-@dataclass
 class Item:
-    item_id: int
-    name: str
-    category: str
-    era: str
-    condition: float
-    rarity: float
-    style_score: float
-    true_value: float
-    shop_price: float
-
-    appraised_value: float = 0.0
-    auction_price: float = 0.0
-    is_expert_pick: bool = False
-    was_negotiated: bool = False
-    description: str = ""
-    image_path: str | None = None
-    attributes: dict[str, str] = field(default_factory=dict)
+    """A single lot in the market.
+
+    Items are slotted: large markets and headless runs create many of them, so
+    there is no per-instance ``__dict__``. ``attributes`` is copy-on-write —
+    items instantiated from a template share the template's dict and only take
+    a private copy the first time the mapping is touched, which most items
+    never are.
+    """
+
+    __slots__ = _ITEM_FIELDS + ("_attributes", "_attributes_shared")
+
+    def __init__(
+        self,
+        item_id: int,
+        name: str,
+        category: str,
+        era: str,
+        condition: float,
+        rarity: float,
+        style_score: float,
+        true_value: float,
+        shop_price: float,
+        appraised_value: float = 0.0,
+        auction_price: float = 0.0,
+        is_expert_pick: bool = False,
+        was_negotiated: bool = False,
+        description: str = "",
+        image_path: str | None = None,
+        attributes: dict[str, str] | None = None,
+        *,
+        share_attributes: bool = False,
+    ):
+        self.item_id = item_id
+        self.name = name
+        self.category = category
+        self.era = era
+        self.condition = condition
+        self.rarity = rarity
+        self.style_score = style_score
+        self.true_value = true_value
+        self.shop_price = shop_price
+        self.appraised_value = appraised_value
+        self.auction_price = auction_price
+        self.is_expert_pick = is_expert_pick
+        self.was_negotiated = was_negotiated
+        self.description = description
+        self.image_path = image_path
+        # With share_attributes the dict is borrowed (e.g. from an
+        # ItemTemplate) and copied on first access instead of up front.
+        self._attributes = attributes if attributes is not None else {}
+        self._attributes_shared = share_attributes and attributes is not None
+
+    @property
+    def attributes(self) -> dict[str, str]:
+        if self._attributes_shared:
+            self._attributes = dict(self._attributes)
+            self._attributes_shared = False
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, value: dict[str, str]):
+        self._attributes = value
+        self._attributes_shared = False
 
     @property
     def profit(self) -> float:
         return self.auction_price - self.shop_price
+
+    def _field_values(self) -> tuple:
+        return tuple(getattr(self, name) for name in _ITEM_FIELDS) + (self._attributes,)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._field_values() == other._field_values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in _ITEM_FIELDS)
+        return f"Item({fields}, attributes={self._attributes!r})"
+
+    def __getstate__(self):
+        # Keep the shared flag so items pickled together still share (and
+        # copy-on-write) a single template dict after unpickling.
+        return self._field_values() + (self._attributes_shared,)
+
+    def __setstate__(self, state):
+        for name, value in zip(_ITEM_FIELDS, state):
+            setattr(self, name, value)
+        self._attributes = state[-2]
+        self._attributes_shared = state[-1]
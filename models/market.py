@@ -11,7 +11,7 @@ class Market:
     _next_item_id: int = 1
 
     @classmethod
-    def generate(cls, rng, play_rect):
+    def generate(cls, rng, play_rect, factory=None, cfg=None):
         x0,y0,w,h = play_rect
         stalls = []
         styles = ["fair", "overpriced", "chaotic"]
@@ -55,9 +55,12 @@ class Market:
         for st in m.stalls:
             n = rng.randint(6, 10)
             for _ in range(n):
-                it = make_item(rng, m._next_item_id)
+                if factory is not None:
+                    it = factory.make_item(rng, m._next_item_id)
+                else:
+                    it = make_item(rng, m._next_item_id)
                 m._next_item_id += 1
-                set_shop_price(it, rng, st.pricing_style)
+                set_shop_price(it, rng, st.pricing_style, cfg=cfg)
                 st.items.append(it)
         return m
 
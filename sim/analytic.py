@@ -0,0 +1,403 @@
+"""Closed-form sale and appraisal distributions, without simulating.
+
+A hammer price from `AuctionHouse.sell` is
+
+    max(1, true_value * clamp(demand * condition_mult * mood_mult * L, 1/c, c))
+
+with ln L ~ N(0, sigma_mood). The price floor folds into the lower clamp, so
+the price is a scaled, clamped lognormal (`ClampedLognormal`). Its moments
+and CDF are closed-form (partial lognormal moments plus the two atoms at the
+clamps). Appraisals from `Auctioneer.appraise` have the same shape. Before
+the auction house is drawn, the price is a finite mixture over moods and a
+quadrature over each category's uniform demand (`sale_components`).
+
+`item_outlook` gives the expected price, variance, expected profit and
+P(loss) for one item in microseconds. `team_profit_distribution` convolves
+a team's items on a money grid. It conditions on the mood and on each
+category's demand, so items that share a category stay correlated the way
+they are in a real episode. `validate_against_monte_carlo` checks both
+against the simulation engine.
+
+Hammer prices are rounded to cents and the analytic model does not round;
+the difference is below a cent. Only the single-draw sale is modelled.
+Bidder rooms (`AuctionHouse.bidders`) have no closed form here.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Iterable, Sequence
+
+from sim.balance_config import BalanceConfig
+
+_PHI = NormalDist().cdf
+
+# Midpoint nodes used to integrate over a category's uniform demand draw.
+DEMAND_NODES = 8
+# Bins per team grid when no step is given.
+GRID_BINS = 200
+_TRIM = 1e-15
+
+
+@dataclass(frozen=True)
+class ClampedLognormal:
+    """scale * clamp(k * L, lo, hi), with ln L ~ N(0, sigma^2)."""
+
+    scale: float
+    k: float
+    sigma: float
+    lo: float
+    hi: float
+
+    @classmethod
+    def point(cls, value: float) -> "ClampedLognormal":
+        """A point mass at `value` (lo == hi, so the lognormal never shows)."""
+        return cls(value, 1.0, 1.0, 1.0, 1.0)
+
+    def _partial(self, n: int) -> float:
+        # E[clamp(kL, lo, hi)^n]: the two atoms plus the partial moment between.
+        mu, s = math.log(self.k), self.sigma
+        za = (math.log(self.lo) - mu) / s
+        zb = (math.log(self.hi) - mu) / s
+        inside = self.k**n * math.exp(0.5 * (n * s) ** 2) * (_PHI(zb - n * s) - _PHI(za - n * s))
+        return self.lo**n * _PHI(za) + self.hi**n * (1.0 - _PHI(zb)) + inside
+
+    def mean(self) -> float:
+        return self.scale * self._partial(1)
+
+    def second_moment(self) -> float:
+        return self.scale**2 * self._partial(2)
+
+    def variance(self) -> float:
+        return max(0.0, self.second_moment() - self.mean() ** 2)
+
+    def cdf(self, x: float) -> float:
+        """P(value <= x)."""
+        y = x / self.scale
+        if y < self.lo:
+            return 0.0
+        if y >= self.hi:
+            return 1.0
+        return _PHI((math.log(y) - math.log(self.k)) / self.sigma)
+
+    @property
+    def low(self) -> float:
+        return self.scale * self.lo
+
+    @property
+    def high(self) -> float:
+        return self.scale * self.hi
+
+
+Mixture = list[tuple[float, ClampedLognormal]]
+
+
+@dataclass(frozen=True)
+class ItemOutlook:
+    expected_price: float
+    variance: float
+    paid: float
+    p_loss: float
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def expected_profit(self) -> float:
+        return self.expected_price - self.paid
+
+
+def _check_single_draw(cfg: BalanceConfig, house) -> None:
+    bidders = house.bidders if house is not None else cfg.auction_house.bidders
+    if bidders:
+        raise ValueError("analytic sale distributions model the single-draw sale, not bidder rooms")
+
+
+def mood_weights(cfg: BalanceConfig) -> list[tuple[float, str]]:
+    """Mood probabilities as AuctionHouse.generate draws them."""
+    weights = cfg.auction_house.mood_probs
+    total = sum(weights.values())
+    if total <= 0:
+        return [(1.0, "mixed")]
+    return [(w / total, name) for name, w in weights.items() if w > 0]
+
+
+def demand_nodes(cfg: BalanceConfig, category: str) -> list[tuple[float, float]]:
+    """(weight, demand) quadrature for a category's demand draw; categories
+    the auction house does not price sell at demand 1."""
+    if category not in cfg.auction_house.categories:
+        return [(1.0, 1.0)]
+    lo, hi = cfg.auction_house.demand_range
+    width = (hi - lo) / DEMAND_NODES
+    return [(1.0 / DEMAND_NODES, lo + width * (i + 0.5)) for i in range(DEMAND_NODES)]
+
+
+def _sale_law(item, demand: float, mood: str, cfg: BalanceConfig) -> ClampedLognormal:
+    ah = cfg.auction_house
+    tuning = ah.moods.get(mood, ah.moods.get("mixed"))
+    condition_mult = ah.condition_base + ah.condition_scale * item.condition
+    clamp_hi = ah.clamp_multiplier
+    scale = item.true_value
+    if scale * clamp_hi <= 1.0:
+        # Even the top clamp is under the price floor: it always sells at 1.0.
+        return ClampedLognormal.point(1.0)
+    # The 1.0 price floor is a lower clamp on the multiplier.
+    lo = max(1.0 / clamp_hi, 1.0 / scale)
+    return ClampedLognormal(scale, demand * condition_mult * tuning.multiplier, tuning.sigma, lo, clamp_hi)
+
+
+def sale_components(item, cfg: BalanceConfig | None = None, house=None) -> Mixture:
+    """The hammer price of `item` as a weighted mixture of clamped
+    lognormals: exact for a given `house`, otherwise over its draw."""
+    cfg = cfg or BalanceConfig()
+    _check_single_draw(cfg, house)
+    if house is not None:
+        demand = house.demand_by_category.get(item.category, 1.0)
+        return [(1.0, _sale_law(item, demand, house.mood, cfg))]
+    return [
+        (mw * dw, _sale_law(item, demand, mood, cfg))
+        for mw, mood in mood_weights(cfg)
+        for dw, demand in demand_nodes(cfg, item.category)
+    ]
+
+
+def mixture_cdf(components: Mixture, x: float) -> float:
+    return sum(w * law.cdf(x) for w, law in components)
+
+
+def item_outlook(item, cfg: BalanceConfig | None = None, house=None, paid: float | None = None) -> ItemOutlook:
+    """Expected hammer price, its variance and P(price < paid) for one item
+    (`paid` defaults to its shop price)."""
+    components = sale_components(item, cfg, house)
+    paid = item.shop_price if paid is None else paid
+    mean = sum(w * law.mean() for w, law in components)
+    second = sum(w * law.second_moment() for w, law in components)
+    # P(price < paid): the CDF just below `paid`, so an atom at paid is not a loss.
+    p_loss = mixture_cdf(components, math.nextafter(paid, -math.inf))
+    return ItemOutlook(mean, max(0.0, second - mean * mean), paid, p_loss)
+
+
+def appraisal_distribution(item, auctioneer, cfg: BalanceConfig | None = None) -> ClampedLognormal:
+    """The law of `auctioneer.appraise(item, ...)`."""
+    cfg = cfg or BalanceConfig()
+    a_cfg = cfg.auctioneer
+    accuracy = auctioneer.accuracy if auctioneer.accuracy is not None else a_cfg.default_accuracy
+    sigma = max(a_cfg.sigma_floor, (1.0 - accuracy) * a_cfg.sigma_scale)
+    bias = auctioneer.bias.get(item.category, a_cfg.bias_by_category.get(item.category, 1.0))
+    scale = item.true_value
+    cap = max(scale, 1.0) * a_cfg.appraisal_ratio_cap
+    if scale <= 0 or cap <= 1.0:
+        # clamp_appraisal's 1.0 floor wins over its cap: always 1.0.
+        return ClampedLognormal.point(1.0)
+    return ClampedLognormal(scale, bias, sigma, 1.0 / scale, cap / scale)
+
+
+@dataclass
+class ProfitGrid:
+    """A probability mass function on the lattice `(offset + j) * step`."""
+
+    offset: int
+    step: float
+    probs: list[float]
+
+    def values(self) -> Iterable[tuple[float, float]]:
+        for j, p in enumerate(self.probs):
+            yield (self.offset + j) * self.step, p
+
+    def mean(self) -> float:
+        return sum(v * p for v, p in self.values())
+
+    def variance(self) -> float:
+        mu = self.mean()
+        return sum((v - mu) ** 2 * p for v, p in self.values())
+
+    def std(self) -> float:
+        return math.sqrt(self.variance())
+
+    def cdf(self, x: float) -> float:
+        return sum(p for v, p in self.values() if v <= x)
+
+    def prob_loss(self) -> float:
+        """P(profit < 0); the bin centred on zero straddles it and counts half."""
+        total = 0.0
+        for v, p in self.values():
+            if v < -0.5 * self.step:
+                total += p
+            elif v < 0.5 * self.step:
+                total += 0.5 * p
+        return total
+
+    def quantile(self, q: float) -> float:
+        acc = 0.0
+        for v, p in self.values():
+            acc += p
+            if acc >= q:
+                return v
+        return (self.offset + len(self.probs) - 1) * self.step
+
+    def convolve(self, other: "ProfitGrid") -> "ProfitGrid":
+        out = [0.0] * (len(self.probs) + len(other.probs) - 1)
+        theirs = other.probs
+        for i, p in enumerate(self.probs):
+            if p < _TRIM:
+                continue
+            for j, q in enumerate(theirs):
+                out[i + j] += p * q
+        return _trimmed(self.offset + other.offset, self.step, out)
+
+    def add_scaled(self, other: "ProfitGrid", weight: float) -> "ProfitGrid":
+        start = min(self.offset, other.offset)
+        end = max(self.offset + len(self.probs), other.offset + len(other.probs))
+        out = [0.0] * (end - start)
+        for j, p in enumerate(self.probs):
+            out[self.offset - start + j] += p
+        for j, p in enumerate(other.probs):
+            out[other.offset - start + j] += weight * p
+        return ProfitGrid(start, self.step, out)
+
+
+def _trimmed(offset: int, step: float, probs: list[float]) -> ProfitGrid:
+    lo, hi = 0, len(probs)
+    while lo < hi - 1 and probs[lo] < _TRIM:
+        lo += 1
+    while hi > lo + 1 and probs[hi - 1] < _TRIM:
+        hi -= 1
+    return ProfitGrid(offset + lo, step, probs[lo:hi])
+
+
+def _point(step: float) -> ProfitGrid:
+    return ProfitGrid(0, step, [1.0])
+
+
+def _empty(step: float) -> ProfitGrid:
+    return ProfitGrid(0, step, [])
+
+
+def _item_grid(law: ClampedLognormal, paid: float, step: float) -> ProfitGrid:
+    # Bin j holds profit in ((j - 1/2) step, (j + 1/2) step], from CDF
+    # differences, so the clamp atoms land in their bins.
+    first = math.floor((law.low - paid) / step - 0.5)
+    last = math.ceil((law.high - paid) / step + 0.5)
+    probs = []
+    prev = law.cdf(paid + (first - 0.5) * step)
+    for j in range(first, last + 1):
+        cur = law.cdf(paid + (j + 0.5) * step)
+        probs.append(cur - prev)
+        prev = cur
+    return _trimmed(first, step, probs)
+
+
+def team_profit_distribution(
+    items: Sequence,
+    cfg: BalanceConfig | None = None,
+    house=None,
+    step: float | None = None,
+) -> ProfitGrid:
+    """Distribution of a team's total profit (hammer prices minus shop
+    prices) by numeric convolution on a `step`-wide money grid."""
+    cfg = cfg or BalanceConfig()
+    _check_single_draw(cfg, house)
+    if step is None:
+        ah = cfg.auction_house
+        span = sum(it.true_value for it in items) * (ah.clamp_multiplier - 1.0 / ah.clamp_multiplier)
+        step = max(0.25, span / GRID_BINS)
+
+    by_category: dict[str, list] = {}
+    for it in items:
+        by_category.setdefault(it.category, []).append(it)
+
+    if house is not None:
+        moods = [(1.0, house.mood)]
+    else:
+        moods = mood_weights(cfg)
+
+    total = _empty(step)
+    for mood_w, mood in moods:
+        team = _point(step)
+        for category, cat_items in by_category.items():
+            # Items of one category share its demand draw: convolve them per
+            # demand node, then mix over the nodes.
+            if house is not None:
+                nodes = [(1.0, house.demand_by_category.get(category, 1.0))]
+            else:
+                nodes = demand_nodes(cfg, category)
+            mixed = _empty(step)
+            for node_w, demand in nodes:
+                grid = _point(step)
+                for it in cat_items:
+                    grid = grid.convolve(_item_grid(_sale_law(it, demand, mood, cfg), it.shop_price, step))
+                mixed = mixed.add_scaled(grid, node_w)
+            team = team.convolve(mixed)
+        total = total.add_scaled(team, mood_w)
+    return total
+
+
+@dataclass(frozen=True)
+class ValidationRow:
+    subject: str
+    metric: str
+    analytic: float
+    monte_carlo: float
+    stderr: float
+
+    @property
+    def z(self) -> float:
+        if self.stderr <= 0:
+            return 0.0 if math.isclose(self.analytic, self.monte_carlo, abs_tol=1e-9) else math.inf
+        return (self.monte_carlo - self.analytic) / self.stderr
+
+
+def _sample_rows(subject: str, samples: list[float], mean: float, std: float, p_loss: float, paid: float) -> list[ValidationRow]:
+    n = len(samples)
+    mc_mean = sum(samples) / n
+    mc_var = sum((x - mc_mean) ** 2 for x in samples) / max(1, n - 1)
+    mc_loss = sum(1 for x in samples if x < paid) / n
+    # Standard errors of the sample mean, std and a proportion.
+    return [
+        ValidationRow(subject, "mean", mean, mc_mean, math.sqrt(mc_var / n)),
+        ValidationRow(subject, "std", std, math.sqrt(mc_var), math.sqrt(mc_var / (2 * n))),
+        ValidationRow(subject, "p_loss", p_loss, mc_loss, math.sqrt(max(p_loss * (1 - p_loss), 1e-12) / n)),
+    ]
+
+
+def validate_against_monte_carlo(
+    teams: Sequence[Sequence],
+    cfg: BalanceConfig | None = None,
+    samples: int = 2000,
+    seed: int = 0,
+) -> list[ValidationRow]:
+    """Compare the analytic item and team figures with `samples` simulated
+    auctions. Each sample draws a fresh AuctionHouse and sells every item
+    with `AuctionHouse.sell`, as an episode does. Returns one row per item
+    and team metric; |z| of a few or less means agreement."""
+    from models.auction_house import AuctionHouse
+    from sim.rng import RNG
+
+    cfg = cfg or BalanceConfig()
+    rng = RNG(seed)
+    items = [it for team in teams for it in team]
+    prices: list[list[float]] = [[] for _ in items]
+    profits: list[list[float]] = [[] for _ in teams]
+    for _ in range(samples):
+        house = AuctionHouse.generate(rng, cfg=cfg, bidders=0)
+        idx = 0
+        for t, team in enumerate(teams):
+            profit = 0.0
+            for it in team:
+                price = house.sell(it, rng, cfg=cfg)
+                prices[idx].append(price)
+                profit += price - it.shop_price
+                idx += 1
+            profits[t].append(profit)
+
+    rows: list[ValidationRow] = []
+    for it, drawn in zip(items, prices):
+        outlook = item_outlook(it, cfg)
+        rows.extend(_sample_rows(f"item {it.item_id}", drawn, outlook.expected_price, outlook.std, outlook.p_loss, it.shop_price))
+    for t, team in enumerate(teams):
+        grid = team_profit_distribution(team, cfg)
+        rows.extend(_sample_rows(f"team {t}", profits[t], grid.mean(), grid.std(), grid.prob_loss(), 0.0))
+    return rows
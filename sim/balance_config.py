@@ -69,6 +69,8 @@ class AuctionHouseConfig:
     clamp_multiplier: float = AUCTION_HOUSE["clamp_multiplier"]
     condition_base: float = AUCTION_HOUSE["condition_base"]
     condition_scale: float = AUCTION_HOUSE["condition_scale"]
+    bidders: int = AUCTION_HOUSE["bidders"]
+    opening_ratio: float = AUCTION_HOUSE["opening_ratio"]
 
 
 @dataclass
@@ -173,6 +175,10 @@ class BalanceConfig:
             condition_scale=auction_house_data.get(
                 "condition_scale", AuctionHouseConfig().condition_scale
             ),
+            bidders=auction_house_data.get("bidders", AuctionHouseConfig().bidders),
+            opening_ratio=auction_house_data.get(
+                "opening_ratio", AuctionHouseConfig().opening_ratio
+            ),
         )
 
         gavel_data = data.get("gavel", {})
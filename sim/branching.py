@@ -0,0 +1,135 @@
+"""Branch an episode mid-market and play out many alternatives.
+
+Simulate the shared prefix once with `run_prefix`, which returns a
+BranchPoint (an Episode snapshot plus the market time left, and the
+balance config and item factory the snapshot leaves out). Each branch
+then restores that snapshot, applies an action (for example
+`force_purchase`) and plays the rest of the episode headless, so N what-ifs
+cost one prefix plus N suffixes. `explore_branches` runs the branches
+serially or across a process pool; workers get the branch point once, at
+start-up, and only branch arguments and results travel per task.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from config import GameConfig
+from models.episode import Episode, EpisodeSnapshot
+from sim.balance_config import BalanceConfig
+from sim.item_factory import ItemFactory
+from sim.timeline import record_episode
+
+
+@dataclass(frozen=True)
+class BranchPoint:
+    snapshot: EpisodeSnapshot
+    market_time_left: float
+    # Market seconds simulated before the snapshot.
+    elapsed: float = 0.0
+    # Shared by the episode rather than snapshotted, so carried alongside.
+    balance: BalanceConfig | None = None
+    item_factory: ItemFactory | None = None
+
+    def episode(self, cfg: GameConfig | None = None) -> Episode:
+        """A new episode in the snapshot's state, with the prefix's balance
+        config and item factory."""
+        return Episode.from_snapshot(self.snapshot, cfg, item_factory=self.item_factory, balance=self.balance)
+
+
+def run_prefix(episode: Episode, seconds: float, cfg: GameConfig | None = None) -> BranchPoint:
+    """Run the market of a set-up episode for `seconds` (in fixed steps,
+    exactly as record_episode would) and snapshot it there."""
+    cfg = cfg or episode.cfg or GameConfig()
+    step = cfg.sim_step_s
+    time_left = cfg.market_seconds
+    for _ in range(round(seconds / step)):
+        time_left -= step
+        episode.update_market_ai(step, cfg=cfg)
+        if time_left <= 0 or all(len(team.team_items) >= cfg.items_per_team for team in episode.teams):
+            break
+    return BranchPoint(
+        episode.snapshot(),
+        time_left,
+        cfg.market_seconds - time_left,
+        balance=episode.balance,
+        item_factory=episode.item_factory,
+    )
+
+
+def force_purchase(episode: Episode, branch: tuple[int, int] | None) -> bool:
+    """Branch action: team `branch[0]` buys item `branch[1]` at its listed
+    price, if it is still in the market and `Episode.buy` allows it (budget
+    and expert reserve). None is a no-op, for a baseline branch."""
+    if branch is None:
+        return False
+    team_idx, item_id = branch
+    team = episode.teams[team_idx]
+    if not team.can_buy_more(episode.items_per_team):
+        return False
+    for stall in episode.market.stalls:
+        for item in stall.items:
+            if item.item_id == item_id:
+                return episode.buy(team, stall, item)
+    return False
+
+
+def team_profits(episode: Episode) -> tuple[float, ...]:
+    return tuple(team.profit for team in episode.teams)
+
+
+def play_branch(
+    episode: Episode,
+    point: BranchPoint,
+    branch: Any,
+    action: Callable[[Episode, Any], Any] = force_purchase,
+    measure: Callable[[Episode], Any] = team_profits,
+    cfg: GameConfig | None = None,
+):
+    """Restore `point` into `episode`, apply `action(episode, branch)`, play
+    to results and return `measure(episode)`."""
+    episode.restore(point.snapshot)
+    action(episode, branch)
+    record_episode(episode, cfg or episode.cfg, sample_every=0, market_time_left=point.market_time_left)
+    return measure(episode)
+
+
+_worker_state: tuple | None = None
+
+
+def _branch_worker_initializer(point: BranchPoint, cfg: GameConfig, action, measure):
+    global _worker_state
+    _worker_state = (point.episode(cfg), point, cfg, action, measure)
+
+
+def _run_branch_worker(branch):
+    episode, point, cfg, action, measure = _worker_state
+    return play_branch(episode, point, branch, action, measure, cfg)
+
+
+def explore_branches(
+    point: BranchPoint,
+    branches: Sequence[Any],
+    *,
+    cfg: GameConfig | None = None,
+    action: Callable[[Episode, Any], Any] = force_purchase,
+    measure: Callable[[Episode], Any] = team_profits,
+    workers: int = 0,
+) -> list:
+    """Play every branch from `point`; results come back in branch order.
+
+    With `workers` > 1 the branches run in a process pool (`action` and
+    `measure` must then be module-level functions). Every branch starts
+    from the same restored snapshot, RNG state included, so results match
+    a serial run exactly.
+    """
+    cfg = cfg or GameConfig()
+    if workers <= 1:
+        episode = point.episode(cfg)
+        return [play_branch(episode, point, branch, action, measure, cfg) for branch in branches]
+
+    from multiprocessing import Pool
+
+    with Pool(workers, initializer=_branch_worker_initializer, initargs=(point, cfg, action, measure)) as pool:
+        return pool.map(_run_branch_worker, branches)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+from sim.item_database import ItemDatabase
+from sim.item_factory import ItemFactory
+
+DATA_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_SIZE = 4
+
+
+@dataclass(frozen=True)
+class DatasetSource:
+    """A named item dataset and the files it is loaded from.
+
+    `paths` are only used to fingerprint the dataset; `loader` does the actual
+    parsing. Missing files are fine — they fingerprint as absent, so creating
+    the file later invalidates the cached catalog.
+    """
+
+    name: str
+    paths: tuple[Path, ...]
+    loader: Callable[[], ItemDatabase]
+
+    def fingerprint(self) -> tuple:
+        parts = []
+        for path in self.paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                parts.append((str(path), None, None))
+                continue
+            parts.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(parts)
+
+    def digest(self) -> str:
+        """SHA-256 of the source files' contents, for keys that must survive
+        copies and touches but change whenever the data does."""
+        h = hashlib.sha256()
+        for path in self.paths:
+            try:
+                with open(path, "rb") as f:
+                    h.update(b"file\0")
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        h.update(block)
+            except OSError:
+                h.update(b"absent\0")
+        return h.hexdigest()
+
+
+def _builtin_sources() -> dict[str, DatasetSource]:
+    assets_json = DATA_ROOT / "assets" / "items.json"
+    generated_jsonl = DATA_ROOT / "data" / "items_100.jsonl"
+    assets = DatasetSource("assets", (assets_json,), ItemDatabase.load_default)
+    return {
+        "assets": assets,
+        "default": assets,
+        "generated": DatasetSource("generated", (generated_jsonl,), ItemDatabase.load_generated),
+        "combined": DatasetSource(
+            "combined", (assets_json, generated_jsonl), ItemDatabase.load_combined
+        ),
+    }
+
+
+class DatasetRegistry:
+    """LRU cache of loaded item catalogs keyed by source and file fingerprint.
+
+    Repeated lookups for the same source return the same ItemFactory (and so
+    the same parsed templates) until one of the source files changes on disk.
+    Lookups are thread-safe so concurrent headless workers can share catalogs.
+    """
+
+    def __init__(self, sources: dict[str, DatasetSource] | None = None, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.sources: dict[str, DatasetSource] = dict(sources) if sources is not None else _builtin_sources()
+        self.max_entries = max_entries
+        self._cache: OrderedDict[tuple, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, name: str, paths: Sequence[str | Path], loader: Callable[[], ItemDatabase]):
+        self.sources[name.lower()] = DatasetSource(name.lower(), tuple(Path(p) for p in paths), loader)
+
+    def source(self, name: str) -> DatasetSource:
+        try:
+            return self.sources[name.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown item source '{name}'") from None
+
+    def cache_key(self, name: str) -> tuple:
+        """Key identifying the current on-disk contents of a source."""
+        src = self.source(name)
+        return (src.name, src.fingerprint())
+
+    def get_factory(self, name: str) -> ItemFactory:
+        key = self.cache_key(name)
+        with self._lock:
+            factory = self._cache.get(key)
+            if factory is not None:
+                self._cache.move_to_end(key)
+                return factory
+
+            src = self.source(name)
+            factory = ItemFactory(src.loader(), dataset_key=key, dataset_digest=src.digest())
+            self._cache[key] = factory
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+            return factory
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+DEFAULT_REGISTRY = DatasetRegistry()
+
+
+def get_item_factory(source: str = "assets") -> ItemFactory:
+    """Return the shared, cached ItemFactory for a named dataset."""
+    return DEFAULT_REGISTRY.get_factory(source)
@@ -0,0 +1,162 @@
+"""Sequential early stopping for headless balance runs.
+
+A `StoppingRule` holds a target confidence-interval half-width per metric,
+e.g. {"gavel_rate": 0.005} for +/-0.5 percentage points. `run_headless`
+checks it after every batch of episodes. It stops as soon as every target
+is met ("converged"), or once the CI width so far projects that the run
+budget cannot meet some target ("futile"). Means use the normal
+approximation over per-episode values, rates use Wilson intervals (so a
+rate still at zero does not look converged) and medians use
+order-statistic bounds, so no resampling is needed.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist, fmean, median, stdev
+from typing import Callable, Sequence
+
+from sim.balance_config import BalanceConfig
+
+
+def mean_half_width(xs: Sequence[float], z: float) -> float:
+    if len(xs) < 2:
+        return math.inf
+    return z * stdev(xs) / math.sqrt(len(xs))
+
+
+def wilson_half_width(successes: float, trials: float, z: float) -> float:
+    if trials <= 0:
+        return math.inf
+    p = successes / trials
+    return z / (1 + z * z / trials) * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+
+
+def median_half_width(xs: Sequence[float], z: float) -> float:
+    """Half the distance between the order statistics bracketing the median
+    at this confidence (distribution-free)."""
+    n = len(xs)
+    if n < 2:
+        return math.inf
+    data = sorted(xs)
+    spread = z * math.sqrt(n) / 2
+    lo = max(0, math.floor(n / 2 - spread))
+    hi = min(n - 1, math.ceil(n / 2 + spread))
+    return (data[hi] - data[lo]) / 2
+
+
+def _gavel_rate(episodes, z: float, cfg) -> float:
+    awards = sum(1 for ep in episodes if ep.gavel_awarded)
+    eligible = sum(
+        1
+        for ep in episodes
+        for tr in ep.team_results
+        if tr.best_lot is not None and tr.best_lot.profit >= cfg.gavel.profit_threshold
+    )
+    return wilson_half_width(awards, eligible, z)
+
+
+def _negotiation_success_rate(episodes, z: float, cfg) -> float:
+    return wilson_half_width(
+        sum(ep.negotiation_successes for ep in episodes), sum(ep.negotiation_total for ep in episodes), z
+    )
+
+
+def _team_profit_mean(episodes, z: float, cfg) -> float:
+    # Teams in one episode share its auction house, so episodes are the unit.
+    return mean_half_width([fmean(tr.profit_total for tr in ep.team_results) for ep in episodes if ep.team_results], z)
+
+
+def _team_profit_median(episodes, z: float, cfg) -> float:
+    # As for the mean, teams sharing an auction house are not independent
+    # draws: bound the median of the per-episode medians instead.
+    per_episode = [median(tr.profit_total for tr in ep.team_results) for ep in episodes if ep.team_results]
+    return median_half_width(per_episode, z)
+
+
+def _item_profit_mean(episodes, z: float, cfg) -> float:
+    per_episode = []
+    for ep in episodes:
+        # Episodes that sold no lots (items_per_team=0) have no item profit.
+        profits = [lot.profit for tr in ep.team_results for lot in tr.lots]
+        if profits:
+            per_episode.append(fmean(profits))
+    return mean_half_width(per_episode, z)
+
+
+def _ratio_mean(attr: str) -> Callable:
+    def half_width(episodes, z: float, cfg) -> float:
+        per_episode = []
+        for ep in episodes:
+            ratios = [getattr(lot, attr) / lot.paid for tr in ep.team_results for lot in tr.lots if lot.paid]
+            if ratios:
+                per_episode.append(fmean(ratios))
+        return mean_half_width(per_episode, z)
+
+    return half_width
+
+
+# Metric name -> CI half-width function; names follow the report's keys.
+METRICS: dict[str, Callable] = {
+    "gavel_rate": _gavel_rate,
+    "negotiation_success_rate": _negotiation_success_rate,
+    "team_profit_mean": _team_profit_mean,
+    "team_profit_median": _team_profit_median,
+    "item_profit_mean": _item_profit_mean,
+    "auction_ratio_mean": _ratio_mean("sold"),
+    "appraisal_ratio_mean": _ratio_mean("appraised"),
+}
+
+
+@dataclass
+class StoppingRule:
+    targets: dict[str, float]
+    confidence: float = 0.95
+    batch: int = 50
+    min_runs: int = 100
+    # Give up once the projected runs exceed the budget by this factor.
+    futility_factor: float = 2.0
+    history: list[dict] = field(default_factory=list)
+    reason: str | None = None
+
+    def __post_init__(self):
+        unknown = [name for name in self.targets if name not in METRICS]
+        if unknown:
+            raise ValueError(f"Unknown stopping metric(s) {unknown}; choose from {sorted(METRICS)}")
+        bad = {name: target for name, target in self.targets.items() if not target > 0}
+        if bad:
+            raise ValueError(f"Stopping targets must be positive half-widths, got {bad}")
+
+    def half_widths(self, episodes, cfg: BalanceConfig) -> dict[str, float]:
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        return {name: METRICS[name](episodes, z, cfg) for name in self.targets}
+
+    def should_stop(self, episodes, budget: int, cfg: BalanceConfig) -> bool:
+        """Call after each episode; checks the targets every `batch` runs."""
+        n = len(episodes)
+        if n % self.batch or n < min(self.min_runs, budget):
+            return False
+        widths = self.half_widths(episodes, cfg)
+        self.history.append({"runs": n, "half_widths": widths})
+        if all(widths[name] <= target for name, target in self.targets.items()):
+            self.reason = "converged"
+            return True
+        # CI width shrinks like 1/sqrt(n), so n (w / target)^2 runs would do.
+        projected = max(n * (widths[name] / target) ** 2 for name, target in self.targets.items())
+        if projected > budget * self.futility_factor:
+            self.reason = "futile"
+            return True
+        return False
+
+    def summary(self, episodes, cfg: BalanceConfig) -> dict:
+        widths = self.half_widths(episodes, cfg)
+        return {
+            "targets": dict(self.targets),
+            "confidence": self.confidence,
+            "batch": self.batch,
+            "reason": self.reason or "budget",
+            "half_widths": widths,
+            "met": {name: widths[name] <= target for name, target in self.targets.items()},
+            "checks": self.history,
+        }
@@ -51,6 +51,12 @@ AUCTION_HOUSE = {
     "clamp_multiplier": 2.0,
     "condition_base": 0.65,
     "condition_scale": 0.75,
+    # Bidders per lot for the ascending-bid model (models/bidding.py);
+    # 0 keeps the single-multiplier sale. Each bidder draws their own
+    # valuation noise with the mood's sigma; bidding opens at this share of
+    # the lot's expected value.
+    "bidders": 0,
+    "opening_ratio": 0.4,
 }
 
 TRUE_VALUE = {
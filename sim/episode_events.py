@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+
+class EpisodeListener:
+    """Hooks an Episode calls as its state changes; the one event model.
+
+    Attach a listener as `Episode.recorder`. The binary event log
+    (sim/event_log.py) serialises these calls and the playback timeline
+    (sim/timeline.py) turns the same calls into timeline events. Every hook
+    is a no-op here, so listeners override only what they need. Hooks run
+    after the episode has applied the change, so listeners read the new
+    state from the objects passed in.
+    """
+
+    def begin(self, episode):
+        """Setup finished: teams, market and host exist."""
+
+    def tick(self, episode, dt: float):
+        """One `update_market_ai` step of `dt` sim seconds ran."""
+
+    def purchase(self, team, stall, item, listed: float, discount: float):
+        """`team` bought `item` from `stall`, listed at `listed` and now
+        priced `item.shop_price` after `discount`."""
+
+    def reserve(self, team):
+        """The team's leftover budget was handed to its expert."""
+
+    def expert_pick(self, team, pick):
+        """The expert bought `pick` in secret (None: found nothing)."""
+
+    def appraisal(self, team, item):
+        """`item` got its `appraised_value`."""
+
+    def expert_choice(self, team, include: bool, score: float = 0.0):
+        """The team decided whether to include its expert's pick."""
+
+    def sale(self, stage: str, lot, price: float):
+        """A lot sold at `price` in the "team" or "expert" auction."""
+
+    def results(self, episode):
+        """Final totals, golden gavels and the winner are set."""
+
+
+class EventFanout(EpisodeListener):
+    """Forwards every hook to several listeners, in order."""
+
+    def __init__(self, *listeners: EpisodeListener):
+        self.listeners = [listener for listener in listeners if listener is not None]
+
+    def begin(self, episode):
+        for listener in self.listeners:
+            listener.begin(episode)
+
+    def tick(self, episode, dt: float):
+        for listener in self.listeners:
+            listener.tick(episode, dt)
+
+    def purchase(self, team, stall, item, listed: float, discount: float):
+        for listener in self.listeners:
+            listener.purchase(team, stall, item, listed, discount)
+
+    def reserve(self, team):
+        for listener in self.listeners:
+            listener.reserve(team)
+
+    def expert_pick(self, team, pick):
+        for listener in self.listeners:
+            listener.expert_pick(team, pick)
+
+    def appraisal(self, team, item):
+        for listener in self.listeners:
+            listener.appraisal(team, item)
+
+    def expert_choice(self, team, include: bool, score: float = 0.0):
+        for listener in self.listeners:
+            listener.expert_choice(team, include, score)
+
+    def sale(self, stage: str, lot, price: float):
+        for listener in self.listeners:
+            listener.sale(stage, lot, price)
+
+    def results(self, episode):
+        for listener in self.listeners:
+            listener.results(episode)
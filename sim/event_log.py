@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import struct
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from models.contestant import Contestant
+from models.item import Item
+from models.team import Team
+from sim.episode_events import EpisodeListener
+from sim.timeline import PHASES
+
+# Bump when a record layout changes. Readers skip record kinds they do not
+# know (every record carries its length), so adding kinds needs no bump.
+EVENT_LOG_VERSION = 1
+MAGIC = b"BHEL"
+INDEX_MAGIC = b"BHIX"
+
+# Sections in file order: team definitions, the item table, then one
+# section per phase. The index at the end of the file locates each one.
+SECTIONS = ("SETUP", "ITEMS") + PHASES
+
+_HEADER = struct.Struct("<4sHqiB")  # magic, version, seed, ep_idx, team count
+_RECORD = struct.Struct("<BH")  # kind, payload length
+_INDEX_ENTRY = struct.Struct("<BIII")  # section, offset, length, record count
+_TRAILER = struct.Struct("<IB4s")  # index offset, section count, magic
+_STR_LEN = struct.Struct("<H")
+
+# Record kinds: fixed-size fields, followed by this many strings.
+TEAM, ITEM, TICK, PURCHASE, RESERVE, EXPERT_PICK, APPRAISAL, SALE, EXPERT_CHOICE, RESULT = range(1, 11)
+_LAYOUTS = {
+    # idx, r, g, b, budget_start, x, y, contestants; name, expert
+    TEAM: (struct.Struct("<B3BdddB"), 2),
+    # item_id, condition, rarity, style_score, true_value, listed price;
+    # name, category, era, description, image_path
+    ITEM: (struct.Struct("<Iddddd"), 5),
+    # team, item_id, stall_id, paid, discount, budget_left, negotiated
+    PURCHASE: (struct.Struct("<BIhdddB"), 0),
+    # team, expert budget
+    RESERVE: (struct.Struct("<Bd"), 0),
+    # team, item_id (-1: none), price, expert estimate, budget left
+    EXPERT_PICK: (struct.Struct("<Biddd"), 0),
+    # team, item_id, appraised value
+    APPRAISAL: (struct.Struct("<BId"), 0),
+    # team, item_id, hammer price, expert bonus lot
+    SALE: (struct.Struct("<BIdB"), 0),
+    # team, item_id, included
+    EXPERT_CHOICE: (struct.Struct("<BIB"), 0),
+    # team, spend, revenue, profit, golden gavel, winner
+    RESULT: (struct.Struct("<BdddBB"), 0),
+}
+# Contestant entries follow a TEAM record's fixed part: confidence, taste;
+# name, role.
+_CONTESTANT = struct.Struct("<dd")
+
+
+def _tick_layout(team_count: int) -> struct.Struct:
+    # sim time, then x and y per team
+    return struct.Struct(f"<d{2 * team_count}f")
+
+
+def _pack_str(text: str | None) -> bytes:
+    data = (text or "").encode("utf-8")
+    return _STR_LEN.pack(len(data)) + data
+
+
+def _unpack_strs(buf, pos: int, count: int) -> tuple[list[str], int]:
+    out = []
+    for _ in range(count):
+        (n,) = _STR_LEN.unpack_from(buf, pos)
+        pos += _STR_LEN.size
+        out.append(bytes(buf[pos : pos + n]).decode("utf-8"))
+        pos += n
+    return out, pos
+
+
+class EpisodeRecorder(EpisodeListener):
+    """Serialises an episode's events (sim/episode_events.py) as compact
+    binary records.
+
+    Attach one as `Episode.recorder` before `setup()`; the episode reports
+    team setup, market ticks, purchases (with the listed price and the
+    negotiated discount), expert budgets and picks, appraisals, reveal
+    choices, hammer prices and results. Items are written to the item table
+    the first time an event refers to them. `to_bytes()` lays the sections
+    out behind a small header and ends with a per-phase index, so readers can
+    jump straight to one phase. Market ticks are kept every `tick_every`
+    calls to `update_market_ai` (0 keeps none).
+    """
+
+    def __init__(self, tick_every: int = 3):
+        self.tick_every = tick_every
+        self.seed = 0
+        self.ep_idx = 0
+        self.sim_time = 0.0
+        self._team_ids: dict[int, int] = {}
+        self._sections = {name: bytearray() for name in SECTIONS}
+        self._counts = dict.fromkeys(SECTIONS, 0)
+        self._items_seen: set[int] = set()
+        self._ticks = 0
+        self._tick = _tick_layout(0)
+
+    def _write(self, section: str, kind: int, payload: bytes):
+        buf = self._sections[section]
+        buf += _RECORD.pack(kind, len(payload))
+        buf += payload
+        self._counts[section] += 1
+
+    def _team(self, team) -> int:
+        return self._team_ids[id(team)]
+
+    def _item(self, item, listed: float | None = None):
+        if item.item_id in self._items_seen:
+            return
+        self._items_seen.add(item.item_id)
+        fixed = _LAYOUTS[ITEM][0].pack(
+            item.item_id,
+            item.condition,
+            item.rarity,
+            item.style_score,
+            item.true_value,
+            item.shop_price if listed is None else listed,
+        )
+        strings = (item.name, item.category, item.era, item.description, item.image_path)
+        self._write("ITEMS", ITEM, fixed + b"".join(_pack_str(s) for s in strings))
+
+    # -- hooks called by Episode ----------------------------------------
+    def begin(self, episode):
+        self.seed = episode.seed
+        self.ep_idx = episode.ep_idx
+        self._team_ids = {id(team): idx for idx, team in enumerate(episode.teams)}
+        self._tick = _tick_layout(len(episode.teams))
+        for idx, team in enumerate(episode.teams):
+            fixed = _LAYOUTS[TEAM][0].pack(idx, *team.color, team.budget_start, team.x, team.y, len(team.contestants))
+            payload = fixed + _pack_str(team.name) + _pack_str(getattr(team.expert, "name", ""))
+            for c in team.contestants:
+                payload += _CONTESTANT.pack(c.confidence, c.taste) + _pack_str(c.name) + _pack_str(c.role)
+            self._write("SETUP", TEAM, payload)
+
+    def tick(self, episode, dt: float):
+        self.sim_time += dt
+        self._ticks += 1
+        if not self.tick_every or self._ticks % self.tick_every:
+            return
+        coords = []
+        for team in episode.teams:
+            coords.extend((team.x, team.y))
+        self._write("MARKET", TICK, self._tick.pack(self.sim_time, *coords))
+
+    def purchase(self, team, stall, item, listed: float, discount: float):
+        self._item(item, listed)
+        payload = _LAYOUTS[PURCHASE][0].pack(
+            self._team(team),
+            item.item_id,
+            stall.stall_id,
+            item.shop_price,
+            discount,
+            team.budget_left,
+            item.was_negotiated,
+        )
+        self._write("MARKET", PURCHASE, payload)
+
+    def reserve(self, team):
+        self._write("EXPERT_HANDOFF", RESERVE, _LAYOUTS[RESERVE][0].pack(self._team(team), team.expert_pick_budget))
+
+    def expert_pick(self, team, pick):
+        if pick is None:
+            payload = _LAYOUTS[EXPERT_PICK][0].pack(self._team(team), -1, 0.0, 0.0, team.expert_pick_budget)
+        else:
+            self._item(pick)
+            estimate = pick.attributes.get("expert_estimate", 0.0)
+            payload = _LAYOUTS[EXPERT_PICK][0].pack(
+                self._team(team), pick.item_id, pick.shop_price, estimate, team.expert_pick_budget
+            )
+        self._write("EXPERT_SHOPPING", EXPERT_PICK, payload)
+
+    def appraisal(self, team, item):
+        self._item(item)
+        self._write("APPRAISAL", APPRAISAL, _LAYOUTS[APPRAISAL][0].pack(self._team(team), item.item_id, item.appraised_value))
+
+    def expert_choice(self, team, include: bool, score: float = 0.0):
+        item = team.expert_pick_item
+        self._item(item)
+        self._write("EXPERT_REVEAL", EXPERT_CHOICE, _LAYOUTS[EXPERT_CHOICE][0].pack(self._team(team), item.item_id, include))
+
+    def sale(self, stage: str, lot, price: float):
+        self._item(lot.item)
+        section = "AUCTION_EXPERT" if stage == "expert" else "AUCTION_TEAM"
+        payload = _LAYOUTS[SALE][0].pack(self._team(lot.team), lot.item.item_id, price, lot.is_bonus)
+        self._write(section, SALE, payload)
+
+    def results(self, episode):
+        for idx, team in enumerate(episode.teams):
+            payload = _LAYOUTS[RESULT][0].pack(
+                idx, team.spend, team.revenue, team.profit, team.golden_gavel, team is episode.winner
+            )
+            self._write("RESULTS", RESULT, payload)
+
+    # -- output ---------------------------------------------------------
+    def to_bytes(self) -> bytes:
+        out = bytearray(_HEADER.pack(MAGIC, EVENT_LOG_VERSION, self.seed, self.ep_idx, len(self._team_ids)))
+        index = bytearray()
+        for section_id, name in enumerate(SECTIONS):
+            data = self._sections[name]
+            index += _INDEX_ENTRY.pack(section_id, len(out), len(data), self._counts[name])
+            out += data
+        index_offset = len(out)
+        out += index
+        out += _TRAILER.pack(index_offset, len(SECTIONS), INDEX_MAGIC)
+        return bytes(out)
+
+    def save(self, path: str | Path) -> int:
+        data = self.to_bytes()
+        Path(path).write_bytes(data)
+        return len(data)
+
+
+class EventLog:
+    """Read-only view of a log written by EpisodeRecorder."""
+
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        magic, self.version, self.seed, self.ep_idx, self.team_count = _HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError("Not an episode event log")
+        if self.version > EVENT_LOG_VERSION:
+            raise ValueError(f"Event log version {self.version} is newer than this reader ({EVENT_LOG_VERSION})")
+        index_offset, section_count, index_magic = _TRAILER.unpack_from(self.data, len(self.data) - _TRAILER.size)
+        if index_magic != INDEX_MAGIC:
+            raise ValueError("Event log is truncated (no index)")
+        # section name -> (offset, length, record count)
+        self.sections: dict[str, tuple[int, int, int]] = {}
+        for n in range(section_count):
+            section_id, offset, length, count = _INDEX_ENTRY.unpack_from(self.data, index_offset + n * _INDEX_ENTRY.size)
+            if section_id < len(SECTIONS):
+                self.sections[SECTIONS[section_id]] = (offset, length, count)
+        self._tick = _tick_layout(self.team_count)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "EventLog":
+        return cls(Path(path).read_bytes())
+
+    def count(self, section: str) -> int:
+        return self.sections.get(section, (0, 0, 0))[2]
+
+    def records(self, section: str, skip: frozenset[int] = frozenset()):
+        """Yield (kind, fields, strings) for each record in one section,
+        without decoding the kinds in `skip`."""
+        offset, length, _count = self.sections.get(section, (0, 0, 0))
+        buf, pos, end = self.data, offset, offset + length
+        while pos < end:
+            kind, size = _RECORD.unpack_from(buf, pos)
+            pos += _RECORD.size
+            if kind not in skip:
+                yield (kind, *self._decode(kind, buf, pos))
+            pos += size
+
+    def _decode(self, kind: int, buf, pos: int):
+        if kind == TICK:
+            return self._tick.unpack_from(buf, pos), []
+        layout = _LAYOUTS.get(kind)
+        if layout is None:
+            # Written by a newer recorder; the caller skips it.
+            return (), []
+        fixed, n_strings = layout
+        fields = fixed.unpack_from(buf, pos)
+        strings, end = _unpack_strs(buf, pos + fixed.size, n_strings)
+        if kind == TEAM:
+            contestants = []
+            for _ in range(fields[-1]):
+                confidence, taste = _CONTESTANT.unpack_from(buf, end)
+                (name, role), end = _unpack_strs(buf, end + _CONTESTANT.size, 2)
+                contestants.append((name, role, confidence, taste))
+            strings.append(contestants)
+        return fields, strings
+
+
+@dataclass
+class ReplayedEpisode:
+    """Team and item state rebuilt from an event log."""
+
+    seed: int
+    ep_idx: int
+    teams: list[Team]
+    items: dict[int, Item]
+    expert_names: list[str] = field(default_factory=list)
+    winner: Team | None = None
+    # Market ticks, if requested: sim times and per-team (x, y) pairs.
+    tick_times: array = field(default_factory=lambda: array("d"))
+    tick_positions: array = field(default_factory=lambda: array("f"))
+
+
+def replay(log: EventLog | bytes, *, until: str | None = None, ticks: bool = False) -> ReplayedEpisode:
+    """Rebuild Team and Item state from a log, without any AI or RNG.
+
+    Phases are applied in order up to and including `until` (default: all).
+    Teams come back with no strategy or expert object attached; expert names
+    are in `expert_names`. Ticks are skipped unless `ticks` is set.
+    """
+    if not isinstance(log, EventLog):
+        log = EventLog(log)
+    result = ReplayedEpisode(seed=log.seed, ep_idx=log.ep_idx, teams=[], items={})
+    teams, items = result.teams, result.items
+
+    for kind, f, s in log.records("SETUP"):
+        if kind != TEAM:
+            continue
+        _idx, r, g, b, budget, x, y, _n = f
+        name, expert, contestants = s
+        team = Team(
+            name,
+            (r, g, b),
+            budget,
+            budget,
+            None,
+            None,
+            [Contestant(name=c[0], role=c[1], confidence=c[2], taste=c[3]) for c in contestants],
+            x,
+            y,
+        )
+        team.ensure_member_positions()
+        teams.append(team)
+        result.expert_names.append(expert)
+
+    for kind, f, s in log.records("ITEMS"):
+        if kind != ITEM:
+            continue
+        item_id, condition, rarity, style, true_value, listed = f
+        name, category, era, description, image_path = s
+        items[item_id] = Item(
+            item_id, name, category, era, condition, rarity, style, true_value, listed,
+            description=description, image_path=image_path or None,
+        )
+
+    skip = frozenset() if ticks else frozenset({TICK})
+    for phase in PHASES:
+        for kind, f, _s in log.records(phase, skip):
+            if kind == TICK:
+                if ticks:
+                    result.tick_times.append(f[0])
+                    result.tick_positions.extend(f[1:])
+            elif kind == PURCHASE:
+                team_idx, item_id, _stall, paid, _disc, budget_left, negotiated = f
+                item = items[item_id]
+                item.shop_price = paid
+                item.was_negotiated = bool(negotiated)
+                teams[team_idx].items_bought.append(item)
+                teams[team_idx].budget_left = budget_left
+            elif kind == RESERVE:
+                team = teams[f[0]]
+                team.expert_pick_budget = f[1]
+                team.budget_left = 0.0
+            elif kind == EXPERT_PICK:
+                team_idx, item_id, price, estimate, budget_left = f
+                team = teams[team_idx]
+                team.expert_pick_budget = budget_left
+                if item_id < 0:
+                    team.expert_pick_included = False
+                    continue
+                item = items[item_id]
+                item.shop_price = price
+                item.is_expert_pick = True
+                item.attributes["expert_estimate"] = estimate
+                team.expert_pick_item = item
+            elif kind == APPRAISAL:
+                items[f[1]].appraised_value = f[2]
+            elif kind == EXPERT_CHOICE:
+                teams[f[0]].expert_pick_included = bool(f[2])
+            elif kind == SALE:
+                items[f[1]].auction_price = f[2]
+            elif kind == RESULT:
+                team_idx, spend, revenue, profit, gavel, winner = f
+                team = teams[team_idx]
+                team.spend, team.revenue, team.profit = spend, revenue, profit
+                team.golden_gavel = bool(gavel)
+                if winner:
+                    result.winner = team
+        if phase == until:
+            break
+
+    if result.tick_times:
+        last = result.tick_positions[-2 * len(teams) :]
+        for idx, team in enumerate(teams):
+            team.x, team.y = last[2 * idx], last[2 * idx + 1]
+    return result
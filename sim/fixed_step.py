@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class FixedStepClock:
+    """Turns variable frame times into a whole number of fixed sim steps.
+
+    Frame time (already multiplied by the speed setting) is added to an
+    accumulator and consumed in `step`-sized slices, so the simulation sees
+    the same sequence of steps at any frame rate and speed only changes how
+    many steps run per frame. At most `max_steps` run per frame; time beyond
+    that is dropped (and counted in `dropped`) rather than piling up after a
+    stall. `alpha` is how far the leftover time reaches into the next step,
+    for interpolating what is drawn between the last two sim states.
+    """
+
+    step: float = 1.0 / 30.0
+    max_steps: int = 240
+    accumulator: float = 0.0
+    dropped: float = 0.0
+
+    def advance(self, dt: float, max_steps: int | None = None) -> int:
+        """Add `dt` seconds of sim time; returns how many steps to run now.
+
+        `max_steps` overrides the per-frame cap for this call.
+        """
+        cap = self.max_steps if max_steps is None else max_steps
+        self.accumulator += max(0.0, dt)
+        # The small epsilon stops 0.1 + 0.2-style rounding from deferring a
+        # step that is due by a frame.
+        due = int((self.accumulator + 1e-9) / self.step)
+        self.accumulator = max(0.0, self.accumulator - due * self.step)
+        if due > cap:
+            self.dropped += (due - cap) * self.step
+            return cap
+        return due
+
+    @property
+    def alpha(self) -> float:
+        return min(1.0, self.accumulator / self.step)
+
+    def reset(self):
+        self.accumulator = 0.0
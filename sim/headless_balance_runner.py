@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Iterable
+from typing import Callable, Iterable
 
 from models.auction_house import AuctionHouse
 from models.auction_result import AuctionRoundResult
@@ -12,6 +12,7 @@ from models.item import Item
 from models.team import Team
 from sim.balance_config import BalanceConfig
 from sim.balance_metrics import GavelMetrics, episodes_to_rows, summarize_distribution
+from sim.early_stopping import StoppingRule
 from sim.item_factory import ItemFactory
 from sim.pricing import negotiate, set_shop_price
 from sim.rng import RNG
@@ -25,6 +26,8 @@ class EpisodeResult:
     negotiation_discounts: list[float]
     negotiation_successes: int
     negotiation_total: int
+    # Sum of the items' true values; a control variate for paired runs.
+    true_value_total: float = 0.0
 
     def to_dict(self):
         return {
@@ -34,6 +37,7 @@ class EpisodeResult:
             "negotiation_discounts": self.negotiation_discounts,
             "negotiation_successes": self.negotiation_successes,
             "negotiation_total": self.negotiation_total,
+            "true_value_total": self.true_value_total,
         }
 
 
@@ -60,21 +64,32 @@ def run_episode(
     auctioneer: Auctioneer,
     auction_house: AuctionHouse,
     cfg: BalanceConfig,
+    streams: Callable[..., RNG] | None = None,
 ) -> EpisodeResult:
+    """Shop for, appraise and sell `runs_per_team` items per team.
+
+    By default every draw comes from `rng` in turn. With `streams`, each
+    item is shopped for with `streams("item", item_id)`, appraised and sold
+    with `streams("sale", item_id)`, and the gavel uses `streams("gavel")`.
+    A config change that alters some draws (say, a negotiation succeeding)
+    then shifts nothing else, which keeps paired runs in step.
+    """
     results: list[AuctionRoundResult] = []
     discounts: list[float] = []
     neg_successes = 0
     neg_total = 0
     item_id = 1
+    all_items: list[Item] = []
     for team in teams:
         items: list[Item] = []
         for _ in range(runs_per_team):
-            item = factory.make_item(rng, item_id)
+            item_rng = streams("item", item_id) if streams is not None else rng
+            item = factory.make_item(item_rng, item_id)
             item_id += 1
-            set_shop_price(item, rng, pricing_style, cfg=cfg)
+            set_shop_price(item, item_rng, pricing_style, cfg=cfg)
             did, disc = negotiate(
                 item,
-                rng,
+                item_rng,
                 negotiate_chance,
                 negotiate_min,
                 negotiate_max,
@@ -88,11 +103,13 @@ def run_episode(
                 neg_successes += 1
                 discounts.append(disc)
             neg_total += 1
-            item.appraised_value = auctioneer.appraise(item, rng, cfg=cfg)
-            item.auction_price = auction_house.sell(item, rng, cfg=cfg)
+            sale_rng = streams("sale", item.item_id) if streams is not None else rng
+            item.appraised_value = auctioneer.appraise(item, sale_rng, cfg=cfg)
+            item.auction_price = auction_house.sell(item, sale_rng, cfg=cfg)
             items.append(item)
+            all_items.append(item)
         results.append(AuctionRoundResult.from_team(team, items))
-    gavel_awarded = _maybe_award_gavel(results, rng, cfg)
+    gavel_awarded = _maybe_award_gavel(results, streams("gavel") if streams is not None else rng, cfg)
     return EpisodeResult(
         team_results=results,
         gavel_awarded=gavel_awarded,
@@ -100,6 +117,7 @@ def run_episode(
         negotiation_discounts=discounts,
         negotiation_successes=neg_successes,
         negotiation_total=neg_total,
+        true_value_total=sum(it.true_value for it in all_items),
     )
 
 
@@ -118,8 +136,19 @@ def run_headless(
     auctioneer: Auctioneer | None = None,
     auction_house: AuctionHouse | None = None,
     csv_path: str | Path | None = None,
+    precision: dict[str, float] | None = None,
+    confidence: float = 0.95,
+    batch: int = 50,
 ) -> dict:
+    """Run up to `runs` episodes and aggregate them into a report.
+
+    With `precision` (metric -> target CI half-width, see
+    sim/early_stopping.py) the CIs are checked every `batch` episodes and
+    the run stops once every target is met, or once the budget clearly
+    cannot meet one. `meta.runs_used` records how many episodes ran.
+    """
     cfg = cfg or BalanceConfig()
+    stopping = StoppingRule(dict(precision), confidence=confidence, batch=batch) if precision else None
     rng = RNG(seed)
     factory = item_factory or ItemFactory.with_default_db()
     auctioneer = auctioneer or Auctioneer(
@@ -151,11 +180,50 @@ def run_headless(
             cfg=cfg,
         )
         all_episode_results.append(episode_result)
+        if stopping is not None and stopping.should_stop(all_episode_results, runs, cfg):
+            break
 
     if csv_path:
         _save_episode_csv(all_episode_results, csv_path, seed=seed)
 
-    return _aggregate(all_episode_results, cfg=cfg, seed=seed, pricing_style=pricing_style)
+    report = _aggregate(all_episode_results, cfg=cfg, seed=seed, pricing_style=pricing_style)
+    report["meta"]["runs_requested"] = runs
+    report["meta"]["runs_used"] = len(all_episode_results)
+    if stopping is not None:
+        report["stopping"] = stopping.summary(all_episode_results, cfg)
+    return report
+
+
+def _run_headless_worker(task: tuple[int, dict]) -> dict:
+    from sim.shared_catalog import worker_factory
+
+    seed, kwargs = task
+    return run_headless(seed=seed, item_factory=worker_factory(), **kwargs)
+
+
+def run_headless_parallel(
+    seeds: Iterable[int],
+    *,
+    workers: int = 2,
+    item_factory: ItemFactory | None = None,
+    **kwargs,
+) -> list[dict]:
+    """Run `run_headless` once per seed across a process pool.
+
+    The item catalog is placed in shared memory once by the parent and
+    attached zero-copy by each worker, so adding workers does not multiply
+    catalog parsing or memory. Reports come back in seed order and match
+    running `run_headless(seed=s, ...)` serially.
+    """
+    from multiprocessing import Pool
+
+    from sim.shared_catalog import SharedCatalog, worker_initializer
+
+    factory = item_factory or ItemFactory.with_default_db()
+    tasks = [(seed, kwargs) for seed in seeds]
+    with SharedCatalog(factory.database) as shared:
+        with Pool(workers, initializer=worker_initializer, initargs=(shared.name, shared.size)) as pool:
+            return pool.map(_run_headless_worker, tasks)
 
 
 def _aggregate(episodes: list[EpisodeResult], *, cfg: BalanceConfig, seed: int, pricing_style: str) -> dict:
@@ -0,0 +1,254 @@
+"""Compact binary item catalog format.
+
+A catalog file is a magic header followed by self-contained chunks, so large
+catalogs can be written as a stream without knowing the total size up front.
+Each chunk stores its numeric columns as little-endian arrays and its strings
+in a deduplicated per-chunk string table:
+
+    header   "<4sIII"  b"CHNK", count, n_strings, blob_len
+    float64  condition, rarity, style_score, true_value      (count each)
+    uint32   name, category, era, description, image, attrs  (string ids)
+    uint32   string offsets                                  (n_strings + 1)
+    bytes    utf-8 string blob, padded to 8 bytes
+
+String id ``NO_STRING`` stands for ``None``; ``attrs`` holds a JSON object.
+Readers slice columns straight out of a buffer (bytes, mmap or shared memory)
+without copying them.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Iterable, Mapping
+
+FILE_MAGIC = b"BHCAT\x00\x01\x00"
+CHUNK_MAGIC = b"CHNK"
+CHUNK_HEADER = struct.Struct("<4sIII")
+NO_STRING = 0xFFFFFFFF
+
+FLOAT_COLUMNS = ("condition", "rarity", "style_score", "true_value")
+STRING_COLUMNS = ("name", "category", "era", "description", "image", "attributes")
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _pad8(size: int) -> int:
+    return (-size) % 8
+
+
+def _le_bytes(values: array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_chunk(columns: Mapping[str, Sequence]) -> bytes:
+    """Encode one chunk from column sequences of equal length.
+
+    Float columns accept any sequence of numbers (lists, arrays, NumPy arrays).
+    String columns accept str or None; ``attributes`` may also hold dicts.
+    """
+    count = len(columns["name"])
+    strings: dict[str, int] = {}
+
+    def _intern(value) -> int:
+        if value is None:
+            return NO_STRING
+        if not isinstance(value, str):
+            value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        idx = strings.get(value)
+        if idx is None:
+            idx = strings[value] = len(strings)
+        return idx
+
+    parts = [b""]
+    for name in FLOAT_COLUMNS:
+        values = columns[name]
+        if hasattr(values, "astype"):
+            parts.append(values.astype("<f8", copy=False).tobytes())
+        else:
+            parts.append(_le_bytes(array("d", values)))
+    for name in STRING_COLUMNS:
+        values = columns.get(name)
+        ids = array("I", [NO_STRING] * count) if values is None else array("I", map(_intern, values))
+        parts.append(_le_bytes(ids))
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array("I", [0])
+    total = 0
+    for chunk in encoded:
+        total += len(chunk)
+        offsets.append(total)
+    blob = b"".join(encoded)
+    parts.append(_le_bytes(offsets))
+    parts.append(blob + b"\x00" * _pad8(len(blob) + 4 * len(offsets)))
+    parts[0] = CHUNK_HEADER.pack(CHUNK_MAGIC, count, len(encoded), len(blob))
+    return b"".join(parts)
+
+
+def encode_templates(templates: Iterable) -> bytes:
+    """Encode ItemTemplate-like objects as a single chunk."""
+    columns: dict[str, list] = {name: [] for name in FLOAT_COLUMNS + STRING_COLUMNS}
+    for t in templates:
+        columns["condition"].append(t.condition)
+        columns["rarity"].append(t.rarity)
+        columns["style_score"].append(t.style_score)
+        columns["true_value"].append(t.true_value)
+        columns["name"].append(t.name)
+        columns["category"].append(t.category)
+        columns["era"].append(t.era)
+        columns["description"].append(t.description)
+        columns["image"].append(t.image)
+        columns["attributes"].append(t.attributes or None)
+    return encode_chunk(columns)
+
+
+class CatalogWriter:
+    """Stream chunks to a catalog file."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = self.path.open("wb")
+        self._f.write(FILE_MAGIC)
+        self.count = 0
+
+    def write_chunk(self, chunk: bytes):
+        self._f.write(chunk)
+        self.count += CHUNK_HEADER.unpack_from(chunk)[1]
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Chunk:
+    __slots__ = ("count", "floats", "string_ids", "offsets", "blob", "_strings")
+
+    def __init__(self, buf: memoryview, pos: int):
+        magic, count, n_strings, blob_len = CHUNK_HEADER.unpack_from(buf, pos)
+        if magic != CHUNK_MAGIC:
+            raise ValueError(f"Corrupt item catalog: bad chunk header at byte {pos}")
+        pos += CHUNK_HEADER.size
+        self.count = count
+        self.floats = {}
+        for name in FLOAT_COLUMNS:
+            self.floats[name] = _column(buf[pos : pos + 8 * count], "d")
+            pos += 8 * count
+        self.string_ids = {}
+        for name in STRING_COLUMNS:
+            self.string_ids[name] = _column(buf[pos : pos + 4 * count], "I")
+            pos += 4 * count
+        self.offsets = _column(buf[pos : pos + 4 * (n_strings + 1)], "I")
+        pos += 4 * (n_strings + 1)
+        self.blob = buf[pos : pos + blob_len]
+        self._strings: dict[int, str] = {}
+
+    def string(self, column: str, row: int) -> str | None:
+        idx = self.string_ids[column][row]
+        if idx == NO_STRING:
+            return None
+        cached = self._strings.get(idx)
+        if cached is None:
+            cached = self._strings[idx] = str(self.blob[self.offsets[idx] : self.offsets[idx + 1]], "utf-8")
+        return cached
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            CHUNK_HEADER.size
+            + 8 * self.count * len(FLOAT_COLUMNS)
+            + 4 * self.count * len(STRING_COLUMNS)
+            + 4 * len(self.offsets)
+            + len(self.blob)
+        )
+
+
+def _column(view: memoryview, typecode: str):
+    if _LITTLE_ENDIAN:
+        return view.cast(typecode)
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return values
+
+
+class CatalogTemplates(Sequence):
+    """Read-only sequence of ItemTemplates backed by a catalog buffer.
+
+    Templates are built on access, so a catalog of millions of items costs
+    only the buffer itself plus whatever templates are actually picked.
+    ``random.choice`` works on it exactly as on a list.
+    """
+
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        if bytes(view[: len(FILE_MAGIC)]) != FILE_MAGIC:
+            raise ValueError("Not an item catalog (bad magic)")
+        self._view = view
+        self._chunks: list[_Chunk] = []
+        self._starts: list[int] = []
+        total = 0
+        pos = len(FILE_MAGIC)
+        while pos < len(view):
+            chunk = _Chunk(view, pos)
+            self._chunks.append(chunk)
+            self._starts.append(total)
+            total += chunk.count
+            pos += chunk.nbytes
+            pos += _pad8(pos)
+        self._len = total
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("catalog index out of range")
+        chunk_idx = bisect_right(self._starts, index) - 1
+        chunk = self._chunks[chunk_idx]
+        row = index - self._starts[chunk_idx]
+        return self._template(chunk, row)
+
+    def _template(self, chunk: _Chunk, row: int):
+        from sim.item_database import ItemTemplate
+
+        attrs = chunk.string("attributes", row)
+        return ItemTemplate(
+            name=chunk.string("name", row) or "Unknown item",
+            category=chunk.string("category", row) or "misc",
+            era=chunk.string("era", row) or "unknown",
+            condition=chunk.floats["condition"][row],
+            rarity=chunk.floats["rarity"][row],
+            style_score=chunk.floats["style_score"][row],
+            true_value=chunk.floats["true_value"][row],
+            description=chunk.string("description", row) or "",
+            image=chunk.string("image", row),
+            attributes=json.loads(attrs) if attrs else {},
+        )
+
+    def tobytes(self) -> bytes:
+        """The catalog encoding this sequence reads from."""
+        return self._view.tobytes()
+
+    def release(self):
+        """Drop every view into the underlying buffer so it can be closed."""
+        self._chunks.clear()
+        self._starts.clear()
+        self._len = 0
+        self._view.release()
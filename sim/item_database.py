@@ -8,7 +8,7 @@ from typing import Iterable
 from models.item import Item
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemTemplate:
     name: str
     category: str
@@ -34,7 +34,8 @@ class ItemTemplate:
             shop_price=0.0,
             description=self.description,
             image_path=self.image,
-            attributes=dict(self.attributes),
+            attributes=self.attributes,
+            share_attributes=True,
         )
 
 
@@ -124,6 +125,42 @@ class ItemDatabase:
 
         return cls(templates)
 
+    @classmethod
+    def load_catalog(cls, path: Path) -> "ItemDatabase":
+        """Load templates from a binary catalog (see sim/item_catalog.py).
+
+        Templates are decoded lazily from the file contents, so even very
+        large generated catalogs load in a single read.
+        """
+
+        if not path.exists():
+            return cls([])
+        return cls.from_catalog_buffer(path.read_bytes())
+
+    @classmethod
+    def map_catalog(cls, path: Path) -> "ItemDatabase":
+        """Memory-map a binary catalog instead of reading it.
+
+        Pages are shared with every other process mapping the same file, so
+        this is the file-backed alternative to sim/shared_catalog.py.
+        """
+
+        import mmap
+
+        if not path.exists():
+            return cls([])
+        with path.open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_catalog_buffer(mapped)
+
+    @classmethod
+    def from_catalog_buffer(cls, buffer) -> "ItemDatabase":
+        from sim.item_catalog import CatalogTemplates
+
+        db = cls([])
+        db.templates = CatalogTemplates(buffer)
+        return db
+
     @classmethod
     def load_default(cls) -> "ItemDatabase":
         assets_dir = Path(__file__).resolve().parent.parent / "assets"
@@ -42,23 +42,21 @@ def _generate_fallback_item(rng, item_id: int, cfg: BalanceConfig | None = None)
 @dataclass
 class ItemFactory:
     database: ItemDatabase
+    # (source, file fingerprint) when the factory came from the dataset registry.
+    dataset_key: tuple | None = None
+    # SHA-256 of the dataset files' contents (set alongside dataset_key).
+    dataset_digest: str | None = None
 
     @classmethod
     def with_default_db(cls) -> "ItemFactory":
-        return cls(ItemDatabase.load_default())
+        return cls.from_source("assets")
 
     @classmethod
     def from_source(cls, source: str) -> "ItemFactory":
-        source = source.lower()
-        if source in {"default", "assets"}:
-            db = ItemDatabase.load_default()
-        elif source == "generated":
-            db = ItemDatabase.load_generated()
-        elif source == "combined":
-            db = ItemDatabase.load_combined()
-        else:
-            raise ValueError(f"Unknown item source '{source}'")
-        return cls(db)
+        """Return the registry-cached factory for a named dataset."""
+        from sim.dataset_registry import get_item_factory
+
+        return get_item_factory(source)
 
     def make_item(self, rng, item_id: int, cfg: BalanceConfig | None = None) -> Item:
         if self.database.templates:
@@ -66,19 +64,29 @@ class ItemFactory:
         return _generate_fallback_item(rng, item_id, cfg)
 
 
+_active_factory: ItemFactory | None = None
+
+
 def make_item(rng, item_id: int, cfg: BalanceConfig | None = None) -> Item:
-    """Convenience wrapper to avoid plumbing ItemFactory everywhere."""
-    if not hasattr(make_item, "_factory"):
-        make_item._factory = ItemFactory.with_default_db()
-    factory: ItemFactory = make_item._factory
-    return factory.make_item(rng, item_id, cfg)
+    """Convenience wrapper for callers that don't have an ItemFactory injected.
+
+    Prefer passing a factory explicitly (``Episode(item_factory=...)`` or
+    ``Market.generate(..., factory=...)``); this falls back to the dataset
+    chosen with `configure_item_factory`, or the bundled assets.
+    """
+    global _active_factory
+    if _active_factory is None:
+        _active_factory = ItemFactory.with_default_db()
+    return _active_factory.make_item(rng, item_id, cfg)
 
 
-def configure_item_factory(source: str):
-    """Set the global ItemFactory used by make_item.
+def configure_item_factory(source: str) -> ItemFactory:
+    """Select the dataset used by make_item.
 
-    This should be called during application startup to ensure the correct
-    dataset is used when generating items.
+    Catalogs come from the shared dataset registry, so switching back to a
+    source that was loaded before does not re-read it from disk.
     """
 
-    make_item._factory = ItemFactory.from_source(source)
+    global _active_factory
+    _active_factory = ItemFactory.from_source(source)
+    return _active_factory
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+from array import array
+from pathlib import Path
+
+import models.item
+import models.market
+import models.stall
+import sim.item_database
+import sim.item_factory
+import sim.pricing
+import sim.rng
+from models.item import _ITEM_FIELDS, Item
+from models.market import Market
+from models.stall import Stall
+from sim.balance_config import BalanceConfig
+from sim.item_factory import ItemFactory
+
+# Layout of the JSON entries below; the generator itself is versioned by
+# hashing its source (see _generator_digest).
+CACHE_FORMAT = 2
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "cache" / "markets"
+
+# Modules whose code decides what Market.generate produces: the generator,
+# make_item and the templates/fallback it draws from, set_shop_price, and
+# the RNG they all consume.
+GENERATOR_MODULES = (models.market, models.stall, models.item, sim.item_factory, sim.item_database, sim.pricing, sim.rng)
+
+_STALL_FIELDS = tuple(f for f in Stall.__dataclass_fields__ if f != "items")
+_DEFAULT_CONFIG: tuple[BalanceConfig, bytes] | None = None
+
+
+@functools.lru_cache(maxsize=None)
+def _generator_digest() -> bytes | None:
+    """Hash of the generator's source, so editing it retires old entries.
+
+    None when the source is unavailable (e.g. a frozen build); the cache is
+    then bypassed rather than trusted blindly.
+    """
+    h = hashlib.sha256()
+    for module in GENERATOR_MODULES:
+        try:
+            h.update(inspect.getsource(module).encode())
+        except (OSError, TypeError):
+            return None
+    return h.digest()
+
+
+def _config_digest(cfg: BalanceConfig | None) -> bytes:
+    # Serialising the config dominates key computation, and nearly every
+    # caller uses the defaults, so that digest is computed once.
+    global _DEFAULT_CONFIG
+    if _DEFAULT_CONFIG is None:
+        default = BalanceConfig()
+        _DEFAULT_CONFIG = (default, hashlib.sha256(default.to_json_str().encode()).digest())
+    if cfg is None or cfg == _DEFAULT_CONFIG[0]:
+        return _DEFAULT_CONFIG[1]
+    return hashlib.sha256(cfg.to_json_str().encode()).digest()
+
+
+def _template_index(templates) -> dict[tuple[int, int, int], int]:
+    """Map the objects an instantiated item shares with its template back to
+    the template's index."""
+    if not isinstance(templates, list):
+        # Lazily decoded catalogs build new template objects on every access.
+        return {}
+    return {
+        (id(t.name), id(t.description), id(t.attributes)): idx
+        for idx, t in reversed(list(enumerate(templates)))
+    }
+
+
+class MarketCache:
+    """On-disk, content-addressed cache of generated markets.
+
+    Entries are keyed by everything `Market.generate` depends on: the RNG
+    state before generation (i.e. the seed), the play area, a hash of the
+    item dataset's bytes, the balance config and the generator's source. A
+    hit restores the market and
+    moves the RNG to its post-generation state, so the rest of the episode
+    plays out exactly as if the market had been generated. Any input change
+    produces a new key, so stale entries are never read.
+
+    Entries are plain JSON. Items that are plain template instances are
+    stored as [template index, item id, shop price] rows and re-instantiated
+    on load, which is several times cheaper than decoding full items; the
+    dataset digest guarantees the indices refer to the same catalog.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_CACHE_DIR):
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+        self._index: tuple[str | None, dict] = (None, {})
+
+    def key(self, rng, play_rect, factory: ItemFactory | None, cfg: BalanceConfig | None = None) -> str | None:
+        # Factories built outside the dataset registry have no stable identity.
+        if factory is None or factory.dataset_digest is None:
+            return None
+        generator = _generator_digest()
+        if generator is None:
+            return None
+        h = hashlib.sha256()
+        h.update(repr(CACHE_FORMAT).encode())
+        h.update(generator)
+        version, internal, gauss_next = rng.getstate()
+        h.update(array("I", internal).tobytes())
+        h.update(repr((version, gauss_next)).encode())
+        h.update(repr(tuple(play_rect)).encode())
+        h.update(factory.dataset_digest.encode())
+        h.update(_config_digest(cfg))
+        return h.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def generate(self, rng, play_rect, factory: ItemFactory | None = None, cfg: BalanceConfig | None = None) -> Market:
+        """Return the market `Market.generate` would build, from cache if possible."""
+        key = self.key(rng, play_rect, factory, cfg)
+        if key is None:
+            return Market.generate(rng, play_rect, factory=factory, cfg=cfg)
+
+        path = self.path_for(key)
+        try:
+            market, rng_state = self._decode(path.read_bytes(), factory)
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            pass
+        else:
+            rng.setstate(rng_state)
+            self.hits += 1
+            return market
+
+        self.misses += 1
+        market = Market.generate(rng, play_rect, factory=factory, cfg=cfg)
+        self._store(path, self._encode(market, rng.getstate(), factory))
+        return market
+
+    def _encode(self, market: Market, rng_state, factory: ItemFactory) -> bytes:
+        index_key, index = self._index
+        if index_key != factory.dataset_digest:
+            index = _template_index(factory.database.templates)
+            self._index = (factory.dataset_digest, index)
+
+        templates = factory.database.templates
+        stalls = []
+        for stall in market.stalls:
+            rows = []
+            for it in stall.items:
+                idx = index.get((id(it.name), id(it.description), id(it._attributes)))
+                if idx is not None:
+                    row = [idx, it.item_id, it.shop_price]
+                    if self._restore_row(templates, row) == it:
+                        rows.append(row)
+                        continue
+                # Anything else (fallback items, edited copies) goes in full.
+                full = {name: getattr(it, name) for name in _ITEM_FIELDS}
+                full["attributes"] = it.attributes
+                rows.append(full)
+            entry = {name: getattr(stall, name) for name in _STALL_FIELDS}
+            entry["items"] = rows
+            stalls.append(entry)
+        version, internal, gauss_next = rng_state
+        entry = {
+            "format": CACHE_FORMAT,
+            "next_item_id": market._next_item_id,
+            "rng_state": [version, list(internal), gauss_next],
+            "stalls": stalls,
+        }
+        return json.dumps(entry, separators=(",", ":")).encode()
+
+    def _decode(self, data: bytes, factory: ItemFactory):
+        entry = json.loads(data)
+        if entry["format"] != CACHE_FORMAT:
+            raise ValueError("stale market cache entry")
+        templates = factory.database.templates
+        stalls = []
+        for fields in entry["stalls"]:
+            rows = fields.pop("items")
+            fields["rect"] = tuple(fields["rect"])
+            stall = Stall(**fields)
+            stall.items = [
+                self._restore_row(templates, row) if type(row) is list else Item(**row) for row in rows
+            ]
+            stalls.append(stall)
+        version, internal, gauss_next = entry["rng_state"]
+        rng_state = (version, tuple(internal), gauss_next)
+        return Market(stalls=stalls, _next_item_id=entry["next_item_id"]), rng_state
+
+    @staticmethod
+    def _restore_row(templates, row):
+        idx, item_id, shop_price = row
+        it = templates[idx].instantiate(item_id)
+        it.shop_price = shop_price
+        return it
+
+    def _store(self, path: Path, data: bytes):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            # Atomic, so concurrent runs never see a half-written entry.
+            os.replace(tmp, path)
+        except OSError:
+            # The cache is an optimisation; a read-only tree just means misses.
+            pass
+
+    def clear(self):
+        for entry in self.root.glob("*/*.json"):
+            entry.unlink(missing_ok=True)
@@ -1,24 +1,75 @@
+import hashlib
+import math
 import random
 
+
+def derive_seed(seed: int, *key) -> int:
+    """A seed for the substream `key` of `seed`, independent of how many
+    draws any other substream makes."""
+    digest = hashlib.blake2b(repr((seed,) + key).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
 class RNG:
     def __init__(self, seed: int):
         self._r = random.Random(seed)
+        # Draws made so far; part of the per-tick state hash (sim/state_hash.py).
+        self.calls = 0
+
+    @classmethod
+    def substream(cls, seed: int, *key):
+        return cls(derive_seed(seed, *key))
+
+    def getstate(self):
+        return self._r.getstate()
+
+    def setstate(self, state):
+        self._r.setstate(state)
 
     def random(self) -> float:
+        self.calls += 1
         return self._r.random()
 
     def uniform(self, a: float, b: float) -> float:
+        self.calls += 1
         return self._r.uniform(a, b)
 
     def randint(self, a: int, b: int) -> int:
+        self.calls += 1
         return self._r.randint(a, b)
 
     def choice(self, seq):
+        self.calls += 1
         return self._r.choice(seq)
 
     def shuffle(self, seq):
+        self.calls += 1
         self._r.shuffle(seq)
 
     def lognormal(self, mean: float = 0.0, sigma: float = 0.35) -> float:
         # Using underlying random.lognormvariate (mu, sigma)
+        self.calls += 1
         return self._r.lognormvariate(mean, sigma)
+
+    def lognormal_many(self, n: int, mean: float = 0.0, sigma: float = 0.35) -> list[float]:
+        # Same draws, in the same order, as n calls to lognormal().
+        self.calls += n
+        draw = self._r.lognormvariate
+        return [draw(mean, sigma) for _ in range(n)]
+
+
+class AntitheticRNG(RNG):
+    """The antithetic twin of RNG(seed): identical draws, except that every
+    lognormal is mirrored, exp(mean - sigma * z) where RNG(seed) gives
+    exp(mean + sigma * z). Averaging a run with its twin cancels the
+    odd-order part of the lognormal noise."""
+
+    def lognormal(self, mean: float = 0.0, sigma: float = 0.35) -> float:
+        self.calls += 1
+        # random.lognormvariate is exp(normalvariate(mean, sigma)).
+        return math.exp(2.0 * mean - self._r.normalvariate(mean, sigma))
+
+    def lognormal_many(self, n: int, mean: float = 0.0, sigma: float = 0.35) -> list[float]:
+        self.calls += n
+        draw = self._r.normalvariate
+        return [math.exp(2.0 * mean - draw(mean, sigma)) for _ in range(n)]
@@ -0,0 +1,104 @@
+"""Share one item catalog between simulation worker processes.
+
+The parent encodes the catalog once (see sim/item_catalog.py) and places it in
+a `multiprocessing.shared_memory` block. Workers attach by name and read the
+columns and string table straight out of the shared pages, so per-worker
+catalog memory is only the templates actually picked and worker startup does
+not depend on catalog size. A memory-mapped catalog file works the same way
+through `ItemDatabase.map_catalog`.
+"""
+
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+
+from sim.item_catalog import FILE_MAGIC, CatalogTemplates, encode_templates
+from sim.item_database import ItemDatabase
+from sim.item_factory import ItemFactory
+
+
+def catalog_bytes(db: ItemDatabase) -> bytes:
+    """Return the binary catalog encoding of an item database."""
+    if isinstance(db.templates, CatalogTemplates):
+        return db.templates.tobytes()
+    return FILE_MAGIC + encode_templates(db.templates)
+
+
+class SharedCatalog:
+    """Owner of a shared-memory catalog block.
+
+    Create it in the parent, hand `name` and `size` to the workers (for
+    example through `worker_initializer`), and call `close()` once the pool
+    has finished; the owner also unlinks the block.
+    """
+
+    def __init__(self, db: ItemDatabase):
+        data = catalog_bytes(db)
+        self._shm = shared_memory.SharedMemory(create=True, size=len(data))
+        self._shm.buf[: len(data)] = data
+        self.size = len(data)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self):
+        if self._shm is None:
+            return
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_shared(name: str, size: int) -> ItemDatabase:
+    """Attach to a catalog published by `SharedCatalog` without copying it.
+
+    `size` is `SharedCatalog.size`; the block itself may be rounded up to a
+    whole number of pages.
+    """
+    # Pool workers share the parent's resource tracker, and registering the
+    # same block twice is harmless, so attaching never unlinks anything; the
+    # owner's unlink() unregisters it. (Python 3.13+ can skip tracking.)
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+    db = ItemDatabase.from_catalog_buffer(shm.buf[:size])
+    db._shared_block = shm
+    return db
+
+
+def detach_shared(db: ItemDatabase):
+    """Release a database returned by `attach_shared`."""
+    shm = getattr(db, "_shared_block", None)
+    if shm is None:
+        return
+    db.templates.release()
+    db.templates = []
+    db._shared_block = None
+    shm.close()
+
+
+_worker_factory: ItemFactory | None = None
+
+
+def worker_initializer(name: str, size: int):
+    """`multiprocessing.Pool` initializer: attach the shared catalog once.
+
+    Use as ``Pool(n, initializer=worker_initializer, initargs=(shared.name, shared.size))``.
+    """
+    global _worker_factory
+    _worker_factory = ItemFactory(attach_shared(name, size), dataset_key=("shared", name))
+
+
+def worker_factory() -> ItemFactory:
+    """The ItemFactory attached by `worker_initializer` in this process."""
+    if _worker_factory is None:
+        raise RuntimeError("No shared catalog attached; use worker_initializer")
+    return _worker_factory
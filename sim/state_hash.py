@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import struct
+from array import array
+from pathlib import Path
+
+# Positions and money are hashed as integers at this resolution, so float
+# noise far below what the game can show does not count as divergence.
+POSITION_SCALE = 1000
+MONEY_SCALE = 100
+
+_TEAM = struct.Struct("<qqqqiqb")  # x, y, budget, expert budget, item count, expert pick, included
+_HEADER = struct.Struct("<qi")  # rng draws, market stock
+
+
+def _scaled(value: float, scale: int) -> int:
+    return round(value * scale)
+
+
+def _rng_calls(episode) -> int:
+    return getattr(episode.rng, "calls", 0)
+
+
+class StateHasher:
+    """Rolling hash of an Episode's state after every market tick and event.
+
+    Attach as `Episode.hasher` after `setup()`. Each entry hashes rounded
+    team positions, budgets, item counts and market state, the expert pick
+    and whether it is included, the market's stock count and the number of
+    RNG draws since attaching; event entries also hash every held item with
+    what was paid and the hammer price. Entries are chained with the
+    previous entry (blake2b, 8 bytes). Because the chain carries every
+    earlier difference, two runs agree up to some entry and differ from it
+    on, so the first divergence can be found by binary search
+    (`first_divergence`). Entries live in an array('Q') with a label per
+    non-tick entry, so a long market costs 8 bytes per tick.
+
+    With `capture_at`, the structural state (`capture_state`) at that
+    entry is kept in `captured`, for diffing two runs at a divergence.
+    """
+
+    def __init__(self, capture_at: int | None = None):
+        self.hashes = array("Q")
+        self.labels: dict[int, str] = {}
+        self.capture_at = capture_at
+        self.captured: dict | None = None
+        self._prev = b"\0" * 8
+        self._rng_base: int | None = None
+
+    def _push(self, episode, label: str | None, full: bool):
+        if self._rng_base is None:
+            self._rng_base = _rng_calls(episode)
+        buf = bytearray(self._prev)
+        buf += _HEADER.pack(_rng_calls(episode) - self._rng_base, sum(len(st.items) for st in episode.market.stalls))
+        for team in episode.teams:
+            items = team.items_bought
+            pick = team.expert_pick_item
+            included = -1 if team.expert_pick_included is None else int(team.expert_pick_included)
+            buf += _TEAM.pack(
+                _scaled(team.x, POSITION_SCALE),
+                _scaled(team.y, POSITION_SCALE),
+                _scaled(team.budget_left, MONEY_SCALE),
+                _scaled(team.expert_pick_budget, MONEY_SCALE),
+                len(items),
+                pick.item_id if pick is not None else -1,
+                included,
+            )
+            buf += team.market_state.encode()
+            if full:
+                held = items + [pick] if pick is not None else items
+                values = array("q")
+                for it in held:
+                    values.extend((it.item_id, _scaled(it.shop_price, MONEY_SCALE), _scaled(it.auction_price, MONEY_SCALE)))
+                buf += values.tobytes()
+        self._prev = hashlib.blake2b(buf, digest_size=8).digest()
+        if label is not None:
+            self.labels[len(self.hashes)] = label
+        if self.capture_at == len(self.hashes):
+            self.captured = capture_state(episode, self._rng_base)
+        self.hashes.append(int.from_bytes(self._prev, "little"))
+
+    # -- hooks called by Episode ----------------------------------------
+    def tick(self, episode):
+        # Ticks leave out the held items: a purchase already shows in the
+        # budget, item count and stock, and the next checkpoint hashes them.
+        self._push(episode, None, full=False)
+
+    def checkpoint(self, episode, label: str):
+        self._push(episode, label, full=True)
+
+    # -- inspection -----------------------------------------------------
+    def label_at(self, index: int) -> str:
+        """The event at `index`, or the market tick number counted since
+        the last labelled entry."""
+        starts = sorted(k for k in self.labels if k <= index)
+        if starts and starts[-1] == index:
+            return self.labels[index]
+        since = starts[-1] if starts else -1
+        after = f" after {self.labels[since]}" if starts else ""
+        return f"tick {index - since}{after}"
+
+    def save(self, path: str | Path):
+        path = Path(path)
+        path.write_bytes(self.hashes.tobytes())
+        path.with_suffix(path.suffix + ".json").write_text(json.dumps({str(k): v for k, v in self.labels.items()}))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "StateHasher":
+        path = Path(path)
+        hasher = cls()
+        hasher.hashes.frombytes(path.read_bytes())
+        labels_path = path.with_suffix(path.suffix + ".json")
+        if labels_path.exists():
+            hasher.labels = {int(k): v for k, v in json.loads(labels_path.read_text()).items()}
+        return hasher
+
+
+def first_divergence(a, b) -> int | None:
+    """Index of the first differing entry of two rolling hash streams, or
+    None if they agree (a stream that stops early diverges where it ends)."""
+    n = min(len(a), len(b))
+    # Entries match up to the divergence and differ from it on.
+    idx = bisect.bisect_left(range(n), True, key=lambda i: a[i] != b[i])
+    if idx < n:
+        return idx
+    return None if len(a) == len(b) else n
+
+
+def capture_state(episode, rng_base: int = 0) -> dict:
+    """The hashed state as plain data, plus a little context for reading it."""
+    return {
+        "rng_calls": _rng_calls(episode) - rng_base,
+        "market_stock": {st.stall_id: [it.item_id for it in st.items] for st in episode.market.stalls},
+        "teams": [
+            {
+                "name": team.name,
+                "pos": (round(team.x, 3), round(team.y, 3)),
+                "budget_left": round(team.budget_left, 2),
+                "expert_pick_budget": round(team.expert_pick_budget, 2),
+                "items": [(it.item_id, round(it.shop_price, 2), round(it.auction_price, 2)) for it in team.items_bought],
+                "expert_pick": team.expert_pick_item.item_id if team.expert_pick_item is not None else None,
+                "expert_pick_included": team.expert_pick_included,
+                "market_state": team.market_state,
+                "target_stall_id": team.target_stall_id,
+                "last_action": team.last_action,
+            }
+            for team in episode.teams
+        ],
+    }
+
+
+def diff_states(a, b, path: str = "") -> list[str]:
+    """Structural differences between two captured states, as `path: a != b`."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        out = []
+        for key in list(a) + [k for k in b if k not in a]:
+            sub = f"{path}.{key}" if path else str(key)
+            if key not in a or key not in b:
+                out.append(f"{sub}: {a.get(key, '<missing>')!r} != {b.get(key, '<missing>')!r}")
+            else:
+                out.extend(diff_states(a[key], b[key], sub))
+        return out
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)) and len(a) == len(b):
+        out = []
+        for idx, (x, y) in enumerate(zip(a, b)):
+            out.extend(diff_states(x, y, f"{path}[{idx}]"))
+        return out
+    return [] if a == b else [f"{path}: {a!r} != {b!r}"]
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import copy
+from array import array
+from dataclasses import dataclass, field
+
+from config import GameConfig
+from sim.episode_events import EpisodeListener, EventFanout
+
+# Timeline seconds given to each post-market beat, so the whole episode can
+# be scrubbed on one axis. They roughly match how long the live screens
+# spend on each beat.
+HANDOFF_SECONDS = 2.5
+EXPERT_SHOPPING_SECONDS = 2.8
+APPRAISAL_SECONDS = 1.0
+LOT_SECONDS = 6.0
+REVEAL_SECONDS = 6.6
+RESULTS_SECONDS = 1.0
+
+PHASES = (
+    "MARKET",
+    "EXPERT_HANDOFF",
+    "EXPERT_SHOPPING",
+    "APPRAISAL",
+    "AUCTION_TEAM",
+    "EXPERT_REVEAL",
+    "AUCTION_EXPERT",
+    "RESULTS",
+)
+
+
+@dataclass(slots=True)
+class TimelineEvent:
+    """One state change. Fields not used by an event kind keep their defaults.
+
+    kinds: purchase (item bought at `value`, listed at `extra`, budget left
+    `budget`), reserve (`value` handed to the expert), expert_pick (`item_id`
+    or -1, estimate `value`, budget left `budget`), expert_choice (`flag` =
+    included, score `value`), appraisal (`value`), sale (`value`), results.
+    """
+
+    t: float
+    kind: str
+    team: int = -1
+    item_id: int = -1
+    stall_id: int = -1
+    value: float = 0.0
+    extra: float = 0.0
+    budget: float = 0.0
+    flag: bool = False
+
+
+@dataclass
+class Timeline:
+    """Everything needed to play an episode back without simulating it.
+
+    Market motion is stored as frames sampled every `sample_dt` sim seconds:
+    per team x, y and each member's position (float32), plus its market
+    state, last action (indices into `strings`) and target stall. All other
+    state changes are `events`, ordered by time.
+    """
+
+    seed: int
+    ep_idx: int
+    sample_dt: float
+    member_keys: list[list[str]]
+    frame_times: array = field(default_factory=lambda: array("d"))
+    positions: array = field(default_factory=lambda: array("f"))
+    states: array = field(default_factory=lambda: array("i"))
+    strings: list[str] = field(default_factory=list)
+    events: list[TimelineEvent] = field(default_factory=list)
+    phase_starts: dict[str, float] = field(default_factory=dict)
+    duration: float = 0.0
+
+    @property
+    def market_end(self) -> float:
+        return self.phase_starts.get("EXPERT_HANDOFF", self.duration)
+
+    def position_stride(self) -> int:
+        return sum(2 + 2 * len(keys) for keys in self.member_keys)
+
+    def phase_at(self, t: float) -> str:
+        current = PHASES[0]
+        for phase in PHASES:
+            start = self.phase_starts.get(phase)
+            if start is not None and start <= t:
+                current = phase
+        return current
+
+
+class _Recorder(EpisodeListener):
+    """Turns the episode's hook calls into timeline events at time `t`,
+    which `record_episode` advances beat by beat."""
+
+    def __init__(self, episode, sample_dt: float):
+        self.episode = episode
+        self.t = 0.0
+        self.timeline = Timeline(
+            seed=episode.seed,
+            ep_idx=episode.ep_idx,
+            sample_dt=sample_dt,
+            member_keys=[[m.key for m in team.members] for team in episode.teams],
+        )
+        self._string_ids: dict[str, int] = {}
+        self._team_ids = {id(team): idx for idx, team in enumerate(episode.teams)}
+        self._stalls = {it.item_id: st.stall_id for st in episode.market.stalls for it in st.items}
+
+    def _string(self, text: str) -> int:
+        idx = self._string_ids.get(text)
+        if idx is None:
+            idx = self._string_ids[text] = len(self.timeline.strings)
+            self.timeline.strings.append(text)
+        return idx
+
+    def event(self, kind: str, **fields):
+        self.timeline.events.append(TimelineEvent(self.t, kind, **fields))
+
+    def phase(self, name: str, t: float):
+        self.timeline.phase_starts[name] = t
+
+    def sample(self, t: float):
+        tl = self.timeline
+        tl.frame_times.append(t)
+        for team, keys in zip(self.episode.teams, tl.member_keys):
+            tl.positions.extend((team.x, team.y))
+            for key in keys:
+                tl.positions.extend(team.member_pos(key))
+            target = team.target_stall_id if team.target_stall_id is not None else -1
+            tl.states.extend((self._string(team.market_state or ""), self._string(team.last_action or ""), target))
+
+    # -- hooks called by Episode ----------------------------------------
+    def purchase(self, team, stall, item, listed: float, discount: float):
+        self.event(
+            "purchase",
+            team=self._team_ids[id(team)],
+            item_id=item.item_id,
+            stall_id=stall.stall_id,
+            value=item.shop_price,
+            extra=listed,
+            budget=team.budget_left,
+            flag=item.was_negotiated,
+        )
+
+    def reserve(self, team):
+        self.event("reserve", team=self._team_ids[id(team)], value=team.expert_pick_budget)
+
+    def expert_pick(self, team, pick):
+        idx = self._team_ids[id(team)]
+        if pick is None:
+            self.event("expert_pick", team=idx, value=0.0, budget=team.expert_pick_budget)
+            return
+        self.event(
+            "expert_pick",
+            team=idx,
+            item_id=pick.item_id,
+            stall_id=self._stalls.get(pick.item_id, -1),
+            value=pick.attributes["expert_estimate"],
+            extra=pick.shop_price,
+            budget=team.expert_pick_budget,
+        )
+
+    def appraisal(self, team, item):
+        self.event("appraisal", team=self._team_ids[id(team)], item_id=item.item_id, value=item.appraised_value)
+
+    def expert_choice(self, team, include: bool, score: float = 0.0):
+        self.event(
+            "expert_choice", team=self._team_ids[id(team)], item_id=team.expert_pick_item.item_id, value=score, flag=include
+        )
+
+    def sale(self, stage: str, lot, price: float):
+        # Each lot gets its own beat; the hammer falls at its end.
+        self.t += LOT_SECONDS
+        self.event("sale", team=self._team_ids[id(lot.team)], item_id=lot.item.item_id, value=price, flag=lot.is_bonus)
+
+    def results(self, episode):
+        self.event("results")
+
+
+def record_episode(
+    episode,
+    cfg: GameConfig | None = None,
+    *,
+    sample_every: int = 3,
+    progress=None,
+    market_time_left: float | None = None,
+) -> Timeline:
+    """Simulate a set-up episode to the end, headless, and return its timeline.
+
+    Runs the same steps in the same order as GameState does live (fixed
+    market steps, expert hand-off, appraisal, both auctions, the automated
+    expert reveal), so the recorded outcome matches a live run of the same
+    seed. `progress`, if given, is called with the sim time reached. Pass
+    `market_time_left` to carry on an episode restored mid-market, and
+    `sample_every=0` when only the outcome matters.
+
+    Events come from the episode's listener hooks, alongside any listener
+    already attached (e.g. a binary EpisodeRecorder), which keeps receiving
+    them.
+    """
+    cfg = cfg or episode.cfg or GameConfig()
+    rec = _Recorder(episode, sample_dt=cfg.sim_step_s * sample_every)
+    attached = episode.recorder
+    episode.recorder = rec if attached is None else EventFanout(attached, rec)
+    try:
+        _simulate(episode, cfg, rec, sample_every, progress, market_time_left)
+    finally:
+        episode.recorder = attached
+    return rec.timeline
+
+
+def _simulate(episode, cfg: GameConfig, rec: _Recorder, sample_every: int, progress, market_time_left: float | None):
+    step = cfg.sim_step_s
+
+    time_left = cfg.market_seconds if market_time_left is None else market_time_left
+    t = cfg.market_seconds - time_left
+    rec.phase("MARKET", t)
+    rec.sample(t)
+    n = 0
+    while True:
+        time_left -= step
+        t += step
+        n += 1
+        rec.t = t
+        episode.update_market_ai(step, cfg=cfg)
+        if sample_every and n % sample_every == 0:
+            rec.sample(t)
+            if progress is not None and n % (sample_every * 300) == 0:
+                progress(t)
+        if time_left <= 0 or all(len(team.team_items) >= cfg.items_per_team for team in episode.teams):
+            break
+    if sample_every and n % sample_every:
+        rec.sample(t)
+
+    rec.phase("EXPERT_HANDOFF", t)
+    rec.t = t
+    episode.reserve_expert_budget()
+    t += HANDOFF_SECONDS
+
+    rec.phase("EXPERT_SHOPPING", t)
+    rec.t = t
+    episode.prepare_expert_picks()
+    t += EXPERT_SHOPPING_SECONDS
+
+    rec.phase("APPRAISAL", t)
+    rec.t = t
+    episode.start_appraisal()
+    t += APPRAISAL_SECONDS
+
+    rec.phase("AUCTION_TEAM", t)
+    rec.t = t
+    episode.start_team_auction()
+    episode.sell_remaining_lots()
+    t = rec.t
+
+    rec.phase("EXPERT_REVEAL", t)
+    for team in episode.teams:
+        if not team.expert_pick_item or team.expert_pick_included is not None:
+            continue
+        rec.t = t
+        decision = episode.decide_expert_pick(team)
+        episode.mark_expert_choice(team, decision.include, decision.score)
+        t += REVEAL_SECONDS
+
+    if episode.has_included_expert_items():
+        rec.phase("AUCTION_EXPERT", t)
+        rec.t = t
+        episode.start_expert_auction()
+        episode.sell_remaining_lots()
+        t = rec.t
+
+    rec.phase("RESULTS", t)
+    rec.t = t
+    episode.compute_results()
+    rec.timeline.duration = t + RESULTS_SECONDS
+
+
+def episode_memo(episode) -> dict:
+    """deepcopy memo that shares an episode's read-only heavy parts."""
+    memo = {}
+    for shared in (episode.item_factory, episode.market_cache, episode.cfg, episode.balance):
+        if shared is not None:
+            memo[id(shared)] = shared
+    # A copy must not write into the original's event log or hash stream.
+    for owned in (episode.recorder, episode.hasher):
+        if owned is not None:
+            memo[id(owned)] = None
+    return memo
+
+
+class TimelinePlayer:
+    """Rebuilds the episode as it was at any timeline time.
+
+    `view` is a single Episode object that screens can hold on to. Seeking
+    forward applies the events in between; seeking backwards restores the
+    pristine start state (a deep copy taken before simulation) and replays
+    events from the beginning, which is cheap because an episode has only a
+    few dozen events. No AI or RNG runs during playback.
+    """
+
+    def __init__(self, timeline: Timeline, initial_episode):
+        self.timeline = timeline
+        self._pristine = initial_episode
+        self.view = copy.deepcopy(initial_episode, episode_memo(initial_episode))
+        self.t = 0.0
+        self._cursor = 0
+        self._items = {}
+        self._reset()
+
+    def _reset(self):
+        fresh = copy.deepcopy(self._pristine, episode_memo(self._pristine))
+        self.view.__dict__.update(fresh.__dict__)
+        self.view.auction_queue = []
+        self.view.auction_cursor = 0
+        self._items = {it.item_id: it for it in self.view.market.all_remaining_items()}
+        self._cursor = 0
+        self.t = 0.0
+
+    @property
+    def phase(self) -> str:
+        return self.timeline.phase_at(self.t)
+
+    def seek(self, t: float):
+        t = max(0.0, min(self.timeline.duration, t))
+        if t < self.t:
+            self._reset()
+        events = self.timeline.events
+        while self._cursor < len(events) and events[self._cursor].t <= t:
+            self._apply(events[self._cursor])
+            self._cursor += 1
+        self.t = t
+        self._apply_frame(t)
+
+    def item(self, item_id: int):
+        """The view's copy of an item that was in the market at the start."""
+        return self._items.get(item_id)
+
+    def events_until(self, t: float | None = None) -> list[TimelineEvent]:
+        t = self.t if t is None else t
+        return [e for e in self.timeline.events if e.t <= t]
+
+    def _apply_frame(self, t: float):
+        tl = self.timeline
+        times = tl.frame_times
+        if not times:
+            return
+        t = min(t, tl.market_end)
+        # Frames are evenly spaced from the first one, except possibly the last.
+        idx = max(0, min(len(times) - 1, int((t - times[0]) / tl.sample_dt)))
+        nxt = min(len(times) - 1, idx + 1)
+        span = times[nxt] - times[idx]
+        alpha = (t - times[idx]) / span if span > 0 else 0.0
+        alpha = max(0.0, min(1.0, alpha))
+
+        stride = tl.position_stride()
+        pos, states = tl.positions, tl.states
+        base, nbase = idx * stride, nxt * stride
+        sbase = idx * 3 * len(self.view.teams)
+        for team_idx, (team, keys) in enumerate(zip(self.view.teams, tl.member_keys)):
+            coords = [a + (b - a) * alpha for a, b in zip(pos[base : base + 2 + 2 * len(keys)], pos[nbase : nbase + 2 + 2 * len(keys)])]
+            team.x, team.y = coords[0], coords[1]
+            for k, key in enumerate(keys):
+                team.member_positions[key] = (coords[2 + 2 * k], coords[3 + 2 * k])
+            base += 2 + 2 * len(keys)
+            nbase += 2 + 2 * len(keys)
+
+            state_idx, action_idx, target = states[sbase + 3 * team_idx : sbase + 3 * team_idx + 3]
+            team.market_state = tl.strings[state_idx]
+            if t < tl.market_end:
+                team.last_action = tl.strings[action_idx]
+            team.target_stall_id = target if target >= 0 else None
+            team.decision_context = None
+
+    def _apply(self, ev: TimelineEvent):
+        view = self.view
+        team = view.teams[ev.team] if ev.team >= 0 else None
+        item = self._items.get(ev.item_id)
+        if ev.kind == "purchase":
+            view.market.remove_item(item)
+            item.shop_price = ev.value
+            item.was_negotiated = ev.flag
+            team.items_bought.append(item)
+            team.budget_left = ev.budget
+        elif ev.kind == "reserve":
+            team.expert_pick_budget = ev.value
+            team.budget_left = 0.0
+            team.expert_pick_item = None
+            team.expert_pick_included = False if ev.value < view.expert_min_budget else None
+            team.last_action = f"Reserved ${ev.value:0.0f} for expert"
+        elif ev.kind == "expert_pick":
+            team.expert_pick_budget = ev.budget
+            if item is None:
+                team.expert_pick_included = False
+                team.last_action = "Expert couldn't find an item"
+                return
+            view.market.remove_item(item)
+            item.is_expert_pick = True
+            item.shop_price = ev.extra
+            item.attributes["expert_estimate"] = ev.value
+            team.expert_pick_item = item
+            team.last_action = "Expert bought a secret item"
+        elif ev.kind == "expert_choice":
+            view.mark_expert_choice(team, ev.flag)
+        elif ev.kind == "appraisal":
+            item.appraised_value = ev.value
+        elif ev.kind == "sale":
+            item.auction_price = ev.value
+            team.last_action = f"Sold {item.name} for ${ev.value:0.0f}"
+        elif ev.kind == "results":
+            view.compute_results()
@@ -0,0 +1,206 @@
+"""Paired comparisons of two balance configs with variance reduction.
+
+`run_headless` gives each config its own random stream, so the noise in
+the two reports adds up and small effects need very many runs.
+`compare_configs` applies three standard tools instead:
+
+* Common random numbers. Episode `i` of both configs draws from the same
+  substreams (`RNG.substream(seed, i, ...)`, one per item and purpose; see
+  `run_episode(streams=...)`). The two arms see the same items, houses
+  and noise, and only the config differs.
+* Antithetic variates. Each episode also runs with `AntitheticRNG`, which
+  mirrors every lognormal draw (sell, appraise, estimate_value and the
+  fallback true value). The pair average is one sample.
+* A control variate. An episode's total true value is the same for both
+  arms, has a known mean (exact for a template catalog) and tracks the
+  size of most money effects. It is regressed out of each paired
+  difference.
+
+The report gives each metric's difference with a confidence interval. It
+also gives `efficiency`: how many times more episodes independent runs
+would need for the same interval width.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from statistics import NormalDist, fmean
+
+from models.auction_house import AuctionHouse
+from models.auctioneer import Auctioneer
+from sim.balance_config import BalanceConfig
+from sim.headless_balance_runner import EpisodeResult, _default_teams, run_episode
+from sim.item_factory import ItemFactory
+from sim.rng import RNG, AntitheticRNG
+
+METRICS = ("team_profit", "lot_profit", "auction_ratio", "gavel_rate")
+
+
+def episode_metrics(ep: EpisodeResult) -> dict[str, float]:
+    lots = [lot for tr in ep.team_results for lot in tr.lots]
+    return {
+        "team_profit": fmean(tr.profit_total for tr in ep.team_results),
+        "lot_profit": fmean(lot.profit for lot in lots),
+        "auction_ratio": fmean(lot.sold / lot.paid for lot in lots if lot.paid),
+        "gavel_rate": 1.0 if ep.gavel_awarded else 0.0,
+    }
+
+
+def expected_true_value(factory: ItemFactory, cfg: BalanceConfig, samples: int = 20000, seed: int = 0) -> float:
+    """Mean true value of a made item: exact for a template catalog (picked
+    uniformly), otherwise estimated from `samples` cheap item draws."""
+    templates = factory.database.templates
+    if templates:
+        return fmean(t.true_value for t in templates)
+    rng = RNG(seed)
+    return fmean(factory.make_item(rng, i, cfg).true_value for i in range(samples))
+
+
+def _var(xs: list[float]) -> float:
+    if len(xs) < 2:
+        return 0.0
+    mu = fmean(xs)
+    return sum((x - mu) ** 2 for x in xs) / (len(xs) - 1)
+
+
+def _cov(xs: list[float], ys: list[float]) -> float:
+    if len(xs) < 2:
+        return 0.0
+    mx, my = fmean(xs), fmean(ys)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / (len(xs) - 1)
+
+
+@dataclass(frozen=True)
+class PairedMetric:
+    name: str
+    mean_a: float
+    mean_b: float
+    diff: float
+    ci_low: float
+    ci_high: float
+    stderr: float
+    # Independent-stream variance per episode over this method's.
+    efficiency: float
+
+    @property
+    def significant(self) -> bool:
+        return self.ci_low > 0 or self.ci_high < 0
+
+
+@dataclass
+class PairedReport:
+    runs: int
+    episodes_simulated: int
+    confidence: float
+    antithetic: bool
+    control_variate: bool
+    metrics: dict[str, PairedMetric]
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        for name, metric in self.metrics.items():
+            data["metrics"][name]["significant"] = metric.significant
+        return data
+
+
+def _run_arm(cfg: BalanceConfig, rng_cls, seed: int, episode: int, teams, factory, options: dict) -> EpisodeResult:
+    def streams(*key):
+        return rng_cls.substream(seed, episode, *key)
+
+    auctioneer = Auctioneer(
+        name="Headless Auctioneer", accuracy=cfg.auctioneer.default_accuracy, bias=cfg.auctioneer.bias_by_category
+    )
+    return run_episode(
+        streams("episode"),
+        teams=teams,
+        factory=factory,
+        auctioneer=auctioneer,
+        auction_house=AuctionHouse.generate(streams("house"), cfg=cfg),
+        cfg=cfg,
+        streams=streams,
+        **options,
+    )
+
+
+def compare_configs(
+    cfg_a: BalanceConfig,
+    cfg_b: BalanceConfig,
+    *,
+    runs: int = 200,
+    seed: int = 42,
+    antithetic: bool = True,
+    control_variate: bool = True,
+    confidence: float = 0.95,
+    item_factory: ItemFactory | None = None,
+    pricing_style: str = "fair",
+    items_per_team: int = 3,
+    negotiate_chance: float = 0.18,
+    negotiate_min: float = 0.05,
+    negotiate_max: float = 0.20,
+) -> PairedReport:
+    """Estimate metric(cfg_b) - metric(cfg_a) from `runs` paired episodes
+    (twice as many per arm with `antithetic`)."""
+    factory = item_factory or ItemFactory.with_default_db()
+    teams = _default_teams(RNG(seed))
+    options = dict(
+        runs_per_team=items_per_team,
+        pricing_style=pricing_style,
+        negotiate_chance=negotiate_chance,
+        negotiate_min=negotiate_min,
+        negotiate_max=negotiate_max,
+    )
+    twins = (RNG, AntitheticRNG) if antithetic else (RNG,)
+
+    a_vals = {m: [] for m in METRICS}
+    b_vals = {m: [] for m in METRICS}
+    # Plain (non-antithetic) episodes, for the independent-streams baseline.
+    a_plain = {m: [] for m in METRICS}
+    b_plain = {m: [] for m in METRICS}
+    control: list[float] = []
+    for episode in range(runs):
+        a_eps = [episode_metrics(_run_arm(cfg_a, cls, seed, episode, teams, factory, options)) for cls in twins]
+        b_runs = [_run_arm(cfg_b, cls, seed, episode, teams, factory, options) for cls in twins]
+        b_eps = [episode_metrics(ep) for ep in b_runs]
+        control.append(fmean(ep.true_value_total for ep in b_runs))
+        for m in METRICS:
+            a_vals[m].append(fmean(ep[m] for ep in a_eps))
+            b_vals[m].append(fmean(ep[m] for ep in b_eps))
+            a_plain[m].append(a_eps[0][m])
+            b_plain[m].append(b_eps[0][m])
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    per_episode = len(twins)
+    centred: list[float] | None = None
+    if control_variate:
+        mu_x = expected_true_value(factory, cfg_b, seed=seed) * items_per_team * len(teams)
+        centred = [x - mu_x for x in control]
+
+    metrics: dict[str, PairedMetric] = {}
+    for m in METRICS:
+        diffs = [b - a for a, b in zip(a_vals[m], b_vals[m])]
+        mean_a, mean_b = fmean(a_vals[m]), fmean(b_vals[m])
+        if centred is not None and _var(centred) > 0:
+            beta = _cov(diffs, centred) / _var(centred)
+            diffs = [d - beta * c for d, c in zip(diffs, centred)]
+            # Adjust the arm means the same way, each with its own slope.
+            mean_a -= _cov(a_vals[m], centred) / _var(centred) * fmean(centred)
+            mean_b -= _cov(b_vals[m], centred) / _var(centred) * fmean(centred)
+        diff = fmean(diffs)
+        var_paired = _var(diffs)
+        stderr = (var_paired / runs) ** 0.5
+        # Same episode budget spent on independent runs of each arm.
+        var_independent = (_var(a_plain[m]) + _var(b_plain[m])) / per_episode
+        if var_paired > 0:
+            efficiency = var_independent / var_paired
+        else:
+            efficiency = float("inf") if var_independent > 0 else 1.0
+        metrics[m] = PairedMetric(m, mean_a, mean_b, diff, diff - z * stderr, diff + z * stderr, stderr, efficiency)
+
+    return PairedReport(
+        runs=runs,
+        episodes_simulated=2 * runs * per_episode,
+        confidence=confidence,
+        antithetic=antithetic,
+        control_variate=control_variate,
+        metrics=metrics,
+    )
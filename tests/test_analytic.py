@@ -0,0 +1,114 @@
+import math
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from models.auction_house import AuctionHouse
+from models.auctioneer import Auctioneer
+from models.item import Item
+from sim.analytic import (
+    ClampedLognormal,
+    appraisal_distribution,
+    item_outlook,
+    mixture_cdf,
+    sale_components,
+    team_profit_distribution,
+    validate_against_monte_carlo,
+)
+from sim.rng import RNG
+
+
+def _item(item_id: int, true_value: float, shop_price: float, category: str = "clocks") -> Item:
+    return Item(
+        item_id=item_id,
+        name=f"Item {item_id}",
+        category=category,
+        era="modern",
+        condition=0.6,
+        rarity=0.3,
+        style_score=0.5,
+        true_value=true_value,
+        shop_price=shop_price,
+    )
+
+
+def test_clamped_lognormal_reduces_to_the_lognormal_and_to_its_clamps():
+    wide = ClampedLognormal(scale=10.0, k=1.3, sigma=0.3, lo=1e-9, hi=1e9)
+    assert math.isclose(wide.mean(), 10.0 * 1.3 * math.exp(0.045), rel_tol=1e-9)
+    assert math.isclose(wide.variance(), (10.0 * 1.3) ** 2 * math.exp(0.09) * (math.exp(0.09) - 1), rel_tol=1e-9)
+
+    pinned = ClampedLognormal(scale=10.0, k=50.0, sigma=0.3, lo=0.5, hi=2.0)
+    assert math.isclose(pinned.mean(), 20.0, rel_tol=1e-9) and pinned.variance() < 1e-9
+    assert pinned.cdf(19.99) == 0.0 and pinned.cdf(20.0) == 1.0
+
+
+def test_item_outlook_for_a_known_house_matches_its_sales():
+    house = AuctionHouse({"clocks": 1.1}, mood="cold")
+    item = _item(1, 150.0, 120.0)
+    outlook = item_outlook(item, house=house)
+    rng = RNG(9)
+    prices = [house.sell(item, rng) for _ in range(20000)]
+    mean = sum(prices) / len(prices)
+    assert abs(mean - outlook.expected_price) < 4 * outlook.std / math.sqrt(len(prices))
+    assert abs(sum(p < 120.0 for p in prices) / len(prices) - outlook.p_loss) < 0.015
+
+    appraisal = appraisal_distribution(item, Auctioneer("A", accuracy=0.8))
+    rng = RNG(10)
+    estimates = [Auctioneer("A", accuracy=0.8).appraise(item, rng) for _ in range(20000)]
+    assert abs(sum(estimates) / len(estimates) - appraisal.mean()) < 4 * math.sqrt(appraisal.variance() / len(estimates))
+
+
+def test_team_distributions_agree_with_monte_carlo():
+    teams = [
+        [_item(1, 80.0, 60.0), _item(2, 200.0, 210.0, "toys"), _item(3, 40.0, 25.0)],
+        [_item(4, 120.0, 90.0, "books"), _item(5, 65.0, 70.0, "books")],
+    ]
+    grid = team_profit_distribution(teams[0])
+    assert math.isclose(sum(grid.probs), 1.0, abs_tol=1e-9)
+    expected = sum(item_outlook(it).expected_profit for it in teams[0])
+    assert abs(grid.mean() - expected) < 0.05
+    assert grid.quantile(0.1) < grid.mean() < grid.quantile(0.9)
+
+    rows = validate_against_monte_carlo(teams, samples=6000, seed=2)
+    assert len(rows) == 3 * (5 + 2)
+    assert max(abs(row.z) for row in rows) < 4.5
+
+
+def test_worthless_items_are_a_point_mass_at_the_floor():
+    item = _item(6, 0.0, 5.0)
+    house = AuctionHouse({"clocks": 1.1}, mood="cold")
+    outlook = item_outlook(item, house=house)
+    assert outlook.expected_price == house.sell(item, RNG(3)) == 1.0
+    assert outlook.variance == 0.0 and outlook.p_loss == 1.0
+
+    appraisal = appraisal_distribution(item, Auctioneer("A", accuracy=0.8))
+    assert appraisal.mean() == Auctioneer("A", accuracy=0.8).appraise(item, RNG(4)) == 1.0
+    assert appraisal.cdf(0.99) == 0.0 and appraisal.cdf(1.0) == 1.0
+
+    grid = team_profit_distribution([item], step=0.5)
+    assert math.isclose(sum(grid.probs), 1.0) and grid.mean() == -4.0
+
+
+def test_sub_unit_items_match_their_sales_and_appraisals():
+    house = AuctionHouse({"clocks": 1.1}, mood="cold")
+    cheap = _item(8, 0.2, 0.1)
+    rng = RNG(5)
+    assert {house.sell(cheap, rng) for _ in range(2000)} == {1.0}
+    outlook = item_outlook(cheap, house=house)
+    assert outlook.expected_price == 1.0 and outlook.p_loss == 0.0
+
+    auctioneer = Auctioneer("A", accuracy=0.8)
+    appraisal = appraisal_distribution(cheap, auctioneer)
+    rng = RNG(6)
+    estimates = [auctioneer.appraise(cheap, rng) for _ in range(2000)]
+    assert set(estimates) == {1.0} and appraisal.mean() == 1.0
+
+    # Straddling the floor: part of the law is clamped at 1.0, part is not.
+    near = _item(9, 0.8, 0.5)
+    outlook = item_outlook(near, house=house)
+    rng = RNG(7)
+    prices = [house.sell(near, rng) for _ in range(20000)]
+    assert abs(sum(prices) / len(prices) - outlook.expected_price) < 4 * outlook.std / math.sqrt(len(prices))
+    floor_mass = mixture_cdf(sale_components(near, house=house), 1.0)
+    assert abs(sum(p <= 1.0 for p in prices) / len(prices) - floor_mass) < 0.015
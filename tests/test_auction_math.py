@@ -88,3 +88,41 @@ def test_golden_gavel_requires_all_team_profits_and_can_be_shared():
     episode.compute_results()
 
     assert all(team.golden_gavel for team in episode.teams)
+
+
+def test_batch_appraisal_and_sales_match_per_item_calls():
+    from models.auction_house import AuctionHouse
+    from models.auctioneer import Auctioneer
+    from sim.rng import RNG
+
+    items = [make_item(i, 10.0, 0.0, category=cat) for i, cat in enumerate(["tools", "silverware", "toys"] * 4)]
+    house = AuctionHouse(demand_by_category={"tools": 1.2, "silverware": 0.8}, mood="hot")
+    auctioneer = Auctioneer("Batch", accuracy=0.6, bias={"toys": 1.1})
+
+    single, batch = RNG(5), RNG(5)
+    appraisals = [auctioneer.appraise(it, single) for it in items]
+    prices = [house.sell(it, single) for it in items]
+
+    assert auctioneer.appraise_many(items, batch) == appraisals
+    assert [it.appraised_value for it in items] == appraisals
+    assert house.sell_many(items, batch) == prices
+    assert [it.auction_price for it in items] == prices
+    assert batch.getstate() == single.getstate()
+    assert batch.calls == single.calls
+
+
+def test_selling_remaining_lots_matches_stepping_through_them():
+    from tests.simulation_utils import run_episode_to_results
+
+    stepped = run_episode_to_results(21, expert_min_budget=10.0)
+    batched = stepped.fork()
+
+    stepped.start_team_auction()
+    while not stepped.auction_done:
+        stepped.step_auction()
+    batched.start_team_auction()
+    sold = batched.sell_remaining_lots()
+
+    assert len(sold) > 0 and batched.auction_done
+    assert [lot.item.auction_price for lot, _ in sold] == [lot.item.auction_price for lot in stepped.auction_queue]
+    assert batched.rng.getstate() == stepped.rng.getstate()
@@ -7,8 +7,9 @@ from tests.simulation_utils import play_through_market
 from ui.screens.auction_screen import AuctionScreen
 
 
-def _prepare_episode(seed: int):
+def _prepare_episode(seed: int, bidders: int = 0):
     episode = play_through_market(seed, expert_min_budget=10.0)
+    episode.auction_house.bidders = bidders
     episode.reserve_expert_budget()
     episode.prepare_expert_picks()
     for team in episode.teams:
@@ -18,8 +19,8 @@ def _prepare_episode(seed: int):
     return episode
 
 
-def _collect_headless_sales(seed: int):
-    episode = _prepare_episode(seed)
+def _collect_headless_sales(seed: int, bidders: int = 0):
+    episode = _prepare_episode(seed, bidders)
     sequences = {}
 
     for start_fn, stage_name in ((episode.start_team_auction, "team"), (episode.start_expert_auction, "expert")):
@@ -35,11 +36,11 @@ def _collect_headless_sales(seed: int):
     return sequences
 
 
-def _collect_screen_sales(seed: int):
+def _collect_screen_sales(seed: int, bidders: int = 0):
     os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
     pygame.init()
 
-    episode = _prepare_episode(seed)
+    episode = _prepare_episode(seed, bidders)
     screen = AuctionScreen(GameConfig(), episode)
     sequences = {}
 
@@ -73,3 +74,25 @@ def test_auction_screen_visual_rng_does_not_shift_sales():
     headless = _collect_headless_sales(seed=77)
     screen = _collect_screen_sales(seed=77)
     assert headless == screen
+
+
+def test_auction_screen_plays_bidder_rooms_without_shifting_sales():
+    headless = _collect_headless_sales(seed=77, bidders=250)
+    screen = _collect_screen_sales(seed=77, bidders=250)
+    assert headless == screen
+    assert headless != _collect_headless_sales(seed=77)
+
+
+def test_episode_sales_use_the_episode_balance_config(monkeypatch):
+    import models.auction_house
+
+    episode = _prepare_episode(seed=78, bidders=12)
+
+    def fresh_config():
+        raise AssertionError("sales should reuse episode.balance")
+
+    monkeypatch.setattr(models.auction_house, "BalanceConfig", fresh_config)
+    episode.start_team_auction()
+    episode.step_auction()
+    episode.sell_remaining_lots()
+    assert episode.auction_done and all(lot.item.auction_price > 0 for lot in episode.auction_queue)
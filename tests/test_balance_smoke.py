@@ -64,3 +64,55 @@ def test_csv_report_is_written(tmp_path):
     assert rows[0][:4] == ["seed", "run_index", "mood", "gavel_awarded"]
     assert len(rows) == 1 + 5 * 2  # two teams per run by default
     assert report["profit"]["team"]["count"] > 0
+
+
+def test_precision_targets_stop_early_on_a_prefix_of_the_full_run():
+    report = run_headless(runs=2000, seed=4, precision={"team_profit_mean": 12.0}, batch=50)
+    used = report["meta"]["runs_used"]
+
+    assert report["stopping"]["reason"] == "converged"
+    assert report["stopping"]["met"] == {"team_profit_mean": True}
+    assert used < 2000 and used % 50 == 0
+    prefix = run_headless(runs=used, seed=4)
+    assert prefix["profit"] == report["profit"]
+    assert prefix["meta"]["runs_used"] == used
+
+
+def test_unreachable_precision_targets_give_up_early():
+    report = run_headless(runs=400, seed=4, precision={"team_profit_median": 0.01})
+    assert report["stopping"]["reason"] == "futile"
+    assert report["meta"]["runs_used"] < 400
+
+    with pytest.raises(ValueError):
+        run_headless(runs=10, seed=4, precision={"profit_vibes": 1.0})
+    with pytest.raises(ValueError):
+        run_headless(runs=10, seed=4, precision={"gavel_rate": 0.0})
+
+
+def test_precision_targets_skip_episodes_without_lots():
+    report = run_headless(
+        runs=100, seed=4, items_per_team=0, precision={"item_profit_mean": 1.0, "team_profit_mean": 1.0}
+    )
+    assert report["stopping"]["half_widths"]["item_profit_mean"] == float("inf")
+
+
+def test_malformed_targets_exit_with_usage():
+    from tools.run_balance_headless import parse_targets
+
+    assert parse_targets(["gavel_rate=0.01"]) == {"gavel_rate": 0.01}
+    for bad in (["gavel_rate"], ["gavel_rate=wide"], ["gavel_rate=0"], ["gavel_rate=-1"]):
+        with pytest.raises(SystemExit, match="METRIC=HALF_WIDTH"):
+            parse_targets(bad)
+
+
+def test_median_target_treats_each_episode_as_one_sample():
+    from types import SimpleNamespace
+
+    from sim.early_stopping import METRICS, median_half_width
+
+    # Both teams of an episode move together, so pooling them would double n.
+    episodes = [
+        SimpleNamespace(team_results=[SimpleNamespace(profit_total=float(i))] * 2) for i in range(40)
+    ]
+    width = METRICS["team_profit_median"](episodes, 1.96, BalanceConfig())
+    assert width == median_half_width([float(i) for i in range(40)], 1.96)
@@ -0,0 +1,116 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from models.auction_house import AuctionHouse
+from models.bidding import BidderRoom, bid_increment
+from models.item import Item
+from sim.rng import RNG
+
+
+def _item(item_id: int, true_value: float = 120.0) -> Item:
+    return Item(
+        item_id=item_id,
+        name=f"Item {item_id}",
+        category="clocks",
+        era="modern",
+        condition=0.7,
+        rarity=0.3,
+        style_score=0.6,
+        true_value=true_value,
+        shop_price=40.0,
+    )
+
+
+def test_ascending_bids_climb_to_the_sealed_price():
+    for seed in range(40):
+        room = BidderRoom.draw(150.0, 1.1, 0.3, bidders=3 + seed, opening_ratio=0.4, seed=seed, clamp=(0.5, 2.0))
+        sealed = room.sealed()
+        played = room.ascending()
+        shown = room.ascending(max_steps=3)
+
+        assert played.price == sealed.price == shown.price
+        assert played.winner == sealed.winner == shown.winner
+        assert room.valuations[sealed.winner] == max(room.valuations)
+        amounts = [bid.amount for bid in played.bids]
+        assert amounts == sorted(amounts)
+        assert amounts[0] == round(room.opening, 2) and amounts[-1] == played.price
+        assert len(shown.bids) == 3 and shown.bids[-1] == played.bids[-1]
+        assert all(a.bidder != b.bidder for a, b in zip(played.bids, played.bids[1:]))
+
+    runner_up = sorted(room.valuations)[-2]
+    assert sealed.price == round(min(max(room.valuations), runner_up + bid_increment(runner_up)), 2)
+
+
+def test_bidder_rooms_keep_rng_use_fixed_and_scale_to_large_rooms():
+    house = AuctionHouse({"clocks": 1.1}, mood="hot", bidders=10_000)
+    items = [_item(i, 50.0 + 40 * i) for i in range(20)]
+
+    sealed_rng, shown_rng = RNG(3), RNG(3)
+    start = time.perf_counter()
+    prices = house.sell_many(items, sealed_rng)
+    elapsed = time.perf_counter() - start
+    shown = [house.auction(it, shown_rng, max_steps=6) for it in items]
+
+    assert [r.price for r in shown] == prices
+    assert sealed_rng.getstate() == shown_rng.getstate()
+    assert sealed_rng.calls == len(items)
+    assert elapsed < 5.0
+
+    small = AuctionHouse({"clocks": 1.1}, mood="hot", bidders=5)
+    small_rng = RNG(3)
+    small.sell_many([_item(i) for i in range(20)], small_rng)
+    assert small_rng.getstate() == sealed_rng.getstate()
+
+
+def test_each_bidder_draws_a_valuation_around_demand_condition_and_mood():
+    import math
+    from statistics import median, stdev
+
+    from sim.balance_config import BalanceConfig
+
+    cfg = BalanceConfig()
+    house = AuctionHouse({"clocks": 1.0, "toys": 1.5}, mood="mixed", bidders=4000)
+    clock = _item(1)
+    toy = _item(2)
+    toy.category = "toys"
+
+    clock_room = house.open_room(clock, RNG(8), cfg)
+    toy_room = house.open_room(toy, RNG(9), cfg)
+
+    ah = cfg.auction_house
+    expected = clock.true_value * (ah.condition_base + ah.condition_scale * clock.condition) * ah.moods["mixed"].multiplier
+    assert abs(median(clock_room.valuations) / expected - 1.0) < 0.05
+    assert abs(median(toy_room.valuations) / median(clock_room.valuations) - 1.5) < 0.1
+    # Independent per-bidder noise at the mood's sigma, not a shared ceiling.
+    assert abs(stdev(math.log(v) for v in clock_room.valuations) - ah.moods["mixed"].sigma) < 0.02
+    assert abs(clock_room.opening - expected * ah.opening_ratio) < 1e-9
+
+
+def test_episode_bidders_come_from_the_balance_config_unless_overridden():
+    from config import GameConfig
+    from models.episode import Episode
+    from sim.balance_config import BalanceConfig
+
+    balance = BalanceConfig()
+    balance.auction_house.bidders = 50
+
+    def episode(cfg: GameConfig) -> Episode:
+        ep = Episode(
+            ep_idx=0,
+            seed=3,
+            play_rect=(0, 0, 1280, 720),
+            items_per_team=3,
+            starting_budget=400.0,
+            expert_min_budget=1.0,
+            cfg=cfg,
+            balance=balance,
+        )
+        ep.setup()
+        return ep
+
+    assert episode(GameConfig()).auction_house.bidders == 50
+    assert episode(GameConfig(auction_bidders=0)).auction_house.bidders == 0
+    assert episode(GameConfig(auction_bidders=7)).auction_house.bidders == 7
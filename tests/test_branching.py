@@ -0,0 +1,109 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from config import GameConfig
+from models.episode import Episode
+from sim.balance_config import BalanceConfig
+from sim.branching import explore_branches, play_branch, run_prefix, team_profits
+from sim.dataset_registry import get_item_factory
+from sim.timeline import record_episode
+
+CFG = GameConfig(show_host_intro=False, show_splash_video=False, market_seconds=120.0)
+
+
+def _episode(seed: int, balance: BalanceConfig | None = None) -> Episode:
+    episode = Episode(
+        ep_idx=0,
+        seed=seed,
+        play_rect=(0, 0, CFG.window_w - CFG.hud_w, CFG.window_h),
+        items_per_team=CFG.items_per_team,
+        starting_budget=CFG.starting_budget,
+        expert_min_budget=CFG.expert_min_budget,
+        cfg=CFG,
+        item_factory=get_item_factory(CFG.item_source),
+        balance=balance,
+    )
+    episode.setup()
+    return episode
+
+
+def test_snapshot_restore_and_fork_are_independent():
+    episode = _episode(4)
+    for _ in range(200):
+        episode.update_market_ai(CFG.sim_step_s, cfg=CFG)
+    snap = episode.snapshot()
+    rng_state = episode.rng.getstate()
+    positions = [(team.x, team.y) for team in episode.teams]
+
+    fork = episode.fork(snap)
+    for _ in range(300):
+        fork.update_market_ai(CFG.sim_step_s, cfg=CFG)
+    assert episode.rng.getstate() == rng_state
+    assert [(team.x, team.y) for team in episode.teams] == positions
+    assert fork.item_factory is episode.item_factory
+
+    for _ in range(300):
+        episode.update_market_ai(CFG.sim_step_s, cfg=CFG)
+    episode.restore(snap)
+    assert episode.rng.getstate() == rng_state
+    assert [(team.x, team.y) for team in episode.teams] == positions
+
+
+def test_prefix_plus_suffix_matches_a_full_run_and_pool_matches_serial():
+    full = _episode(12)
+    record_episode(full, CFG)
+
+    prefix = _episode(12)
+    point = run_prefix(prefix, 20.0, CFG)
+    assert point.elapsed > 0
+    assert play_branch(point.episode(CFG), point, None, cfg=CFG) == team_profits(full)
+
+    stock = [it.item_id for st in prefix.market.stalls for it in st.items][:3]
+    branches = [None] + [(0, item_id) for item_id in stock]
+    serial = explore_branches(point, branches, cfg=CFG)
+    assert serial[0] == team_profits(full)
+    assert explore_branches(point, branches, cfg=CFG, workers=2) == serial
+
+
+def test_branches_keep_the_prefix_balance_config():
+    balance = BalanceConfig()
+    balance.auction_house.clamp_multiplier = 1.2
+    full = _episode(12, balance)
+    record_episode(full, CFG)
+
+    prefix = _episode(12, balance)
+    point = run_prefix(prefix, 20.0, CFG)
+    assert point.balance is balance and point.item_factory is prefix.item_factory
+    assert point.episode(CFG).balance is balance
+    assert explore_branches(point, [None], cfg=CFG) == [team_profits(full)]
+    assert explore_branches(point, [None, None], cfg=CFG, workers=2) == [team_profits(full)] * 2
+
+
+def test_force_purchase_goes_through_episode_buy():
+    from sim.branching import force_purchase
+    from sim.episode_events import EpisodeListener
+
+    class Purchases(EpisodeListener):
+        def __init__(self):
+            self.seen = []
+
+        def purchase(self, team, stall, item, listed, discount):
+            self.seen.append((team.name, stall.stall_id, item.item_id, listed))
+
+    episode = _episode(5)
+    episode.recorder = Purchases()
+    team = episode.teams[0]
+    stall = episode.market.stalls[0]
+    item = min(stall.items, key=lambda it: it.shop_price)
+
+    # Buying would leave less than the expert's reserve.
+    team.budget_left = item.shop_price + episode.expert_min_budget / 2
+    assert not force_purchase(episode, (0, item.item_id))
+    assert item in stall.items and episode.recorder.seen == []
+
+    team.budget_left = item.shop_price + episode.expert_min_budget
+    assert force_purchase(episode, (0, item.item_id))
+    assert item not in stall.items and team.items_bought[-1] is item
+    assert episode.recorder.seen == [(team.name, stall.stall_id, item.item_id, item.shop_price)]
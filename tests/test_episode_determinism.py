@@ -31,3 +31,116 @@ def test_episode_flow_is_deterministic_with_seed():
     first = snapshot_episode(seed=99)
     second = snapshot_episode(seed=99)
     assert first == second
+
+
+def _setup_episode(seed: int, cache=None):
+    from models.episode import Episode
+    from sim.dataset_registry import get_item_factory
+
+    episode = Episode(
+        ep_idx=0,
+        seed=seed,
+        play_rect=(0, 0, 1280, 720),
+        items_per_team=3,
+        starting_budget=400.0,
+        item_factory=get_item_factory("assets"),
+        market_cache=cache,
+    )
+    episode.setup()
+    return episode
+
+
+def test_market_cache_hit_matches_fresh_generation(tmp_path: Path):
+    from sim.market_cache import MarketCache
+
+    cache = MarketCache(tmp_path)
+    fresh = _setup_episode(7)
+    miss = _setup_episode(7, cache)
+    hit = _setup_episode(7, cache)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    for episode in (miss, hit):
+        assert episode.market == fresh.market
+        assert episode.rng.getstate() == fresh.rng.getstate()
+        assert [t.name for t in episode.teams] == [t.name for t in fresh.teams]
+
+    _setup_episode(8, cache)
+    assert cache.misses == 2
+
+
+def _hashed_run(seed: int, cache=None, nudge: float = 0.0):
+    from config import GameConfig
+    from sim.state_hash import StateHasher
+    from sim.timeline import record_episode
+
+    episode = _setup_episode(seed, cache)
+    episode.teams[0].x += nudge
+    episode.hasher = StateHasher()
+    record_episode(episode, GameConfig(market_seconds=120.0), sample_every=0)
+    return episode.hasher
+
+
+def test_state_hash_streams_match_across_runs_and_cache_hits(tmp_path: Path):
+    from sim.market_cache import MarketCache
+
+    cache = MarketCache(tmp_path)
+    reference = _hashed_run(3)
+    assert len(reference.hashes) > 100
+    assert "results" in reference.labels.values()
+    assert _hashed_run(3).hashes == reference.hashes
+    assert _hashed_run(3, cache).hashes == reference.hashes  # miss
+    assert _hashed_run(3, cache).hashes == reference.hashes  # hit
+
+
+def test_first_divergence_bisects_to_the_first_differing_entry():
+    from array import array
+
+    from sim.state_hash import diff_states, first_divergence
+
+    assert first_divergence(array("Q", [1, 2, 3, 4]), array("Q", [1, 2, 9, 8])) == 2
+    assert first_divergence(array("Q", [1, 2, 3]), array("Q", [1, 2])) == 2
+    assert first_divergence(array("Q", [1, 2]), array("Q", [1, 2])) is None
+
+    a, b = _hashed_run(3), _hashed_run(3, nudge=5.0)
+    assert first_divergence(a.hashes, b.hashes) == 0
+    state_a = {"teams": [{"pos": (1.0, 2.0), "items": [(4, 10.0)]}]}
+    state_b = {"teams": [{"pos": (1.5, 2.0), "items": [(4, 10.0)]}]}
+    assert diff_states(state_a, state_b) == ["teams[0].pos[0]: 1.0 != 1.5"]
+
+
+def test_market_cache_keys_on_content_config_and_generator_source(tmp_path: Path, monkeypatch):
+    import json
+
+    import sim.market_cache as market_cache
+    from sim.balance_config import BalanceConfig
+    from sim.item_database import ItemDatabase
+    from sim.item_factory import ItemFactory
+    from sim.rng import RNG
+
+    # An empty catalog makes every item a fallback, stored as a full row.
+    factory = ItemFactory(ItemDatabase([]), dataset_key=("empty", ()), dataset_digest="e3b0c442")
+    cache = market_cache.MarketCache(tmp_path)
+    fresh = market_cache.Market.generate(RNG(5), (0, 0, 900, 600), factory=factory)
+    cache.generate(RNG(5), (0, 0, 900, 600), factory=factory)
+    hit = cache.generate(RNG(5), (0, 0, 900, 600), factory=factory)
+
+    assert hit == fresh and (cache.hits, cache.misses) == (1, 1)
+    [entry] = tmp_path.glob("*/*.json")
+    assert json.loads(entry.read_bytes())["format"] == market_cache.CACHE_FORMAT
+
+    # Same bytes under a new fingerprint still hit; new bytes miss.
+    moved = ItemFactory(factory.database, dataset_key=("moved", ()), dataset_digest="e3b0c442")
+    cache.generate(RNG(5), (0, 0, 900, 600), factory=moved)
+    assert cache.hits == 2
+    edited = ItemFactory(factory.database, dataset_key=("empty", ()), dataset_digest="5feceb66")
+    cache.generate(RNG(5), (0, 0, 900, 600), factory=edited)
+    assert cache.misses == 2
+
+    tuned = BalanceConfig()
+    tuned.shop_pricing.min_price += 1.0
+    cache.generate(RNG(5), (0, 0, 900, 600), factory=factory, cfg=tuned)
+    assert cache.misses == 3
+
+    monkeypatch.setattr(market_cache, "_generator_digest", lambda: b"edited generator")
+    cache.generate(RNG(5), (0, 0, 900, 600), factory=factory)
+    assert cache.misses == 4
@@ -16,3 +16,77 @@ def test_toggle_speed_progression_from_default():
         state._toggle_speed()
         assert state.time_scale == expected
         assert state.episode.time_scale == expected
+
+
+def test_fixed_step_clock_caps_steps_and_keeps_remainder():
+    from sim.fixed_step import FixedStepClock
+
+    clock = FixedStepClock(step=0.1, max_steps=5)
+    assert clock.advance(0.25) == 2
+    assert abs(clock.alpha - 0.5) < 1e-6
+    assert clock.advance(0.05) == 1
+    assert clock.advance(2.0) == 5
+    assert abs(clock.dropped - 1.5) < 1e-6
+
+
+def _market_after(fps: int, sim_seconds: float):
+    import os
+
+    import pygame
+
+    from config import GameConfig
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        cfg = GameConfig(show_host_intro=False)
+        pygame.display.set_mode((cfg.window_w, cfg.window_h))
+        state = GameState(cfg=cfg, seed=11, episode_idx=0)
+        state.time_scale = 20.0
+        for _ in range(round(sim_seconds / state.time_scale * fps)):
+            state.update(1.0 / fps)
+        return [
+            (round(team.x, 6), round(team.y, 6), [it.item_id for it in team.items_bought], team.market_state)
+            for team in state.episode.teams
+        ]
+    finally:
+        pygame.quit()
+
+
+def test_market_outcome_does_not_depend_on_frame_rate():
+    reference = _market_after(60, 240.0)
+    assert _market_after(30, 240.0) == reference
+    assert _market_after(144, 240.0) == reference
+
+
+def test_instant_turbo_finishes_market_phase_and_throttles_rendering():
+    import os
+
+    import pygame
+
+    from config import GameConfig
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        cfg = GameConfig(show_host_intro=False, turbo_cpu_budget_ms=50.0)
+        screen = pygame.display.set_mode((cfg.window_w, cfg.window_h))
+        state = GameState(cfg=cfg, seed=11, episode_idx=0)
+        for _ in range(3):
+            state._toggle_turbo()
+        assert state.turbo == float("inf")
+
+        state.render(screen)
+        assert not state.should_render()  # same phase, inside the render interval
+        assert state.screen.turbo == float("inf")
+        assert "turbo" not in vars(state.episode)  # stays out of snapshots
+
+        for _ in range(200):
+            state.update(1.0 / 60)
+            if state.phase != "MARKET":
+                break
+        assert state.phase == "EXPERT_HANDOFF"
+        assert state.turbo is None  # instant mode only covers one phase
+        assert state.should_render()
+    finally:
+        pygame.quit()
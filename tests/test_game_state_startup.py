@@ -0,0 +1,30 @@
+import os
+import sys
+from pathlib import Path
+
+import pygame
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from config import GameConfig
+from game_state import GameState
+
+
+def test_screens_are_built_on_first_use_and_episode_loads_in_background():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        cfg = GameConfig(show_splash_video=False)
+        surface = pygame.display.set_mode((cfg.window_w, cfg.window_h))
+        state = GameState(cfg=cfg, seed=9, episode_idx=0)
+        assert state.screens.built() == ["INTRO_HOST"]
+
+        state.render(surface)
+        assert state.episode.market.stalls  # waits for the background setup
+
+        state._skip_intro_sequence()
+        assert state.phase == "MARKET"
+        assert state.screens.built() == ["INTRO_HOST", "MARKET"]
+        assert state.screens["AUCTION_TEAM"] is not state.screens["AUCTION_EXPERT"]
+    finally:
+        pygame.quit()
@@ -1,7 +1,10 @@
 import json
+import random
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from sim.item_database import ItemDatabase
@@ -45,3 +48,166 @@ def test_load_default_returns_templates_with_images():
     item = template.instantiate(item_id=5)
     assert item.name
     assert item.image_path == template.image
+
+
+def test_instantiated_items_are_slotted_and_copy_attributes_on_write():
+    db = ItemDatabase.load_default()
+    template = next(t for t in db.templates if t.attributes)
+
+    first = template.instantiate(item_id=1)
+    second = template.instantiate(item_id=2)
+    assert not hasattr(first, "__dict__")
+
+    first.attributes["expert_estimate"] = 42.0
+
+    assert "expert_estimate" not in template.attributes
+    assert "expert_estimate" not in second.attributes
+    assert second.attributes == template.attributes
+
+
+def test_dataset_registry_caches_until_source_file_changes(tmp_path: Path):
+    import os
+
+    from sim.dataset_registry import DatasetRegistry
+
+    data_path = tmp_path / "items.jsonl"
+    data_path.write_text(json.dumps({"title": "Jug", "category": "ceramics"}) + "\n", encoding="utf-8")
+    loads = []
+
+    def _load():
+        loads.append(1)
+        return ItemDatabase.load_jsonl(data_path)
+
+    registry = DatasetRegistry(sources={}, max_entries=2)
+    registry.register("tmp", [data_path], _load)
+
+    first = registry.get_factory("tmp")
+    assert registry.get_factory("TMP") is first
+    assert len(loads) == 1
+
+    data_path.write_text(
+        json.dumps({"title": "Jug", "category": "ceramics"}) + "\n" + json.dumps({"title": "Bowl"}) + "\n",
+        encoding="utf-8",
+    )
+    stat = data_path.stat()
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = registry.get_factory("tmp")
+    assert reloaded is not first
+    assert len(reloaded.database.templates) == 2
+    assert len(loads) == 2
+
+
+def test_episodes_can_use_different_item_sources_side_by_side():
+    from models.market import Market
+    from sim.dataset_registry import get_item_factory
+    from sim.rng import RNG
+
+    assets = get_item_factory("assets")
+    generated = get_item_factory("generated")
+    assert get_item_factory("default") is assets
+
+    assets_names = {t.name for t in assets.database.templates}
+    generated_names = {t.name for t in generated.database.templates}
+
+    market_a = Market.generate(RNG(3), (0, 0, 900, 600), factory=assets)
+    market_b = Market.generate(RNG(3), (0, 0, 900, 600), factory=generated)
+
+    assert all(it.name in assets_names for it in market_a.all_remaining_items())
+    assert all(it.name in generated_names for it in market_b.all_remaining_items())
+
+
+def test_binary_catalog_round_trips_templates(tmp_path: Path):
+    from sim.item_catalog import CatalogWriter, encode_templates
+    from sim.item_database import ItemTemplate
+
+    templates = [
+        ItemTemplate(
+            name=f"Item {i}",
+            category="decor" if i % 2 else "clocks",
+            era="Victorian",
+            condition=0.5 + i / 100,
+            rarity=i / 10,
+            style_score=0.3,
+            true_value=10.0 * i,
+            description="shared description",
+            image=None if i == 3 else f"assets/items/{i}.png",
+            attributes={"materials": "brass"} if i % 3 == 0 else {},
+        )
+        for i in range(7)
+    ]
+    path = tmp_path / "items.bhcat"
+    with CatalogWriter(path) as writer:
+        writer.write_chunk(encode_templates(templates[:4]))
+        writer.write_chunk(encode_templates(templates[4:]))
+    assert writer.count == len(templates)
+
+    db = ItemDatabase.load_catalog(path)
+
+    assert len(db.templates) == len(templates)
+    assert list(db.templates) == templates
+    assert db.templates[-1] == templates[-1]
+    item = db.next_item(random.Random(1), item_id=42)
+    assert item.item_id == 42 and item.name.startswith("Item ")
+
+
+def test_shared_catalog_attaches_without_reparsing():
+    from sim.shared_catalog import SharedCatalog, attach_shared, detach_shared
+
+    db = ItemDatabase.load_default()
+    with SharedCatalog(db) as shared:
+        attached = attach_shared(shared.name, shared.size)
+        assert list(attached.templates) == db.templates
+        detach_shared(attached)
+
+
+def test_parallel_headless_matches_serial():
+    from sim.headless_balance_runner import run_headless, run_headless_parallel
+
+    seeds = [3, 4]
+    parallel = run_headless_parallel(seeds, workers=2, runs=5)
+    assert parallel == [run_headless(seed=s, runs=5) for s in seeds]
+
+
+def test_vectorized_generator_output_does_not_depend_on_worker_count(tmp_path: Path):
+    pytest.importorskip("numpy")
+    sys.path.append(str(Path(__file__).resolve().parents[1] / "tools"))
+    from generate_fake_items import generate_items_vectorized
+
+    outputs = {}
+    for workers in (1, 3):
+        paths = generate_items_vectorized(
+            250, seed=7, workers=workers, chunk_size=40,
+            formats=("jsonl", "csv", "catalog"), out_dir=str(tmp_path / f"w{workers}"),
+        )
+        outputs[workers] = {fmt: path.read_bytes() for fmt, path in paths.items()}
+
+    assert outputs[1] == outputs[3]
+    assert len(outputs[1]["jsonl"].splitlines()) == 250
+    assert len(outputs[1]["csv"].decode("utf-8").splitlines()) == 251  # one header
+
+
+def test_generated_catalog_matches_generated_jsonl(tmp_path: Path):
+    pytest.importorskip("numpy")
+    sys.path.append(str(Path(__file__).resolve().parents[1] / "tools"))
+    from generate_fake_items import generate_items_vectorized
+
+    paths = generate_items_vectorized(
+        90, seed=11, chunk_size=32, formats=("jsonl", "catalog"), out_dir=str(tmp_path)
+    )
+    from_jsonl = ItemDatabase.load_jsonl(paths["jsonl"]).templates
+    from_catalog = ItemDatabase.load_catalog(paths["catalog"]).templates
+
+    assert len(from_catalog) == len(from_jsonl) == 90
+    for a, b in zip(from_catalog, from_jsonl):
+        assert (a.name, a.category, a.era, a.true_value) == (b.name, b.category, b.era, b.true_value)
+        assert (a.condition, a.rarity, a.image) == (b.condition, b.rarity, b.image)
+
+
+def test_tools_alias_imports_as_a_module_and_runs_as_a_script():
+    import subprocess
+
+    root = Path(__file__).resolve().parents[1]
+    for args in (["-c", "import tools.tools"], [str(root / "tools" / "tools.py"), "--help"]):
+        result = subprocess.run([sys.executable, *args], cwd=root, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
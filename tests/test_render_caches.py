@@ -0,0 +1,226 @@
+import os
+import sys
+from pathlib import Path
+
+import pygame
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from ui.render.text_cache import TextCache, get_font
+
+
+def test_fonts_and_text_surfaces_are_reused_and_bounded():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        font = get_font(None, 18)
+        assert get_font(None, 18) is font
+
+        cache = TextCache()
+        first = cache.render(font, "Team Red", pygame.Color(220, 60, 60))
+        assert cache.render(font, "Team Red", (220, 60, 60)) is first
+        assert cache.render(font, "Team Red", (60, 120, 220)) is not first
+
+        per_entry = first.get_width() * first.get_height() * first.get_bytesize()
+        small = TextCache(max_bytes=per_entry * 2)
+        for i in range(10):
+            small.render(font, "Team Red"[: 1 + i % 8] + str(i), (0, 0, 0))
+        assert small.bytes_used <= small.max_bytes
+        assert 0 < len(small) < 10
+    finally:
+        pygame.quit()
+
+    # Fonts are dropped on quit; a fresh init must not reuse stale ones.
+    pygame.init()
+    try:
+        assert get_font(None, 18).render("ok", True, (0, 0, 0)).get_width() > 0
+    finally:
+        pygame.quit()
+
+
+def test_image_loader_decodes_in_background_and_bounds_memory(tmp_path: Path):
+    from ui.render.image_cache import ImageLoader, ThumbnailCache
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        paths = []
+        for i in range(3):
+            big = pygame.Surface((600, 400), pygame.SRCALPHA)
+            big.fill((40 * i, 80, 120, 255))
+            path = tmp_path / f"item_{i}.png"
+            pygame.image.save(big, str(path))
+            paths.append(path)
+
+        loader = ImageLoader(max_images=2, max_side=128)
+        for path in paths + [tmp_path / "missing.png"]:
+            loader.request(path)
+        loader.wait(timeout=5)
+
+        img = loader.get(paths[0])
+        assert img.get_size() == (128, 85)
+        assert loader.get(tmp_path / "missing.png") is None
+        loader.get(paths[1])
+        loader.get(paths[2])
+        assert paths[0] not in loader._images and len(loader._images) == 2
+
+        thumbs = ThumbnailCache(max_entries=1)
+        first = thumbs.get("a", (32, 21), img)
+        assert thumbs.get("a", (32, 21), img) is first
+        thumbs.get("a", (64, 42), img)
+        assert len(thumbs) == 1
+    finally:
+        pygame.quit()
+
+
+def test_asset_index_resolves_from_one_scan_and_manifest(tmp_path: Path):
+    from ui.asset_index import AssetIndex
+
+    (tmp_path / "assets" / "items").mkdir(parents=True)
+    (tmp_path / "assets" / "items" / "vase.png").write_bytes(b"png")
+    (tmp_path / "assets" / "Brass Clock.jpg").write_bytes(b"jpg")
+
+    index = AssetIndex.scan([tmp_path])
+    expected = tmp_path.resolve() / "assets" / "items" / "vase.png"
+    assert index.resolve("assets/items/vase.png") == expected
+    assert index.resolve(expected) == expected
+    assert index.resolve("assets/items/missing.png") is None
+    assert index.find_image("Brass Clock").name == "Brass Clock.jpg"
+    assert index.find_image("Teapot") is None
+
+    manifest = tmp_path / "manifest.json"
+    index.write_manifest(manifest)
+    loaded = AssetIndex.from_manifest(manifest, root=tmp_path)
+    assert loaded.resolve("assets/items/vase.png") == expected
+    assert len(loaded) == len(index)
+
+
+def test_texture_atlas_slices_packed_images(tmp_path: Path):
+    import json
+
+    from ui.render.atlas import INDEX_NAME, TextureAtlas
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        sheet = pygame.Surface((64, 64), pygame.SRCALPHA)
+        sheet.fill((200, 10, 10, 255), (2, 2, 20, 30))
+        pygame.image.save(sheet, str(tmp_path / "atlas_0.png"))
+        index = {"sheets": ["atlas_0.png"], "entries": {"assets/items/vase.png": {"sheet": 0, "rect": [2, 2, 20, 30]}}}
+        (tmp_path / INDEX_NAME).write_text(json.dumps(index), encoding="utf-8")
+
+        atlas = TextureAtlas.load(tmp_path)
+        assert "assets/items/vase.png" in atlas
+        assert "assets/items/clock.png" not in atlas
+        img = atlas.get("assets/items/vase.png", block=True)
+        assert img.get_size() == (20, 30)
+        assert tuple(img.get_at((0, 0))) == (200, 10, 10, 255)
+        assert atlas.get("assets/items/vase.png") is img
+        assert TextureAtlas.load(tmp_path / "missing").get("assets/items/vase.png") is None
+    finally:
+        pygame.quit()
+
+
+def test_texture_atlas_falls_back_to_the_file_when_a_sheet_fails(tmp_path: Path):
+    from ui.render.atlas import REPO_ROOT, TextureAtlas
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        image = tmp_path / "portrait.png"
+        pygame.image.save(pygame.Surface((40, 20)), str(image))
+        (tmp_path / "atlas_0.png").write_bytes(b"not a png")
+        key = os.path.relpath(image, REPO_ROOT)
+        index = {"max_side": 16, "sheets": ["atlas_0.png"], "entries": {key: {"sheet": 0, "rect": [0, 0, 40, 20]}}}
+
+        atlas = TextureAtlas(index, tmp_path)
+        img = atlas.get(key, block=True)
+        assert img is not None and img.get_size() == (16, 8)
+        assert atlas.get(key) is img
+    finally:
+        pygame.quit()
+
+
+def test_footprint_ring_buffer_expires_and_overwrites_oldest():
+    from ui.render.footprints import FootprintTrailManager
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        sprite = pygame.Surface((10, 10), pygame.SRCALPHA)
+        sprite.fill((255, 0, 0, 255))
+        trails = FootprintTrailManager(lifetime=1.0, min_distance=5.0, capacity=4, alpha_levels=5)
+
+        for step in range(6):
+            trails.update(0.1, {"a": (step * 10.0, 0.0)}, {"a": sprite})
+        assert len(trails) == 4  # capacity reached, oldest overwritten
+        assert list(trails._x[trails._head : trails._head + 1]) == [20.0]
+
+        canvas = pygame.Surface((80, 20), pygame.SRCALPHA)
+        trails.draw(canvas)
+        assert canvas.get_at((50, 0)).a == 255  # newest footprint at full alpha
+        assert len(trails._ladders) == 1 and len(trails._ladders[0]) == 5
+
+        trails.update(0.95, {}, {})
+        assert len(trails) == 1  # only the newest footprint is still within its lifetime
+        trails.update(1.0, {}, {})
+        assert len(trails) == 0
+    finally:
+        pygame.quit()
+
+
+def test_market_static_layer_is_reused_until_stock_changes():
+    from config import GameConfig
+    from models.episode import Episode
+    from ui.screens.market_screen import MarketScreen
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    try:
+        cfg = GameConfig()
+        canvas = pygame.display.set_mode((cfg.window_w, cfg.window_h))
+        episode = Episode(0, seed=4, play_rect=(0, 0, cfg.window_w - cfg.hud_w, cfg.window_h), items_per_team=3, starting_budget=300)
+        episode.setup()
+        screen = MarketScreen(cfg, episode)
+
+        assert screen.render(canvas) is None  # first frame presents everything
+        layer = screen._static_layer
+        dirty = screen.render(canvas)
+        assert screen._static_layer is layer
+        assert dirty and all(isinstance(rect, pygame.Rect) for rect in dirty)
+
+        stall = next(st for st in episode.market.stalls if st.items)
+        stall.items.pop()
+        assert screen.render(canvas) is None
+        assert screen._static_layer is not layer
+    finally:
+        pygame.quit()
+
+
+def test_splash_decoder_skips_late_frames_and_caches_to_disk(tmp_path: Path):
+    import pytest
+
+    np = pytest.importorskip("numpy")
+    from ui.splash import SplashDecoder, SplashFrameCache
+
+    frames = [np.full((6, 8, 3), i, dtype=np.uint8) for i in range(5)]
+    cache = SplashFrameCache(tmp_path)
+    writer = cache.writer("clip", (4, 3), 25.0)
+    decoder = SplashDecoder(iter(frames), (4, 3), max_queued=8, cache_writer=writer).start()
+    decoder._thread.join(timeout=5)
+
+    frame = decoder.frame_for(3)
+    assert frame.shape == (4, 3, 3) and frame[0, 0, 0] == 3  # frames 0-2 were late
+    assert decoder.dropped == 3
+    assert decoder.frame_for(3) is None
+    assert decoder.frame_for(10)[0, 0, 0] == 4 and decoder.finished
+    decoder.stop()
+
+    cached, fps = cache.load("clip")
+    assert fps == 25.0 and cached.shape == (5, 4, 3, 3)
+    assert [int(f[0, 0, 0]) for f in cached] == [0, 1, 2, 3, 4]
+
+    # Stopping early leaves no partial entry behind.
+    partial = SplashDecoder(iter(frames), (4, 3), max_queued=1, cache_writer=cache.writer("partial", (4, 3), 25.0)).start()
+    partial.stop()
+    assert cache.load("partial") is None
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from config import GameConfig
+from tools.soak_game_state import format_report, run_soak
+
+
+def test_soak_runs_and_renders_every_phase():
+    cfg = GameConfig(market_seconds=120.0)
+    report = run_soak(2, seed=4, time_scale=200.0, cfg=cfg, render_every=1)
+
+    assert report.episodes == 2 and report.market_steps > 0
+    for phase in ("MARKET", "EXPERT_SHOPPING", "APPRAISAL", "AUCTION_TEAM", "AUCTION_EXPERT"):
+        assert report.phases[phase].updates > 0
+        assert report.phases[phase].renders > 0
+    assert "AUCTION_EXPERT" in format_report(report)
@@ -0,0 +1,87 @@
+import copy
+import os
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from config import GameConfig
+from models.episode import Episode
+from sim.dataset_registry import get_item_factory
+from sim.timeline import TimelinePlayer, episode_memo, record_episode
+
+CFG = GameConfig(show_host_intro=False, show_splash_video=False, market_seconds=120.0)
+
+
+def _episode(seed: int) -> Episode:
+    episode = Episode(
+        ep_idx=0,
+        seed=seed,
+        play_rect=(0, 0, CFG.window_w - CFG.hud_w, CFG.window_h),
+        items_per_team=CFG.items_per_team,
+        starting_budget=CFG.starting_budget,
+        expert_min_budget=CFG.expert_min_budget,
+        cfg=CFG,
+        item_factory=get_item_factory(CFG.item_source),
+    )
+    episode.setup()
+    return episode
+
+
+def _outcome(episode):
+    return [
+        (
+            [(it.item_id, round(it.shop_price, 6), it.auction_price) for it in team.items_bought],
+            team.expert_pick_included,
+            round(team.profit, 6),
+        )
+        for team in episode.teams
+    ]
+
+
+def test_recorded_episode_matches_live_game_state():
+    import pygame
+
+    from game_state import GameState
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    recorded = _episode(21)
+    record_episode(recorded, CFG)
+
+    pygame.init()
+    try:
+        pygame.display.set_mode((CFG.window_w, CFG.window_h))
+        state = GameState(cfg=replace(CFG, max_sim_steps_per_frame=10_000), seed=21, episode_idx=0)
+        state.time_scale = 1000.0
+        for _ in range(10_000):
+            if state.phase == "RESULTS":
+                break
+            state.update(1.0 / 60)
+        assert state.phase == "RESULTS"
+        assert _outcome(state.episode) == _outcome(recorded)
+    finally:
+        pygame.quit()
+
+
+def test_player_reproduces_the_episode_and_rewinds():
+    episode = _episode(8)
+    pristine = copy.deepcopy(episode, episode_memo(episode))
+    timeline = record_episode(episode, CFG)
+    player = TimelinePlayer(timeline, pristine)
+
+    player.seek(timeline.duration)
+    assert player.phase == "RESULTS"
+    assert _outcome(player.view) == _outcome(episode)
+    stock_at_end = sum(1 for _ in player.view.market.all_remaining_items())
+
+    player.seek(timeline.phase_starts["AUCTION_TEAM"])
+    assert all(it.auction_price == 0 for team in player.view.teams for it in team.items_bought)
+
+    player.seek(0.0)
+    assert player.phase == "MARKET"
+    assert all(not team.items_bought for team in player.view.teams)
+    assert sum(1 for _ in player.view.market.all_remaining_items()) > stock_at_end
+
+    player.seek(timeline.duration)
+    assert _outcome(player.view) == _outcome(episode)
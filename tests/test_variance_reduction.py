@@ -0,0 +1,43 @@
+import math
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sim.balance_config import BalanceConfig
+from sim.rng import RNG, AntitheticRNG
+from sim.variance_reduction import compare_configs
+
+
+def test_antithetic_twin_mirrors_only_lognormals_and_substreams_are_independent():
+    plain, twin = RNG(8), AntitheticRNG(8)
+    for _ in range(50):
+        assert math.isclose(plain.lognormal(0.2, 0.3) * twin.lognormal(0.2, 0.3), math.exp(0.4))
+        assert plain.uniform(1, 5) == twin.uniform(1, 5)
+    assert plain.calls == twin.calls
+
+    first = RNG.substream(1, 0, "sale", 3)
+    busy = RNG.substream(1, 0, "item", 3)
+    for _ in range(10):
+        busy.random()
+    assert first.random() == RNG.substream(1, 0, "sale", 3).random()
+    assert RNG.substream(1, 0, "sale", 3).random() != RNG.substream(1, 1, "sale", 3).random()
+
+
+def test_paired_comparison_of_a_config_with_itself_is_exactly_zero():
+    report = compare_configs(BalanceConfig(), BalanceConfig(), runs=20, seed=3)
+    assert report.episodes_simulated == 80
+    for metric in report.metrics.values():
+        assert metric.diff == 0.0 and metric.ci_low == metric.ci_high == 0.0
+        assert not metric.significant
+
+
+def test_paired_comparison_needs_far_fewer_episodes_than_independent_runs():
+    candidate = BalanceConfig()
+    candidate.auction_house.condition_scale = 0.8
+    report = compare_configs(BalanceConfig(), candidate, runs=60, seed=5)
+    profit = report.metrics["team_profit"]
+    assert profit.significant and profit.diff > 0
+    assert profit.mean_b - profit.mean_a > 0
+    assert profit.efficiency > 10
+    assert report.to_dict()["metrics"]["team_profit"]["significant"]
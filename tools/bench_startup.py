@@ -0,0 +1,121 @@
+"""Measure time from interpreter start to the first rendered game frame.
+
+Each run launches a fresh interpreter (on the SDL dummy driver) that imports
+the app, opens the window, builds GameState and renders one frame, exactly
+as run_app does after the splash. Prints the median over --runs and exits
+non-zero when it exceeds --budget-ms. --imports lists the slowest modules
+from ``python -X importtime`` for the same startup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_BUDGET_MS = 300.0
+
+FIRST_FRAME_SCRIPT = """
+import pygame
+from config import GameConfig
+from constants import BG
+from game_state import GameState
+from ui.pygame_app import run_app
+
+cfg = GameConfig(show_splash_video=False, item_source={item_source!r})
+pygame.init()
+screen = pygame.display.set_mode((cfg.window_w, cfg.window_h))
+state = GameState(cfg=cfg, seed=123, episode_idx=1)
+state.update(1.0 / cfg.fps)
+screen.fill(BG)
+state.render(screen)
+pygame.display.flip()
+print("FIRST_FRAME", flush=True)
+"""
+
+
+def _child_env() -> dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    return env
+
+
+def time_first_frame(item_source: str) -> float:
+    """Wall milliseconds from launching the interpreter to its first frame."""
+    script = FIRST_FRAME_SCRIPT.format(item_source=item_source)
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        env=_child_env(),
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    for line in proc.stdout:
+        if line.startswith("FIRST_FRAME"):
+            elapsed = (time.perf_counter() - start) * 1000.0
+            break
+    else:
+        proc.wait()
+        raise RuntimeError(f"Startup script exited with {proc.returncode} before the first frame")
+    proc.wait()
+    return elapsed
+
+
+def slowest_imports(item_source: str, top: int) -> list[tuple[int, str]]:
+    """Cumulative microseconds per top-level import, slowest first."""
+    script = FIRST_FRAME_SCRIPT.format(item_source=item_source)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=REPO_ROOT,
+        env=_child_env(),
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if cumulative.isdigit():
+            rows.append((int(cumulative), name))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark time to first frame")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--item-source", default="generated")
+    parser.add_argument("--imports", type=int, default=0, help="Also list the N slowest imports")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    times = [time_first_frame(args.item_source) for _ in range(args.runs)]
+    median = statistics.median(times)
+    print(f"time to first frame: median {median:.0f} ms (min {min(times):.0f}, max {max(times):.0f}) over {args.runs} runs")
+
+    if args.imports:
+        print("slowest imports (cumulative):")
+        for cumulative, name in slowest_imports(args.item_source, args.imports):
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    if median > args.budget_ms:
+        print(f"Over budget: {median:.0f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+    print(f"Within budget of {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
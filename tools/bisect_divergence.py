@@ -0,0 +1,141 @@
+"""Find where two runs of an episode stop agreeing.
+
+Runs each seed headless with a StateHasher attached (a rolling hash after
+every market tick and event), compares the two hash streams, binary-searches
+to the first divergent entry and prints a structural diff of the state
+there. Run B is, by default, the same seed again (a determinism check);
+``--set field=value`` changes GameConfig for run B, and ``--against FILE``
+compares with a stream saved earlier by ``--save`` (e.g. from another
+checkout), in which case only this run's state can be shown.
+
+Examples:
+  python tools/bisect_divergence.py --seed 5 --seeds 200
+  python tools/bisect_divergence.py --seed 5 --set market_cache_dir=/tmp/mc
+  python tools/bisect_divergence.py --seed 5 --save /tmp/seed5.hashes
+  python tools/bisect_divergence.py --seed 5 --against /tmp/seed5.hashes
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import fields, replace
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from config import GameConfig
+from models.episode import Episode
+from sim.dataset_registry import get_item_factory
+from sim.market_cache import MarketCache
+from sim.state_hash import StateHasher, diff_states, first_divergence
+from sim.timeline import record_episode
+
+
+def run_hashed(seed: int, cfg: GameConfig, capture_at: int | None = None) -> StateHasher:
+    """Play one episode to results with a hasher attached."""
+    episode = Episode(
+        ep_idx=0,
+        seed=seed,
+        play_rect=(0, 0, cfg.window_w - cfg.hud_w, cfg.window_h),
+        items_per_team=cfg.items_per_team,
+        starting_budget=cfg.starting_budget,
+        expert_min_budget=cfg.expert_min_budget,
+        cfg=cfg,
+        item_factory=get_item_factory(cfg.item_source),
+        market_cache=MarketCache(cfg.market_cache_dir) if cfg.market_cache_dir else None,
+    )
+    episode.setup()
+    episode.hasher = StateHasher(capture_at=capture_at)
+    record_episode(episode, cfg, sample_every=0)
+    return episode.hasher
+
+
+def apply_overrides(cfg: GameConfig, overrides: list[str]) -> GameConfig:
+    types = {f.name: type(getattr(cfg, f.name)) for f in fields(cfg)}
+    changes = {}
+    for override in overrides:
+        key, _, raw = override.partition("=")
+        if key not in types:
+            raise SystemExit(f"Unknown GameConfig field: {key}")
+        kind = types[key]
+        if kind is bool:
+            changes[key] = raw.lower() in ("1", "true", "yes")
+        elif kind in (int, float):
+            changes[key] = kind(raw)
+        else:
+            changes[key] = raw or None
+    return replace(cfg, **changes)
+
+
+def report(seed: int, idx: int, a: StateHasher, b: StateHasher, cfg_a: GameConfig, cfg_b: GameConfig | None):
+    print(f"seed {seed}: runs diverge at entry {idx} of {len(a.hashes)}/{len(b.hashes)} ({a.label_at(idx)})")
+    if idx > 0:
+        print(f"  last agreeing entry: {idx - 1} ({a.label_at(idx - 1)})")
+    state_a = run_hashed(seed, cfg_a, capture_at=idx).captured
+    if cfg_b is None:
+        print("  run B was loaded from a file; run A's state at the divergence:")
+        print(f"  {state_a}")
+        return
+    state_b = run_hashed(seed, cfg_b, capture_at=idx).captured
+    if state_a is None or state_b is None:
+        print("  one run ended before this entry")
+        return
+    diffs = diff_states(state_a, state_b)
+    if not diffs:
+        print("  hashes differ but the captured state matches (non-deterministic capture?)")
+    for line in diffs:
+        print(f"  {line}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Bisect two runs of a seed to their first divergent tick")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--seeds", type=int, default=1, help="Check this many seeds from --seed")
+    parser.add_argument("--market-seconds", type=float, default=None, help="Shorten the market for quick sweeps")
+    parser.add_argument("--set", action="append", default=[], metavar="FIELD=VALUE", help="GameConfig override for run B")
+    parser.add_argument("--save", type=Path, help="Save run A's hash stream (single seed)")
+    parser.add_argument("--against", type=Path, help="Compare run A with a saved hash stream (single seed)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    os.chdir(REPO_ROOT)
+    cfg_a = GameConfig(show_host_intro=False, show_splash_video=False)
+    if args.market_seconds is not None:
+        cfg_a = replace(cfg_a, market_seconds=args.market_seconds)
+    cfg_b = apply_overrides(cfg_a, args.set)
+
+    diverged = 0
+    entries = 0
+    start = time.perf_counter()
+    for seed in range(args.seed, args.seed + args.seeds):
+        a = run_hashed(seed, cfg_a)
+        entries += len(a.hashes)
+        if args.save:
+            a.save(args.save)
+            print(f"Saved {len(a.hashes)} entries to {args.save}")
+        if args.against:
+            b, b_cfg = StateHasher.load(args.against), None
+        elif args.save:
+            continue
+        else:
+            b, b_cfg = run_hashed(seed, cfg_b), cfg_b
+        idx = first_divergence(a.hashes, b.hashes)
+        if idx is not None:
+            diverged += 1
+            report(seed, idx, a, b, cfg_a, b_cfg)
+    elapsed = time.perf_counter() - start
+    if not args.save or args.against:
+        print(f"{args.seeds} seed(s), {entries} entries hashed, {diverged} diverged ({elapsed:.1f}s)")
+    if diverged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
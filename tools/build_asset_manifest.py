@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from ui.asset_index import MANIFEST_PATH, AssetIndex
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Write assets/manifest.json so the game skips scanning assets/ at startup"
+    )
+    parser.add_argument("--out", type=Path, default=MANIFEST_PATH)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    index = AssetIndex.scan([REPO_ROOT])
+    index.write_manifest(args.out)
+    print(f"Indexed {len(index)} files into {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Pack item images and expert portraits into texture atlas sheets.
+
+Every image under the given asset folders is downscaled so its longest side
+is at most --max-side, then shelf-packed into --sheet-size square sheets.
+Writes ``atlas_<n>.png`` sheets plus ``index.json`` mapping each source path
+(relative to the repo, e.g. ``assets/experts/x.png``) to its sheet and rect.
+The game picks the atlas up automatically (see ui/render/atlas.py); rerun
+this after adding or regenerating images.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from ui.render.atlas import ATLAS_DIR, INDEX_NAME
+from ui.render.image_cache import _downscale
+
+DEFAULT_SOURCES = ("assets/items", "assets/experts")
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+PADDING = 2
+
+
+def collect_images(sources: list[str]) -> list[Path]:
+    paths = []
+    for source in sources:
+        for dirpath, _dirnames, filenames in os.walk(REPO_ROOT / source):
+            for filename in sorted(filenames):
+                if filename.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(Path(dirpath) / filename)
+    return sorted(paths)
+
+
+def shelf_pack(sizes: list[tuple[int, int]], sheet_size: int) -> list[tuple[int, int, int]]:
+    """Place rectangles on horizontal shelves; returns (sheet, x, y) per size.
+
+    Tallest-first ordering keeps shelves tight for the mostly square item art.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements: list[tuple[int, int, int]] = [(0, 0, 0)] * len(sizes)
+    sheet, x, y, shelf_h = 0, PADDING, PADDING, 0
+    for i in order:
+        w, h = sizes[i]
+        if w + 2 * PADDING > sheet_size or h + 2 * PADDING > sheet_size:
+            raise ValueError(f"Image of size {w}x{h} does not fit a {sheet_size}px sheet")
+        if x + w + PADDING > sheet_size:
+            x, y, shelf_h = PADDING, y + shelf_h + PADDING, 0
+        if y + h + PADDING > sheet_size:
+            sheet, x, y, shelf_h = sheet + 1, PADDING, PADDING, 0
+        placements[i] = (sheet, x, y)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+    return placements
+
+
+def build_atlas(sources: list[str], out_dir: Path, *, max_side: int, sheet_size: int) -> dict:
+    images = []
+    paths = []
+    for path in collect_images(sources):
+        try:
+            img = pygame.image.load(str(path))
+        except pygame.error as exc:
+            print(f"Skipping {path}: {exc}")
+            continue
+        images.append(_downscale(img, max_side))
+        paths.append(path)
+
+    placements = shelf_pack([img.get_size() for img in images], sheet_size)
+    n_sheets = max((p[0] for p in placements), default=-1) + 1
+    sheets = [pygame.Surface((sheet_size, sheet_size), pygame.SRCALPHA) for _ in range(n_sheets)]
+
+    entries = {}
+    for path, img, (sheet, x, y) in zip(paths, images, placements):
+        # RGBA_MAX onto the cleared sheet copies pixels (alpha included) as-is
+        # instead of blending them against transparent black.
+        sheets[sheet].blit(img, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        entries[path.relative_to(REPO_ROOT).as_posix()] = {"sheet": sheet, "rect": [x, y, *img.get_size()]}
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    sheet_names = []
+    for idx, sheet in enumerate(sheets):
+        name = f"atlas_{idx}.png"
+        pygame.image.save(sheet, str(out_dir / name))
+        sheet_names.append(name)
+
+    index = {"max_side": max_side, "sheets": sheet_names, "entries": entries}
+    (out_dir / INDEX_NAME).write_text(json.dumps(index, indent=2), encoding="utf-8")
+    return index
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pack item and portrait images into atlas sheets")
+    parser.add_argument("--sources", nargs="+", default=list(DEFAULT_SOURCES), help="Asset folders to pack")
+    parser.add_argument("--out-dir", type=Path, default=ATLAS_DIR)
+    parser.add_argument("--max-side", type=int, default=256, help="Longest side of each packed image")
+    parser.add_argument("--sheet-size", type=int, default=2048)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    pygame.init()
+    index = build_atlas(args.sources, args.out_dir, max_side=args.max_side, sheet_size=args.sheet_size)
+    print(f"Packed {len(index['entries'])} images into {len(index['sheets'])} sheet(s) in {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Paired comparison of two balance configs (sim/variance_reduction.py).
+
+Both configs play the same episodes on common random numbers. Antithetic
+twins and a true-value control variate are on by default. The script
+prints each metric's difference (B - A) with a confidence interval and
+how many times more episodes independent runs would need.
+
+Examples:
+  python tools/compare_balance.py --set-b auction_house.condition_scale=0.8
+  python tools/compare_balance.py --config-a base.json --config-b tuned.json --runs 400
+  python tools/compare_balance.py --set-b 'shop_pricing.fair=[0.6, 0.9]' --out reports/paired.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from sim.balance_config import BalanceConfig
+from sim.variance_reduction import compare_configs
+
+
+def apply_overrides(cfg: BalanceConfig, overrides: list[str]) -> BalanceConfig:
+    data = cfg.to_dict()
+    for override in overrides:
+        path, _, raw = override.partition("=")
+        *parents, leaf = path.split(".")
+        node = data
+        for key in parents:
+            if not isinstance(node, dict) or key not in node:
+                raise SystemExit(f"Unknown balance config field: {path}")
+            node = node[key]
+        if not isinstance(node, dict) or leaf not in node:
+            raise SystemExit(f"Unknown balance config field: {path}")
+        try:
+            node[leaf] = json.loads(raw)
+        except json.JSONDecodeError:
+            node[leaf] = raw
+    return BalanceConfig.from_dict(data)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare two balance configs with paired, variance-reduced runs")
+    parser.add_argument("--config-a", type=Path, help="Baseline balance config JSON (default: built-in)")
+    parser.add_argument("--config-b", type=Path, help="Candidate balance config JSON (default: config A)")
+    parser.add_argument("--set-b", action="append", default=[], metavar="SECTION.FIELD=VALUE", help="Override on config B")
+    parser.add_argument("--runs", type=int, default=200, help="Paired episodes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--pricing-style", type=str, default="fair", choices=["fair", "overpriced", "chaotic"])
+    parser.add_argument("--items-per-team", type=int, default=3)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--no-antithetic", action="store_true", help="Skip the antithetic twin episodes")
+    parser.add_argument("--no-control", action="store_true", help="Skip the true-value control variate")
+    parser.add_argument("--out", type=Path, help="Optional JSON report path")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    cfg_a = BalanceConfig.from_json(args.config_a) if args.config_a else BalanceConfig()
+    cfg_b = BalanceConfig.from_json(args.config_b) if args.config_b else BalanceConfig.from_dict(cfg_a.to_dict())
+    cfg_b = apply_overrides(cfg_b, args.set_b)
+
+    start = time.perf_counter()
+    report = compare_configs(
+        cfg_a,
+        cfg_b,
+        runs=args.runs,
+        seed=args.seed,
+        antithetic=not args.no_antithetic,
+        control_variate=not args.no_control,
+        confidence=args.confidence,
+        pricing_style=args.pricing_style,
+        items_per_team=args.items_per_team,
+    )
+    elapsed = time.perf_counter() - start
+
+    pct = round(report.confidence * 100)
+    print(f"{'metric':<14} {'A':>10} {'B':>10} {'B - A':>10} {f'{pct}% CI':>22} {'efficiency':>11}")
+    for m in report.metrics.values():
+        mark = " *" if m.significant else ""
+        ci = f"[{m.ci_low:+.3f}, {m.ci_high:+.3f}]"
+        print(f"{m.name:<14} {m.mean_a:>10.3f} {m.mean_b:>10.3f} {m.diff:>+10.3f} {ci:>22} {m.efficiency:>10.1f}x{mark}")
+    print(f"{report.runs} paired episodes, {report.episodes_simulated} simulated in {elapsed:.1f}s (* = CI excludes 0)")
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+        print(f"Saved report to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Record episodes to binary event logs and time replaying them.
+
+Simulates --episodes seeds headlessly with an EpisodeRecorder attached,
+writes one log per episode to --out (if given), then rebuilds every episode
+from its log with sim/event_log.replay and compares the two timings. With
+--replay, just replays existing log files and prints their outcomes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from config import GameConfig
+from models.episode import Episode
+from sim.dataset_registry import get_item_factory
+from sim.event_log import EpisodeRecorder, EventLog, replay
+from sim.timeline import record_episode
+
+
+def simulate(seed: int, cfg: GameConfig, tick_every: int) -> tuple[bytes, float]:
+    """Run one episode to results; returns its log and the wall seconds taken."""
+    start = time.perf_counter()
+    episode = Episode(
+        ep_idx=0,
+        seed=seed,
+        play_rect=(0, 0, cfg.window_w - cfg.hud_w, cfg.window_h),
+        items_per_team=cfg.items_per_team,
+        starting_budget=cfg.starting_budget,
+        expert_min_budget=cfg.expert_min_budget,
+        cfg=cfg,
+        item_factory=get_item_factory(cfg.item_source),
+        recorder=EpisodeRecorder(tick_every=tick_every),
+    )
+    episode.setup()
+    record_episode(episode, cfg)
+    elapsed = time.perf_counter() - start
+    return episode.recorder.to_bytes(), elapsed
+
+
+def time_replay(data: bytes, repeats: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        replay(data)
+    return (time.perf_counter() - start) / repeats
+
+
+def describe(path: Path):
+    log = EventLog.load(path)
+    replayed = replay(log)
+    winner = replayed.winner.name if replayed.winner else "-"
+    print(f"{path.name}: seed {log.seed}, episode {log.ep_idx}, winner {winner}")
+    for team in replayed.teams:
+        items = ", ".join(f"{it.name} ${it.shop_price:.0f}->${it.auction_price:.0f}" for it in team.items_bought)
+        print(f"  {team.name}: profit {team.profit:+.2f}  [{items}]")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Record episodes as event logs and benchmark replay")
+    parser.add_argument("--episodes", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the first episode (then +1 per episode)")
+    parser.add_argument("--tick-every", type=int, default=3, help="Keep every Nth market tick (0 = none)")
+    parser.add_argument("--out", type=Path, help="Directory to write <seed>.bhel logs to")
+    parser.add_argument("--replay", type=Path, nargs="+", help="Replay these log files instead")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.replay:
+        for path in args.replay:
+            describe(path)
+        return
+
+    # Episodes load data/ relative to the working directory.
+    os.chdir(REPO_ROOT)
+    cfg = GameConfig(show_host_intro=False, show_splash_video=False)
+    if args.out:
+        args.out.mkdir(parents=True, exist_ok=True)
+
+    sim_s, replay_s, sizes = [], [], []
+    for seed in range(args.seed, args.seed + args.episodes):
+        data, elapsed = simulate(seed, cfg, args.tick_every)
+        sim_s.append(elapsed)
+        replay_s.append(time_replay(data))
+        sizes.append(len(data))
+        if args.out:
+            (args.out / f"{seed}.bhel").write_bytes(data)
+
+    sim_ms = statistics.median(sim_s) * 1000
+    replay_ms = statistics.median(replay_s) * 1000
+    print(f"{args.episodes} episode(s); median log size {statistics.median(sizes) / 1024:.1f} KB")
+    print(f"simulate: {sim_ms:.1f} ms  replay: {replay_ms:.3f} ms  ({sim_ms / replay_ms:,.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
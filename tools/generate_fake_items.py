@@ -5,6 +5,7 @@ import json
 import os
 import random
 import string
+import sys
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import List, Dict, Tuple
@@ -69,6 +70,17 @@ CATEGORY_VALUE_MULT = {
     "books": 0.8,
 }
 
+# Era bump (older tends to be more valuable, but not always)
+ERA_VALUE_MULT = {
+    "Georgian": 1.35,
+    "Victorian": 1.25,
+    "Edwardian": 1.15,
+    "Art Deco": 1.30,
+    "Mid-century": 1.10,
+    "Retro 70s": 0.95,
+    "Vintage 80s": 0.9,
+}
+
 # -----------------------------
 # Data model
 # -----------------------------
@@ -117,16 +129,7 @@ def _estimate_true_value(category: str, era: str, year_hint: int, condition: flo
     # Baseline
     base = random.uniform(15, 120)
 
-    # Era bump (older tends to be more valuable, but not always)
-    era_mult = {
-        "Georgian": 1.35,
-        "Victorian": 1.25,
-        "Edwardian": 1.15,
-        "Art Deco": 1.30,
-        "Mid-century": 1.10,
-        "Retro 70s": 0.95,
-        "Vintage 80s": 0.9,
-    }.get(era, 1.0)
+    era_mult = ERA_VALUE_MULT.get(era, 1.0)
 
     cat_mult = CATEGORY_VALUE_MULT.get(category, 1.0)
 
@@ -248,5 +251,298 @@ def generate_items(
 
     return items
 
+# -----------------------------
+# Vectorized generator (large catalogs)
+# -----------------------------
+# Draws every column as a NumPy array, builds titles/prompts once per distinct
+# combination, and splits the catalog into fixed-size chunks seeded from
+# (seed, chunk index). Chunks are generated in worker processes and streamed
+# to disk in order, so output depends only on seed and chunk size — not on
+# how many workers ran. Requires NumPy (not needed by the game itself).
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+CONDITION_BANDS = (0.50, 0.70, 0.85)  # thresholds for _condition_descriptor
+RARITY_BANDS = (0.45, 0.75)           # thresholds for _rarity_descriptor
+ID_ALPHABET = string.ascii_lowercase + string.digits
+OUTPUT_FORMATS = ("jsonl", "csv", "catalog")
+
+
+class _Tables:
+    """Flat lookup tables shared by every chunk."""
+
+    def __init__(self):
+        self.categories = list(CATEGORIES.keys())
+        self.types: list[str] = []
+        self.type_start, self.type_count = [], []
+        self.materials: list[str] = []
+        self.mat_start, self.mat_count = [], []
+        for cat in self.categories:
+            self.type_start.append(len(self.types))
+            self.type_count.append(len(CATEGORIES[cat]))
+            self.types.extend(CATEGORIES[cat])
+            pool = MATERIALS_BY_CATEGORY.get(cat, ["mixed materials"])
+            self.mat_start.append(len(self.materials))
+            self.mat_count.append(len(pool))
+            self.materials.extend(pool)
+        self.type_start = np.array(self.type_start)
+        self.type_count = np.array(self.type_count)
+        self.mat_start = np.array(self.mat_start)
+        self.mat_count = np.array(self.mat_count)
+        self.cat_mult = np.array([CATEGORY_VALUE_MULT.get(c, 1.0) for c in self.categories])
+        self.eras = [e[0] for e in ERAS]
+        self.era_lo = np.array([e[1] for e in ERAS])
+        self.era_span = np.array([e[2] - e[1] + 1 for e in ERAS])
+        self.era_mult = np.array([ERA_VALUE_MULT.get(e, 1.0) for e in self.eras])
+        self.cond_desc = [_condition_descriptor(v) for v in (0.0,) + CONDITION_BANDS]
+        self.rar_desc = [_rarity_descriptor(v) for v in (0.0,) + RARITY_BANDS]
+        self.alphabet = np.frombuffer(ID_ALPHABET.encode("ascii"), dtype="S1")
+
+
+def _lookup(keys, build):
+    """Format one string per distinct key and broadcast back to every row."""
+    uniq, inverse = np.unique(keys, return_inverse=True)
+    table = np.array([build(int(k)) for k in uniq], dtype=object)
+    return table[inverse]
+
+
+def generate_chunk_columns(seed: int, chunk_idx: int, size: int, *,
+                           style_clause: str = DEFAULT_STYLE_CLAUSE,
+                           image_dir_hint: str = "assets/items/generated") -> Dict[str, object]:
+    """Generate one chunk of fake items as column arrays."""
+    if np is None:
+        raise RuntimeError("The vectorized generator needs NumPy: pip install numpy")
+    t = _Tables()
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk_idx,)))
+
+    cat = rng.integers(0, len(t.categories), size)
+    type_idx = t.type_start[cat] + (rng.random(size) * t.type_count[cat]).astype(np.int64)
+    era = rng.integers(0, len(t.eras), size)
+    year = t.era_lo[era] + (rng.random(size) * t.era_span[era]).astype(np.int64)
+    condition = np.round(np.clip(rng.normal(0.72, 0.18, size), 0.0, 1.0), 2)
+    rarity = np.round(np.clip(rng.random(size) ** 2, 0.0, 1.0), 2)
+
+    # Two distinct materials from the category pool (sample without replacement).
+    pool = t.mat_count[cat]
+    first = (rng.random(size) * pool).astype(np.int64)
+    second = (rng.random(size) * np.maximum(pool - 1, 1)).astype(np.int64)
+    second = np.where(second >= first, second + 1, second)
+    has_second = pool > 1
+    mat0 = t.mat_start[cat] + first
+    mat1 = np.where(has_second, t.mat_start[cat] + second, -1)
+
+    base = rng.uniform(15, 120, size)
+    noise = rng.lognormal(0.0, 0.28, size)
+    value = (base * t.era_mult[era] * t.cat_mult[cat] * (0.55 + 0.75 * condition)
+             * (0.85 + 1.5 * rarity) * noise)
+    true_value = np.clip(np.round(value), 5, 1200).astype(np.int64)
+
+    id_chars = t.alphabet[rng.integers(0, len(ID_ALPHABET), (size, 8))]
+    ids = np.char.add("it_", id_chars.view("S8").ravel().astype("U8"))
+
+    n_types, n_mats, n_eras = len(t.types), len(t.materials) + 1, len(t.eras)
+    title_key = (era * n_mats + mat0) * n_types + type_idx
+    titles = _lookup(
+        title_key,
+        lambda k: _make_title(
+            t.eras[k // n_types // n_mats], [t.materials[k // n_types % n_mats]], t.types[k % n_types]
+        ),
+    )
+
+    cond_band = np.searchsorted(CONDITION_BANDS, condition, side="right")
+    rar_band = np.searchsorted(RARITY_BANDS, rarity, side="right")
+    prompt_key = ((((rar_band * 4 + cond_band) * n_eras + era) * n_types + type_idx) * n_mats + mat0) * n_mats + (mat1 + 1)
+
+    def _prompt(k: int) -> str:
+        k, m1 = divmod(k, n_mats)
+        k, m0 = divmod(k, n_mats)
+        k, ty = divmod(k, n_types)
+        k, er = divmod(k, n_eras)
+        rb, cb = divmod(k, 4)
+        mats = [t.materials[m0]] + ([t.materials[m1 - 1]] if m1 else [])
+        cond = (0.0,) + CONDITION_BANDS
+        rar = (0.0,) + RARITY_BANDS
+        return _make_image_prompt("", t.types[ty], t.eras[er], mats, cond[cb], rar[rb], style_clause)
+
+    prompts = _lookup(prompt_key, _prompt)
+    materials = [
+        [t.materials[a]] + ([t.materials[b]] if b >= 0 else [])
+        for a, b in zip(mat0.tolist(), mat1.tolist())
+    ]
+
+    return {
+        "item_id": ids,
+        "title": titles,
+        "category": np.array(t.categories, dtype=object)[cat],
+        "item_type": np.array(t.types, dtype=object)[type_idx],
+        "era": np.array(t.eras, dtype=object)[era],
+        "year_hint": year,
+        "materials": materials,
+        "condition_score": condition,
+        "rarity_score": rarity,
+        "true_value": true_value,
+        "prompt_image": prompts,
+        "image_filename": np.char.add(np.char.add(f"{image_dir_hint.rstrip('/')}/", ids), ".png"),
+    }
+
+
+_FIELDS = [f for f in FakeItem.__dataclass_fields__]
+
+
+def _rows(cols: Dict[str, object]):
+    lists = [cols[f].tolist() if hasattr(cols[f], "tolist") else cols[f] for f in _FIELDS]
+    for values in zip(*lists):
+        yield dict(zip(_FIELDS, values))
+
+
+def encode_chunk(cols: Dict[str, object], fmt: str, *, header: bool = False) -> bytes:
+    """Serialise a generated chunk as JSONL, CSV or binary catalog bytes."""
+    if fmt == "jsonl":
+        return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in _rows(cols)).encode("utf-8")
+    if fmt == "csv":
+        import io
+
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=_FIELDS)
+        if header:
+            writer.writeheader()
+        writer.writerows(_rows(cols))
+        return buf.getvalue().encode("utf-8")
+    if fmt == "catalog":
+        from sim.item_catalog import encode_chunk as encode_catalog_chunk
+
+        rarity = cols["rarity_score"]
+        attributes = [
+            {"dataset_id": i, "item_type": ty, "year_hint": str(y), "materials": ", ".join(m)}
+            for i, ty, y, m in zip(cols["item_id"].tolist(), cols["item_type"].tolist(),
+                                   cols["year_hint"].tolist(), cols["materials"])
+        ]
+        return encode_catalog_chunk({
+            "condition": cols["condition_score"],
+            "rarity": rarity,
+            "style_score": rarity,  # matches ItemDatabase.load_jsonl's default
+            "true_value": cols["true_value"].astype(float),
+            "name": cols["title"].tolist(),
+            "category": cols["category"].tolist(),
+            "era": cols["era"].tolist(),
+            "description": cols["prompt_image"].tolist(),
+            "image": cols["image_filename"].tolist(),
+            "attributes": attributes,
+        })
+    raise ValueError(f"Unknown output format '{fmt}'")
+
+
+def _chunk_task(task) -> Dict[str, bytes]:
+    seed, chunk_idx, size, formats, style_clause, image_dir_hint = task
+    cols = generate_chunk_columns(seed, chunk_idx, size, style_clause=style_clause, image_dir_hint=image_dir_hint)
+    return {fmt: encode_chunk(cols, fmt, header=(fmt == "csv" and chunk_idx == 0)) for fmt in formats}
+
+
+def generate_items_vectorized(
+    n: int,
+    seed: int = 123,
+    *,
+    workers: int = 1,
+    chunk_size: int = 100_000,
+    formats: Tuple[str, ...] = ("jsonl", "csv"),
+    out_dir: str = "data",
+    style_clause: str = DEFAULT_STYLE_CLAUSE,
+    image_dir_hint: str = "assets/items/generated",
+) -> Dict[str, Path]:
+    """Generate ``n`` items in parallel chunks and stream them to disk.
+
+    Returns the written path per format. The catalog format is the binary one
+    read by ``ItemDatabase.load_catalog``.
+    """
+    from multiprocessing import Pool
+
+    for fmt in formats:
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format '{fmt}'")
+    if np is None:
+        raise RuntimeError("The vectorized generator needs NumPy: pip install numpy")
+
+    suffix = {"jsonl": "jsonl", "csv": "csv", "catalog": "bhcat"}
+    paths = {fmt: Path(out_dir) / f"items_{n}.{suffix[fmt]}" for fmt in formats}
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+
+    tasks = [
+        (seed, idx, min(chunk_size, n - start), formats, style_clause, image_dir_hint)
+        for idx, start in enumerate(range(0, n, chunk_size))
+    ]
+
+    from sim.item_catalog import CatalogWriter
+
+    files = {fmt: open(paths[fmt], "wb") for fmt in formats if fmt != "catalog"}
+    catalog = CatalogWriter(paths["catalog"]) if "catalog" in formats else None
+    try:
+        if workers > 1:
+            with Pool(workers) as pool:
+                results = pool.imap(_chunk_task, tasks)
+                _write_chunks(results, files, catalog)
+        else:
+            _write_chunks(map(_chunk_task, tasks), files, catalog)
+    finally:
+        for f in files.values():
+            f.close()
+        if catalog:
+            catalog.close()
+
+    for path in paths.values():
+        print(f"Wrote: {path}")
+    return paths
+
+
+def _write_chunks(results, files, catalog):
+    for encoded in results:
+        for fmt, data in encoded.items():
+            if fmt == "catalog":
+                catalog.write_chunk(data)
+            else:
+                files[fmt].write(data)
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic item catalog")
+    parser.add_argument("--n", type=int, default=100, help="Number of items to generate")
+    parser.add_argument("--seed", type=int, default=123)
+    parser.add_argument("--out-dir", type=str, default="data")
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Use the NumPy chunked generator (for catalogs of millions of items)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument(
+        "--formats",
+        type=str,
+        default="jsonl,csv",
+        help=f"Comma-separated outputs for --vectorized: {', '.join(OUTPUT_FORMATS)}",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.vectorized:
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+        generate_items_vectorized(
+            n=args.n,
+            seed=args.seed,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            formats=tuple(f.strip() for f in args.formats.split(",") if f.strip()),
+            out_dir=args.out_dir,
+        )
+    else:
+        generate_items(n=args.n, seed=args.seed, out_dir=args.out_dir)
+
+
 if __name__ == "__main__":
-    generate_items(n=100, seed=123)
+    main()
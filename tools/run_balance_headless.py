@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import math
 import sys
 from pathlib import Path
 
@@ -9,6 +10,7 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from sim.balance_config import BalanceConfig
+from sim.early_stopping import METRICS
 from sim.headless_balance_runner import run_headless, save_report
 
 
@@ -24,9 +26,34 @@ def parse_args():
     parser.add_argument("--negotiate-min", type=float, default=0.05)
     parser.add_argument("--negotiate-max", type=float, default=0.20)
     parser.add_argument("--csv", type=Path, help="Optional CSV output path with per-run metrics")
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        metavar="METRIC=HALF_WIDTH",
+        help=f"Stop early once this CI half-width is met (repeatable; --runs is the budget). Metrics: {', '.join(METRICS)}",
+    )
+    parser.add_argument("--confidence", type=float, default=0.95, help="Confidence level for --target")
+    parser.add_argument("--batch", type=int, default=50, help="Episodes between --target checks")
     return parser.parse_args()
 
 
+def parse_targets(targets: list[str]) -> dict[str, float]:
+    precision = {}
+    for target in targets:
+        name, _, raw = target.partition("=")
+        if name not in METRICS:
+            raise SystemExit(f"Unknown metric {name!r}; choose from {', '.join(METRICS)}")
+        try:
+            half_width = float(raw)
+        except ValueError:
+            half_width = math.nan
+        if not half_width > 0:
+            raise SystemExit(f"--target expects METRIC=HALF_WIDTH with a positive half-width, got {target!r}")
+        precision[name] = half_width
+    return precision
+
+
 def main():
     args = parse_args()
     cfg = BalanceConfig.from_json(args.config) if args.config else BalanceConfig()
@@ -40,9 +67,16 @@ def main():
         negotiate_max=args.negotiate_max,
         cfg=cfg,
         csv_path=args.csv,
+        precision=parse_targets(args.target),
+        confidence=args.confidence,
+        batch=args.batch,
     )
     save_report(report, args.out)
     print(f"Saved report to {args.out}")
+    if "stopping" in report:
+        stopping = report["stopping"]
+        widths = ", ".join(f"{name} +/-{width:.4g}" for name, width in stopping["half_widths"].items())
+        print(f"Used {report['meta']['runs_used']} of {args.runs} runs ({stopping['reason']}): {widths}")
     if args.csv:
         print(f"Saved per-run CSV to {args.csv}")
 
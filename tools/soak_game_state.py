@@ -0,0 +1,194 @@
+"""Soak-test the full GameState phase machine without a window.
+
+Runs episodes back to back through every phase (market, expert hand-off and
+shopping, reveal, both auctions, results) on the SDL dummy video driver,
+rendering every update into an offscreen display surface (see
+--render-every) so the text, image and atlas caches are soaked too. Reports
+wall and sim time per phase, market steps per second, and optionally
+(--trace-memory) how much traced memory grows per episode, which flags
+leaks in screen state and render caches.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+
+from config import GameConfig
+from game_state import GameState
+
+
+@dataclass
+class PhaseStats:
+    updates: int = 0
+    wall_s: float = 0.0
+    sim_s: float = 0.0
+    renders: int = 0
+    render_s: float = 0.0
+
+
+@dataclass
+class SoakReport:
+    episodes: int
+    time_scale: float
+    wall_s: float = 0.0
+    market_steps: int = 0
+    market_steps_per_s: float = 0.0
+    updates_per_s: float = 0.0
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+    memory_kb_after_first: float | None = None
+    memory_kb_after_last: float | None = None
+    memory_kb_peak: float | None = None
+
+    @property
+    def memory_growth_kb_per_episode(self) -> float | None:
+        if self.memory_kb_after_first is None or self.episodes < 2:
+            return None
+        return (self.memory_kb_after_last - self.memory_kb_after_first) / (self.episodes - 1)
+
+
+def run_episode(state: GameState, frame_dt: float, max_updates: int, phases: dict, render_to=None, render_every: int = 1) -> int:
+    """Drive one GameState to RESULTS; returns the number of market steps run."""
+    market_steps = 0
+    for n in range(max_updates):
+        if state.phase == "RESULTS":
+            return market_steps
+        phase = state.phase
+        stats = phases[phase]
+        start = time.perf_counter()
+        simulated = state.update(frame_dt)
+        stats.wall_s += time.perf_counter() - start
+        stats.updates += 1
+        stats.sim_s += simulated
+        if phase == "MARKET":
+            market_steps += round(simulated / state.market_clock.step)
+        if render_to is not None and render_every and n % render_every == 0:
+            start = time.perf_counter()
+            state.render(render_to)
+            stats.render_s += time.perf_counter() - start
+            stats.renders += 1
+    raise RuntimeError(f"Episode stuck in phase {state.phase} after {max_updates} updates")
+
+
+def run_soak(
+    episodes: int,
+    seed: int,
+    *,
+    time_scale: float = 1000.0,
+    cfg: GameConfig | None = None,
+    render_every: int = 1,
+    trace_memory: bool = False,
+    max_updates: int = 200_000,
+) -> SoakReport:
+    cfg = cfg or GameConfig()
+    frame_dt = 1.0 / cfg.fps
+    # Let a frame run all the steps the speed asks for instead of dropping them.
+    steps_per_frame = math.ceil(frame_dt * time_scale / cfg.sim_step_s) + 1
+    cfg = replace(cfg, show_host_intro=False, show_splash_video=False, max_sim_steps_per_frame=steps_per_frame)
+
+    report = SoakReport(episodes=episodes, time_scale=time_scale)
+    phases: dict[str, PhaseStats] = defaultdict(PhaseStats)
+
+    pygame.init()
+    try:
+        surface = pygame.display.set_mode((cfg.window_w, cfg.window_h))
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        for idx in range(episodes):
+            state = GameState(cfg=cfg, seed=seed + idx, episode_idx=idx)
+            state.time_scale = time_scale
+            report.market_steps += run_episode(
+                state, frame_dt, max_updates, phases, render_to=surface, render_every=render_every
+            )
+            del state
+            if trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                if idx == 0:
+                    report.memory_kb_after_first = current / 1024
+                report.memory_kb_after_last = current / 1024
+                report.memory_kb_peak = peak / 1024
+        report.wall_s = time.perf_counter() - start
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+        pygame.quit()
+
+    total_updates = sum(stats.updates for stats in phases.values())
+    market_wall = phases["MARKET"].wall_s if "MARKET" in phases else 0.0
+    report.market_steps_per_s = report.market_steps / market_wall if market_wall else 0.0
+    report.updates_per_s = total_updates / report.wall_s if report.wall_s else 0.0
+    report.phases = dict(phases)
+    return report
+
+
+def format_report(report: SoakReport) -> str:
+    lines = [
+        f"{report.episodes} episode(s) at {report.time_scale:g}x in {report.wall_s:.2f}s wall",
+        f"market steps: {report.market_steps} ({report.market_steps_per_s:,.0f}/s), "
+        f"updates: {report.updates_per_s:,.0f}/s",
+        f"{'phase':<16}{'updates':>10}{'wall s':>10}{'sim s':>12}{'renders':>10}{'render s':>10}",
+    ]
+    for phase, stats in report.phases.items():
+        lines.append(
+            f"{phase:<16}{stats.updates:>10}{stats.wall_s:>10.3f}{stats.sim_s:>12.1f}"
+            f"{stats.renders:>10}{stats.render_s:>10.3f}"
+        )
+    if report.memory_kb_after_last is not None:
+        growth = report.memory_growth_kb_per_episode
+        lines.append(
+            f"traced memory: {report.memory_kb_after_last:,.0f} KB now, {report.memory_kb_peak:,.0f} KB peak"
+            + (f", {growth:+,.1f} KB/episode after the first" if growth is not None else "")
+        )
+    return "\n".join(lines)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run GameState headless through whole episodes")
+    parser.add_argument("--episodes", type=int, default=20, help="Number of episodes to run back to back")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the first episode (then +1 per episode)")
+    parser.add_argument("--time-scale", type=float, default=1000.0, help="Sim seconds per frame second")
+    parser.add_argument("--render-every", type=int, default=1, help="Render every Nth update (0 = never)")
+    parser.add_argument("--trace-memory", action="store_true", help="Track memory growth with tracemalloc")
+    parser.add_argument("--json", type=Path, help="Optional path to write the report as JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    # GameState loads data/ and assets/ relative to the working directory.
+    os.chdir(REPO_ROOT)
+    report = run_soak(
+        args.episodes,
+        args.seed,
+        time_scale=args.time_scale,
+        render_every=args.render_every,
+        trace_memory=args.trace_memory,
+    )
+    print(format_report(report))
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        payload = asdict(report)
+        payload["memory_growth_kb_per_episode"] = report.memory_growth_kb_per_episode
+        args.json.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        print(f"Saved report to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Check the analytic sale model (sim/analytic.py) against Monte Carlo.
+
+Draws a few teams of items from the catalog, prices them in the shop,
+then compares the closed-form per-item mean, std and P(loss) and the
+convolved per-team profit distribution with simulated auctions. Exits
+non-zero when any metric is more than --max-z standard errors off.
+
+Examples:
+  python tools/validate_analytic.py
+  python tools/validate_analytic.py --samples 50000 --teams 4 --pricing-style chaotic
+  python tools/validate_analytic.py --config reports/tuned.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from sim.analytic import team_profit_distribution, validate_against_monte_carlo
+from sim.balance_config import BalanceConfig
+from sim.item_factory import ItemFactory
+from sim.pricing import set_shop_price
+from sim.rng import RNG
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Validate analytic profit distributions against Monte Carlo")
+    parser.add_argument("--samples", type=int, default=20000, help="Simulated auctions")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--teams", type=int, default=2)
+    parser.add_argument("--items-per-team", type=int, default=3)
+    parser.add_argument("--pricing-style", type=str, default="fair", choices=["fair", "overpriced", "chaotic"])
+    parser.add_argument("--config", type=Path, help="Optional balance config JSON")
+    parser.add_argument("--max-z", type=float, default=4.0, help="Fail above this many standard errors")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    cfg = BalanceConfig.from_json(args.config) if args.config else BalanceConfig()
+    factory = ItemFactory.with_default_db()
+    rng = RNG(args.seed)
+    teams = []
+    item_id = 1
+    for _ in range(args.teams):
+        team = []
+        for _ in range(args.items_per_team):
+            item = factory.make_item(rng, item_id)
+            set_shop_price(item, rng, args.pricing_style, cfg=cfg)
+            team.append(item)
+            item_id += 1
+        teams.append(team)
+
+    start = time.perf_counter()
+    for team in teams:
+        team_profit_distribution(team, cfg)
+    analytic_s = time.perf_counter() - start
+    start = time.perf_counter()
+    rows = validate_against_monte_carlo(teams, cfg, samples=args.samples, seed=args.seed + 1)
+    total_s = time.perf_counter() - start
+
+    print(f"{'subject':<10} {'metric':<7} {'analytic':>11} {'monte carlo':>12} {'z':>7}")
+    worst = 0.0
+    for row in rows:
+        worst = max(worst, abs(row.z))
+        print(f"{row.subject:<10} {row.metric:<7} {row.analytic:>11.3f} {row.monte_carlo:>12.3f} {row.z:>+7.2f}")
+    print(f"analytic team distributions: {analytic_s * 1000:.1f} ms; validation with {args.samples} samples: {total_s:.1f}s")
+    print(f"worst |z| = {worst:.2f}")
+    if worst > args.max_z:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
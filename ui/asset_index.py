@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = REPO_ROOT / "assets" / "manifest.json"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+class AssetIndex:
+    """Lookup table from asset paths and names to files on disk.
+
+    Built by walking each root's ``assets/`` directory once (or from a
+    prebuilt manifest), so screens resolve images with dict lookups instead
+    of probing the filesystem per name, extension and root. Roots are
+    searched in order; the first one containing a path wins. Files added
+    after the index is built are not seen until `refresh()`.
+    """
+
+    def __init__(self, roots: Iterable[Path]):
+        self.roots: list[Path] = []
+        for root in roots:
+            root = Path(root).resolve()
+            if root not in self.roots:
+                self.roots.append(root)
+        self._files: dict[str, Path] = {}
+
+    @classmethod
+    def scan(cls, roots: Iterable[Path]) -> "AssetIndex":
+        index = cls(roots)
+        index.refresh()
+        return index
+
+    @classmethod
+    def from_manifest(cls, path: Path, root: Path = REPO_ROOT) -> "AssetIndex":
+        """Load an index written by `write_manifest` without touching the disk further."""
+        index = cls([root])
+        entries = json.loads(path.read_text(encoding="utf-8"))
+        base = index.roots[0]
+        for rel in entries["files"]:
+            index._files.setdefault(rel, base / rel)
+        return index
+
+    def refresh(self):
+        files: dict[str, Path] = {}
+        for root in self.roots:
+            for dirpath, _dirnames, filenames in os.walk(root / "assets"):
+                for filename in filenames:
+                    path = Path(dirpath) / filename
+                    files.setdefault(path.relative_to(root).as_posix(), path)
+        self._files = files
+
+    def write_manifest(self, path: Path = MANIFEST_PATH):
+        rels = sorted(rel for rel, file in self._files.items() if file.is_relative_to(self.roots[0]))
+        path.write_text(json.dumps({"files": rels}, indent=2), encoding="utf-8")
+
+    def resolve(self, candidate: str | Path) -> Path | None:
+        """Resolve a path such as ``assets/experts/x.png`` to an existing file."""
+        candidate = Path(candidate)
+        if candidate.is_absolute():
+            for root in self.roots:
+                if candidate.is_relative_to(root):
+                    return self._files.get(candidate.relative_to(root).as_posix())
+            # Outside every indexed root; nothing to look it up in.
+            return candidate if candidate.exists() else None
+        return self._files.get(candidate.as_posix())
+
+    def find_image(self, name: str) -> Path | None:
+        """Find ``assets/<name>.<ext>`` for an item name, as the old probing did."""
+        for base in (name, name.replace("/", "-")):
+            for ext in IMAGE_EXTENSIONS:
+                path = self._files.get(f"assets/{base}{ext}")
+                if path is not None:
+                    return path
+        return None
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+_index: AssetIndex | None = None
+
+
+def get_asset_index() -> AssetIndex:
+    """The shared index, built on first use from the manifest if present."""
+    global _index
+    if _index is None:
+        if MANIFEST_PATH.exists():
+            _index = AssetIndex.from_manifest(MANIFEST_PATH)
+        else:
+            _index = AssetIndex.scan([Path.cwd(), REPO_ROOT])
+    return _index
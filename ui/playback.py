@@ -0,0 +1,91 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+from config import GameConfig
+from sim.dataset_registry import get_item_factory
+from sim.market_cache import MarketCache
+from sim.timeline import TimelinePlayer, episode_memo, record_episode
+from ui.screens.replay_screen import RecordingScreen, ReplayScreen
+
+
+class PlaybackState:
+    """Record-then-playback alternative to GameState.
+
+    The whole episode is simulated headless on a worker thread first (a
+    "Simulating episode..." screen shows progress meanwhile), then played
+    back from its Timeline, so the UI never waits on AI and the episode can
+    be paused, scrubbed and rewound. It offers the same interface run_app
+    uses on GameState.
+    """
+
+    def __init__(self, cfg: GameConfig, seed: int, episode_idx: int):
+        self.cfg = cfg
+        self.seed = seed
+        self.episode_idx = episode_idx
+        self.player: TimelinePlayer | None = None
+        self.screen = RecordingScreen(cfg)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="episode-record")
+        self._future = self._executor.submit(self._record)
+
+    @property
+    def phase(self) -> str:
+        return self.player.phase if self.player is not None else "RECORDING"
+
+    @property
+    def ready(self) -> bool:
+        return self.player is not None
+
+    def _record(self):
+        from models.episode import Episode
+
+        cfg = self.cfg
+        episode = Episode(
+            ep_idx=self.episode_idx,
+            seed=self.seed,
+            play_rect=(0, 0, cfg.window_w - cfg.hud_w, cfg.window_h),
+            items_per_team=cfg.items_per_team,
+            starting_budget=cfg.starting_budget,
+            expert_min_budget=cfg.expert_min_budget,
+            cfg=cfg,
+            item_factory=get_item_factory(cfg.item_source),
+            market_cache=MarketCache(cfg.market_cache_dir) if cfg.market_cache_dir else None,
+        )
+        episode.setup()
+        pristine = copy.deepcopy(episode, episode_memo(episode))
+        timeline = record_episode(episode, cfg, progress=self._on_progress)
+        return timeline, pristine
+
+    def _on_progress(self, sim_t: float):
+        self.screen.progress = sim_t / self.cfg.market_seconds if self.cfg.market_seconds else 1.0
+
+    def wait(self, timeout: float | None = None):
+        """Block until the recording is done and playback is ready."""
+        self._future.result(timeout)
+        self._start_playback()
+
+    def _start_playback(self):
+        if self.player is not None:
+            return
+        timeline, pristine = self._future.result()
+        self._executor.shutdown(wait=False)
+        self.player = TimelinePlayer(timeline, pristine)
+        self.screen = ReplayScreen(self.cfg, self.player)
+
+    def handle_event(self, event):
+        self.screen.handle_event(event)
+
+    def update(self, dt: float) -> float:
+        """Advance playback by `dt` wall seconds; returns the timeline seconds played."""
+        if self.player is None:
+            if not self._future.done():
+                return 0.0
+            self._start_playback()
+        before = self.player.t
+        self.screen.update(dt)
+        return self.player.t - before
+
+    def should_render(self) -> bool:
+        return True
+
+    def render(self, surface):
+        self.screen.render(surface)
@@ -11,6 +11,8 @@ def run_app(
     market_seconds: Optional[float] = None,
     item_source: str = "generated",
     regen_experts: bool = False,
+    playback: bool = False,
+    bidders: Optional[int] = None,
 ):
     default_seconds = GameConfig().market_seconds
     cfg = GameConfig(
@@ -18,6 +20,8 @@ def run_app(
         item_source=item_source,
         expert_regen_allowed=regen_experts,
         expert_force_regen=regen_experts,
+        playback_mode=playback,
+        auction_bidders=bidders,
     )
     pygame.init()
     screen = pygame.display.set_mode((cfg.window_w, cfg.window_h))
@@ -28,8 +32,14 @@ def run_app(
         pygame.quit()
         return
 
-    state = GameState(cfg=cfg, seed=seed, episode_idx=episode_idx)
+    if cfg.playback_mode:
+        from ui.playback import PlaybackState
 
+        state = PlaybackState(cfg=cfg, seed=seed, episode_idx=episode_idx)
+    else:
+        state = GameState(cfg=cfg, seed=seed, episode_idx=episode_idx)
+
+    shown_screen = None
     running = True
     while running:
         dt = clock.tick(cfg.fps) / 1000.0
@@ -40,8 +50,14 @@ def run_app(
             state.handle_event(event)
 
         state.update(dt)
+        if not state.should_render():
+            continue
         screen.fill(BG)
-        state.render(screen)
-        pygame.display.flip()
+        dirty = state.render(screen)
+        if cfg.dirty_rect_updates and dirty is not None and state.screen is shown_screen:
+            pygame.display.update(dirty)
+        else:
+            pygame.display.flip()
+        shown_screen = state.screen
 
     pygame.quit()
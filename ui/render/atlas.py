@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pygame
+
+from ui.render.image_cache import DECODED_MAX_SIDE, ImageLoader, _downscale
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+ATLAS_DIR = REPO_ROOT / "assets" / "atlas"
+INDEX_NAME = "index.json"
+
+
+class TextureAtlas:
+    """Item images and portraits packed into a few sheets by tools/build_atlas.py.
+
+    Sheets are decoded on a background thread as soon as the atlas is
+    opened; images are then subsurfaces of a sheet, so there is no per-image
+    file open or decode. Paths not in the atlas (or an empty atlas when the
+    builder has not been run) fall back to loading individual files, as do
+    packed paths whose sheet cannot be decoded.
+    """
+
+    def __init__(self, index: dict | None = None, directory: Path = ATLAS_DIR):
+        index = index or {"sheets": [], "entries": {}}
+        self.directory = Path(directory)
+        self.max_side = index.get("max_side", DECODED_MAX_SIDE)
+        self.sheet_paths = [self.directory / name for name in index["sheets"]]
+        self.entries: dict[str, tuple[int, tuple[int, int, int, int]]] = {
+            rel: (entry["sheet"], tuple(entry["rect"])) for rel, entry in index["entries"].items()
+        }
+        self._images: dict[str, pygame.Surface | None] = {}
+        self._loader = ImageLoader(max_images=max(1, len(self.sheet_paths)), max_side=1 << 30)
+        for path in self.sheet_paths:
+            self._loader.request(path)
+
+    @classmethod
+    def load(cls, directory: Path = ATLAS_DIR) -> "TextureAtlas":
+        index_path = Path(directory) / INDEX_NAME
+        if not index_path.exists():
+            return cls(directory=directory)
+        return cls(json.loads(index_path.read_text(encoding="utf-8")), directory)
+
+    def _key(self, path: str | Path) -> str:
+        path = Path(path)
+        if path.is_absolute() and path.is_relative_to(REPO_ROOT):
+            path = path.relative_to(REPO_ROOT)
+        return path.as_posix()
+
+    def __contains__(self, path: str | Path) -> bool:
+        return self._key(path) in self.entries
+
+    def get(self, path: str | Path, *, block: bool = False) -> pygame.Surface | None:
+        """Return the packed image for `path`.
+
+        Returns None if the path is not packed or, unless `block` is set,
+        while its sheet is still being decoded. `block` decodes just that
+        sheet on the calling thread rather than waiting for the others. If
+        the sheet cannot be decoded the image is loaded from its own file.
+        """
+        key = self._key(path)
+        if key in self._images:
+            return self._images[key]
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        sheet_idx, rect = entry
+        sheet_path = self.sheet_paths[sheet_idx]
+        sheet = self._loader.load_now(sheet_path) if block else self._loader.get(sheet_path)
+        if sheet is not None:
+            img = sheet.subsurface(rect)
+        elif self._loader.failed(sheet_path):
+            img = self._load_file(key)
+        else:
+            return None
+        self._images[key] = img
+        return img
+
+    def _load_file(self, key: str) -> pygame.Surface | None:
+        try:
+            img = _downscale(pygame.image.load(str(REPO_ROOT / key)), self.max_side)
+        except (pygame.error, OSError, ValueError):
+            return None
+        if pygame.display.get_surface() is not None:
+            img = img.convert_alpha()
+        return img
+
+    def clear(self):
+        self._images.clear()
+        self._loader.clear()
+
+
+_atlas: TextureAtlas | None = None
+_quit_hook_registered = False
+
+
+def _on_pygame_quit():
+    global _atlas, _quit_hook_registered
+    _quit_hook_registered = False
+    _atlas = None
+
+
+def get_atlas() -> TextureAtlas:
+    """The shared atlas, opened (and its sheets queued for decoding) on first use."""
+    global _atlas, _quit_hook_registered
+    if _atlas is None:
+        _atlas = TextureAtlas.load()
+    if not _quit_hook_registered:
+        pygame.register_quit(_on_pygame_quit)
+        _quit_hook_registered = True
+    return _atlas
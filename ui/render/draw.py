@@ -1,9 +1,10 @@
 import pygame
 from constants import TEXT, MUTED, PANEL, PANEL_EDGE
+from ui.render.text_cache import render_text
 
 def draw_text(surface, text, x, y, font, color=TEXT):
-    img = font.render(text, True, color)
-    surface.blit(img, (x, y))
+    img = render_text(font, text, color)
+    return surface.blit(img, (x, y))
 
 def draw_panel(surface, rect):
     pygame.draw.rect(surface, PANEL, rect, border_radius=12)
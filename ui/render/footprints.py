@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from array import array
 from math import sqrt
 from typing import Dict, Iterable, Tuple
 
@@ -14,6 +15,12 @@ from constants import (
     TEAM_B,
 )
 
+# Enough for every actor's trail at 20x speed; older footprints are
+# overwritten first if it ever fills.
+FOOTPRINT_CAPACITY = 1024
+# Distinct fade levels; at 3.2 s lifetime a step every 0.2 s is invisible.
+FOOTPRINT_ALPHA_LEVELS = 16
+
 Color = Tuple[int, int, int]
 Point = Tuple[float, float]
 
@@ -85,19 +92,43 @@ class FootprintSpriteResolver:
 
 
 class FootprintTrailManager:
-    """Track recent footprints for actors and render them with fade-out."""
+    """Track recent footprints for actors and render them with fade-out.
+
+    Footprints live in a fixed-capacity ring buffer of parallel arrays and
+    are dropped in time order, so expiring them is just advancing the head.
+    Each sprite gets a precomputed ladder of faded copies; drawing picks a
+    rung instead of copying the sprite, so a frame allocates no surfaces.
+    When the buffer is full the oldest footprint is overwritten.
+    """
 
     def __init__(
         self,
         lifetime: float = FOOTPRINT_LIFETIME,
         min_distance: float = FOOTPRINT_STEP_DISTANCE,
+        capacity: int = FOOTPRINT_CAPACITY,
+        alpha_levels: int = FOOTPRINT_ALPHA_LEVELS,
     ):
         self.lifetime = lifetime
         self.min_distance = min_distance
-        self.footprints: list[dict[str, object]] = []
+        self.capacity = capacity
+        self.alpha_levels = alpha_levels
         self.last_drop: dict[str, Point] = {}
         self.time_elapsed = 0.0
 
+        self._x = array("d", bytes(8 * capacity))
+        self._y = array("d", bytes(8 * capacity))
+        self._born = array("d", bytes(8 * capacity))
+        self._sprite = array("i", bytes(4 * capacity))
+        self._head = 0
+        self._count = 0
+
+        self._sprite_index: dict[int, int] = {}
+        self._ladders: list[list[pygame.Surface]] = []
+        self._half_sizes: list[tuple[float, float]] = []
+
+    def __len__(self) -> int:
+        return self._count
+
     def update(
         self,
         dt: float,
@@ -105,9 +136,9 @@ class FootprintTrailManager:
         actor_sprites: Dict[str, pygame.Surface | None],
     ):
         self.time_elapsed += dt
-        cutoff = self.time_elapsed - self.lifetime
-        self.footprints = [fp for fp in self.footprints if fp["born"] >= cutoff]
+        self._expire(self.time_elapsed - self.lifetime)
 
+        min_sq = self.min_distance * self.min_distance
         for actor_key, pos in actor_positions.items():
             sprite = actor_sprites.get(actor_key)
             if sprite is None:
@@ -118,35 +149,75 @@ class FootprintTrailManager:
                 self._drop(actor_key, pos, sprite)
                 continue
 
-            if self._distance(pos, last_pos) >= self.min_distance:
+            dx = pos[0] - last_pos[0]
+            dy = pos[1] - last_pos[1]
+            if dx * dx + dy * dy >= min_sq:
                 self._drop(actor_key, pos, sprite)
 
-    def draw(self, surface: pygame.Surface):
-        cutoff = self.time_elapsed - self.lifetime
-        for fp in self.footprints:
-            born = fp["born"]
-            if born < cutoff:
-                continue
-            age = self.time_elapsed - born
-            sprite = fp["sprite"]
-            if sprite is None or age < 0:
-                continue
-            alpha = max(0, min(255, int(255 * (1 - age / self.lifetime))))
-            img = sprite if alpha >= 250 else self._with_alpha(sprite, alpha)
-            pos = fp["pos"]
-            surface.blit(img, (int(pos[0] - img.get_width() / 2), int(pos[1] - img.get_height() / 2)))
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """Blit every live footprint; returns the rects drawn to."""
+        now = self.time_elapsed
+        lifetime = self.lifetime
+        cutoff = now - lifetime
+        top = self.alpha_levels - 1
+        cap = self.capacity
+        xs, ys, borns, sprites = self._x, self._y, self._born, self._sprite
+        ladders, half_sizes = self._ladders, self._half_sizes
+        blit = surface.blit
+        drawn = []
+        add = drawn.append
+
+        idx = self._head
+        for _ in range(self._count):
+            born = borns[idx]
+            if born >= cutoff and born <= now:
+                sprite_idx = sprites[idx]
+                rung = int(top * (1.0 - (now - born) / lifetime) + 0.5)
+                if rung > 0:
+                    half_w, half_h = half_sizes[sprite_idx]
+                    add(blit(ladders[sprite_idx][rung], (int(xs[idx] - half_w), int(ys[idx] - half_h))))
+            idx += 1
+            if idx == cap:
+                idx = 0
+        return drawn
+
+    def _expire(self, cutoff: float):
+        borns, cap = self._born, self.capacity
+        while self._count and borns[self._head] < cutoff:
+            self._head = (self._head + 1) % cap
+            self._count -= 1
 
     def _drop(self, actor_key: str, pos: Point, sprite: pygame.Surface):
-        self.footprints.append({"pos": pos, "born": self.time_elapsed, "sprite": sprite})
+        if self._count == self.capacity:
+            # Full: overwrite the oldest footprint.
+            self._head = (self._head + 1) % self.capacity
+            self._count -= 1
+        idx = (self._head + self._count) % self.capacity
+        self._x[idx] = pos[0]
+        self._y[idx] = pos[1]
+        self._born[idx] = self.time_elapsed
+        self._sprite[idx] = self._sprite_slot(sprite)
+        self._count += 1
         self.last_drop[actor_key] = pos
 
-    def _distance(self, a: Point, b: Point) -> float:
-        return sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2)
-
-    def _with_alpha(self, sprite: pygame.Surface, alpha: int) -> pygame.Surface:
-        img = sprite.copy()
-        img.set_alpha(alpha)
-        return img
+    def _sprite_slot(self, sprite: pygame.Surface) -> int:
+        slot = self._sprite_index.get(id(sprite))
+        if slot is None:
+            slot = self._sprite_index[id(sprite)] = len(self._ladders)
+            self._ladders.append(self._alpha_ladder(sprite))
+            self._half_sizes.append((sprite.get_width() / 2, sprite.get_height() / 2))
+        return slot
+
+    def _alpha_ladder(self, sprite: pygame.Surface) -> list[pygame.Surface]:
+        """Faded copies of `sprite`, from transparent (rung 0) to the sprite itself."""
+        top = self.alpha_levels - 1
+        ladder = []
+        for rung in range(top):
+            img = sprite.copy()
+            img.set_alpha(round(255 * rung / top))
+            ladder.append(img)
+        ladder.append(sprite)
+        return ladder
 
 
 __all__ = ["FootprintSpriteResolver", "FootprintTrailManager"]
@@ -1,6 +1,9 @@
+import math
+
 import pygame
 from constants import TEXT, MUTED, GOLD, GOOD, BAD
 from ui.render.draw import draw_text, draw_panel
+from ui.render.text_cache import get_font
 
 
 def _format_time(seconds: float) -> str:
@@ -10,9 +13,20 @@ def _format_time(seconds: float) -> str:
         return f"{minutes:d}:{secs:02d}"
     return f"{secs:d}s"
 
-def render_hud(surface, cfg, episode, phase, time_left=None, speed: float = 1.0):
-    font = pygame.font.SysFont(None, 22)
-    small = pygame.font.SysFont(None, 18)
+def render_hud(
+    surface,
+    cfg,
+    episode,
+    phase,
+    time_left=None,
+    speed: float = 1.0,
+    turbo: float | None = None,
+    sim_rate: float = 0.0,
+) -> pygame.Rect:
+    """Draw the side panel; returns its rect. `turbo` is the turbo speed
+    (inf for instant) or None when turbo is off."""
+    font = get_font(None, 22)
+    small = get_font(None, 18)
     x0 = cfg.window_w - cfg.hud_w
     panel = (x0 + 10, 10, cfg.hud_w - 20, cfg.window_h - 20)
     draw_panel(surface, panel)
@@ -22,7 +36,11 @@ def render_hud(surface, cfg, episode, phase, time_left=None, speed: float = 1.0)
     draw_text(surface, f"Phase: {phase}", x, y, font); y += 26
     if time_left is not None and phase == "MARKET":
         draw_text(surface, f"Time left: {_format_time(time_left)}", x, y, font, MUTED); y += 26
-    draw_text(surface, f"Speed: {speed:.1f}x (press F)", x, y, small, MUTED); y += 22
+    if turbo is None:
+        draw_text(surface, f"Speed: {speed:.1f}x (press F)", x, y, small, MUTED); y += 22
+    else:
+        label = "instant" if math.isinf(turbo) else f"{turbo:.0f}x"
+        draw_text(surface, f"Turbo: {label} (press T)  {sim_rate:,.0f} sim-s/s", x, y, small, GOLD); y += 22
 
     y += 8
     for team in episode.teams:
@@ -56,3 +74,5 @@ def render_hud(surface, cfg, episode, phase, time_left=None, speed: float = 1.0)
             draw_text(surface, "Expert is shopping soon...", x, y, small, MUTED); y += 16
 
         y += 10
+
+    return pygame.Rect(panel)
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import queue
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pygame
+
+# Item art is generated at 1024x1024 but never drawn larger than ~110 px, so
+# decoded images are shrunk to this once, off the render thread.
+DECODED_MAX_SIDE = 256
+DEFAULT_MAX_IMAGES = 64
+DEFAULT_MAX_THUMBNAILS = 128
+
+
+def _downscale(img: pygame.Surface, max_side: int) -> pygame.Surface:
+    w, h = img.get_size()
+    if max(w, h) <= max_side:
+        return img
+    scale = max_side / max(w, h)
+    size = (max(1, int(w * scale)), max(1, int(h * scale)))
+    try:
+        return pygame.transform.smoothscale(img, size)
+    except ValueError:
+        # smoothscale needs 24/32-bit surfaces; palette images fall back.
+        return pygame.transform.scale(img, size)
+
+
+class ImageLoader:
+    """Decode and downscale images on a background thread.
+
+    `request` queues a file without blocking; `get` returns the image once it
+    is ready (or None while it is still loading or if it failed). Surfaces
+    are converted to the display format on the main thread, since
+    `convert_alpha` must not run concurrently with rendering. Finished images
+    are kept in an LRU bounded by `max_images`.
+    """
+
+    def __init__(self, max_images: int = DEFAULT_MAX_IMAGES, max_side: int = DECODED_MAX_SIDE):
+        self.max_images = max_images
+        self.max_side = max_side
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[Path] = queue.Queue()
+        self._pending: set[Path] = set()
+        self._decoded: dict[Path, pygame.Surface | None] = {}
+        self._images: OrderedDict[Path, pygame.Surface | None] = OrderedDict()
+        self._thread: threading.Thread | None = None
+
+    def request(self, path: Path):
+        if path in self._images:
+            return
+        with self._lock:
+            if path in self._pending or path in self._decoded:
+                return
+            self._pending.add(path)
+        self._queue.put(path)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="image-loader", daemon=True)
+            self._thread.start()
+
+    def get(self, path: Path) -> pygame.Surface | None:
+        if path in self._images:
+            self._images.move_to_end(path)
+            return self._images[path]
+
+        with self._lock:
+            if path not in self._decoded:
+                ready = False
+            else:
+                ready = True
+                img = self._decoded.pop(path)
+        if not ready:
+            self.request(path)
+            return None
+        return self._store(path, img)
+
+    def load_now(self, path: Path) -> pygame.Surface | None:
+        """Return `path` decoded, decoding it on this thread if it is not
+        ready yet (a queued background decode of it is then dropped)."""
+        if path in self._images:
+            return self.get(path)
+        with self._lock:
+            decoded = path in self._decoded
+            if not decoded:
+                self._pending.discard(path)
+        if decoded:
+            return self.get(path)
+        return self._store(path, self._decode(path))
+
+    def failed(self, path: Path) -> bool:
+        """True once `path` has been tried and could not be decoded."""
+        return path in self._images and self._images[path] is None
+
+    def _store(self, path: Path, img: pygame.Surface | None) -> pygame.Surface | None:
+        if img is not None and pygame.display.get_surface() is not None:
+            img = img.convert_alpha()
+        self._images[path] = img
+        while len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+        return img
+
+    def _decode(self, path: Path) -> pygame.Surface | None:
+        try:
+            return _downscale(pygame.image.load(str(path)), self.max_side)
+        except (pygame.error, OSError, ValueError):
+            return None
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def wait(self, timeout: float | None = None):
+        """Block until every queued image is decoded (for tests and tools)."""
+        with self._queue.all_tasks_done:
+            self._queue.all_tasks_done.wait_for(lambda: self._queue.unfinished_tasks == 0, timeout)
+
+    def clear(self):
+        with self._lock:
+            # Decodes still in flight see their path gone and are dropped.
+            self._pending.clear()
+            self._decoded.clear()
+        self._images.clear()
+
+    def _run(self):
+        while True:
+            path = self._queue.get()
+            try:
+                img = self._decode(path)
+                with self._lock:
+                    if path in self._pending:
+                        self._pending.discard(path)
+                        self._decoded[path] = img
+            finally:
+                self._queue.task_done()
+
+
+class ThumbnailCache:
+    """LRU of scaled surfaces keyed by (image key, target size)."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_THUMBNAILS):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def get(self, key, size: tuple[int, int], source: pygame.Surface) -> pygame.Surface:
+        cache_key = (key, size)
+        thumb = self._entries.get(cache_key)
+        if thumb is not None:
+            self._entries.move_to_end(cache_key)
+            return thumb
+        thumb = pygame.transform.smoothscale(source, size)
+        self._entries[cache_key] = thumb
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return thumb
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_loader: ImageLoader | None = None
+_quit_hook_registered = False
+
+
+def _on_pygame_quit():
+    # Display-format surfaces belong to the display being shut down.
+    global _quit_hook_registered
+    _quit_hook_registered = False
+    if _loader is not None:
+        _loader.clear()
+
+
+def shared_image_loader() -> ImageLoader:
+    """The process-wide loader, so screens share decoded images."""
+    global _loader, _quit_hook_registered
+    if _loader is None:
+        _loader = ImageLoader()
+    if not _quit_hook_registered:
+        pygame.register_quit(_on_pygame_quit)
+        _quit_hook_registered = True
+    return _loader
@@ -23,6 +23,7 @@ from constants import (
     TEXT,
     MUTED,
 )
+from ui.render.text_cache import render_text
 
 
 class StallCardRenderer:
@@ -47,18 +48,17 @@ class StallCardRenderer:
         }
 
     def draw(self, surface, stall, title_font, meta_font, *, is_active: bool = False):
-        x, y, w, h = stall.rect
-        card_surface, rotation = self._get_surface(stall)
-        card_rect = card_surface.get_rect(center=(x + w / 2, y + h / 2))
-        surface.blit(card_surface, card_rect)
-
+        self.draw_static(surface, stall, title_font, meta_font)
         if is_active:
-            highlight = self._get_highlight_surface(w, h, rotation)
-            pulse = 0.6 + 0.4 * math.sin(pygame.time.get_ticks() / 1000.0 * 2.2)
-            highlight.set_alpha(int(80 + 70 * pulse))
-            highlight_rect = highlight.get_rect(center=card_rect.center)
-            surface.blit(highlight, highlight_rect)
+            self.draw_highlight(surface, stall)
+
+    def draw_static(self, surface, stall, title_font, meta_font) -> pygame.Rect:
+        """Draw the card and its labels: everything that only changes with stock."""
+        card_surface, _rotation = self._get_surface(stall)
+        card_rect = self._card_rect(stall, card_surface)
+        surface.blit(card_surface, card_rect)
 
+        x, y, w, h = stall.rect
         anchor_x = card_rect.centerx - w / 2
         anchor_y = card_rect.centery - h / 2
 
@@ -67,20 +67,36 @@ class StallCardRenderer:
         title_color = TEXT
         meta_color = MUTED
 
-        title_surface = title_font.render(stall.name, True, title_color)
+        title_surface = render_text(title_font, stall.name, title_color)
         surface.blit(title_surface, (draw_x, draw_y))
 
         pricing_style = (stall.pricing_style or "").lower()
         type_label = pricing_style.capitalize() if pricing_style else ""
         label_color = self._type_labels.get(pricing_style, meta_color)
         if type_label:
-            label_surface = meta_font.render(type_label, True, label_color)
+            label_surface = render_text(meta_font, type_label, label_color)
             surface.blit(label_surface, (draw_x, draw_y + 20))
 
         icon = self._type_icons.get(pricing_style, "📦")
         item_text = f"{icon} ×{len(stall.items)}"
-        item_surface = meta_font.render(item_text, True, title_color)
+        item_surface = render_text(meta_font, item_text, title_color)
         surface.blit(item_surface, (draw_x, draw_y + 40))
+        return card_rect
+
+    def draw_highlight(self, surface, stall) -> pygame.Rect:
+        """Draw the pulsing glow for a stall a team is heading to or browsing."""
+        x, y, w, h = stall.rect
+        card_surface, rotation = self._get_surface(stall)
+        card_rect = self._card_rect(stall, card_surface)
+        highlight = self._get_highlight_surface(w, h, rotation)
+        pulse = 0.6 + 0.4 * math.sin(pygame.time.get_ticks() / 1000.0 * 2.2)
+        highlight.set_alpha(int(80 + 70 * pulse))
+        highlight_rect = highlight.get_rect(center=card_rect.center)
+        return surface.blit(highlight, highlight_rect)
+
+    def _card_rect(self, stall, card_surface) -> pygame.Rect:
+        x, y, w, h = stall.rect
+        return card_surface.get_rect(center=(x + w / 2, y + h / 2))
 
     def _get_surface(self, stall):
         x, y, w, h = stall.rect
@@ -174,7 +190,8 @@ class StallCardRenderer:
             if rotation:
                 glow_surface = pygame.transform.rotate(glow_surface, rotation)
             self._highlight_cache[key] = glow_surface
-        return self._highlight_cache[key].copy()
+        # Callers only change the surface alpha, so the cached glow is reused.
+        return self._highlight_cache[key]
 
     def _build_silhouettes(self):
         return [
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+# Rendered text is mostly small, but the HUD and results screens can show a
+# few hundred distinct strings over a session; 8 MB holds all of them.
+DEFAULT_TEXT_CACHE_BYTES = 8 * 1024 * 1024
+
+_fonts: dict[tuple[str | None, int, bool, bool], pygame.font.Font] = {}
+_quit_hook_registered = False
+
+
+def _on_pygame_quit():
+    # Font objects (and surfaces rendered from them) are invalid after
+    # pygame.quit(); using one after a later pygame.init() crashes. pygame
+    # forgets quit hooks once they have run, so get_font registers it again.
+    global _quit_hook_registered
+    _quit_hook_registered = False
+    _fonts.clear()
+    TEXT_CACHE.clear()
+
+
+def get_font(name: str | None = None, size: int = 18, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    """Return a shared font, loading each (name, size, style) only once.
+
+    `SysFont` searches the system font list on every call, which is far too
+    slow to do per frame.
+    """
+    global _quit_hook_registered
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        if not _quit_hook_registered:
+            pygame.register_quit(_on_pygame_quit)
+            _quit_hook_registered = True
+        font = _fonts[key] = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+    return font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces, bounded by pixel memory.
+
+    Keyed by (font, text, color, antialias). Cached surfaces are shared, so
+    callers must not draw onto them; copy first if a surface needs changes.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_TEXT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        # pygame.Color is unhashable, so normalise colours to RGB(A) tuples.
+        rgb = tuple(color)
+        if len(rgb) == 4 and rgb[3] == 255:
+            rgb = rgb[:3]
+        key = (font, text, rgb, antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            return surf
+
+        surf = font.render(text, antialias, color)
+        size = _surface_bytes(surf)
+        if size > self.max_bytes:
+            return surf
+        self._entries[key] = surf
+        self.bytes_used += size
+        while self.bytes_used > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes_used -= _surface_bytes(evicted)
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _surface_bytes(surf: pygame.Surface) -> int:
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    """`font.render` through the shared text cache."""
+    return TEXT_CACHE.render(font, text, color, antialias)
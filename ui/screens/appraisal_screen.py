@@ -3,13 +3,14 @@ from ui.screens.screen_base import Screen
 from ui.render.hud import render_hud
 from ui.render.draw import draw_text
 from constants import BG, TEXT, MUTED
+from ui.render.text_cache import get_font
 
 class AppraisalScreen(Screen):
     def __init__(self, cfg, episode):
         self.cfg = cfg
         self.episode = episode
-        self.font = pygame.font.SysFont(None, 26)
-        self.small = pygame.font.SysFont(None, 18)
+        self.font = get_font(None, 26)
+        self.small = get_font(None, 18)
 
     def render(self, surface):
         play_w = self.cfg.window_w - self.cfg.hud_w
@@ -36,4 +37,6 @@ class AppraisalScreen(Screen):
             "APPRAISAL",
             time_left=None,
             speed=getattr(self.episode, "time_scale", 1.0),
+            turbo=self.turbo,
+            sim_rate=self.sim_rate,
         )
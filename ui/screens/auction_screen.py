@@ -6,18 +6,23 @@ from ui.render.hud import render_hud
 from ui.render.draw import draw_text, draw_panel
 from ui.screens.components.auction_summary_panel import render_auction_summary_panel
 from models.auction_result import AuctionRoundResult
+from models.bidding import BIDDER_CHANNELS
 from constants import TEXT, MUTED, GOOD, BAD, GOLD, ACCENT, INK, CANVAS, PANEL, PANEL_EDGE
+from ui.asset_index import get_asset_index
+from ui.render.atlas import get_atlas
+from ui.render.image_cache import ThumbnailCache, shared_image_loader
+from ui.render.text_cache import get_font
 
 
 class AuctionScreen(Screen):
     def __init__(self, cfg, episode):
         self.cfg = cfg
         self.episode = episode
-        self.font = pygame.font.SysFont(None, 26)
-        self.small = pygame.font.SysFont(None, 18)
-        self.big = pygame.font.SysFont(None, 34)
-        self.huge = pygame.font.SysFont(None, 48)
-        self.status_font = pygame.font.SysFont(None, 20)
+        self.font = get_font(None, 26)
+        self.small = get_font(None, 18)
+        self.big = get_font(None, 34)
+        self.huge = get_font(None, 48)
+        self.status_font = get_font(None, 20)
 
         self.stage = "idle"
         self.stage_timer = 0.0
@@ -32,9 +37,11 @@ class AuctionScreen(Screen):
         self.bid_flash = 0.0
         self.hammer_idx = 0
         self.sold_pause = 1.8
-        self.image_cache: dict[str, pygame.Surface | None] = {}
+        self.image_loader = shared_image_loader()
+        self.atlas = get_atlas()
+        self.thumbnails = ThumbnailCache()
         self.placeholder_cache: dict[str, pygame.Surface] = {}
-        self.assets_root = Path(__file__).resolve().parent.parent.parent
+        self.assets = get_asset_index()
 
         self.flow_state = "selling"
         self.summary_timer = 0.0
@@ -45,15 +52,10 @@ class AuctionScreen(Screen):
         self.current_team = None
         self.visual_rng: random.Random | None = None
 
-        self.bidder_names = [
-            "Gallery rep",
-            "Local dealer",
-            "Phone bidder",
-            "Online proxy",
-            "Vintage scout",
-            "Museum intern",
-        ]
+        self.bidder_names = list(BIDDER_CHANNELS)
         self.hammer_lines = ["Going once...", "Going twice...", "Final call..."]
+        # With a bidder room, the last few contenders' bids are played out.
+        self.max_shown_bids = 6
 
     def reset_for_new_queue(self):
         self.stage = "idle"
@@ -75,6 +77,7 @@ class AuctionScreen(Screen):
         self.hold_final_done = False
         self.current_team = None
         self.visual_rng = None
+        self._prefetch_upcoming()
 
     def _shade(self, color, amount):
         return tuple(max(0, min(255, c + amount)) for c in color)
@@ -88,17 +91,27 @@ class AuctionScreen(Screen):
             return
 
         lot = self.episode.auction_queue[self.episode.auction_cursor]
-        sale_price = self.episode.auction_house.sell(lot.item, self.episode.rng)
+        house = self.episode.auction_house
+        room_result = None
+        if house.bidders:
+            # Same draws and price as sell(); the bids shown are the real ones.
+            room_result = house.auction(lot.item, self.episode.rng, self.episode.balance, max_steps=self.max_shown_bids)
+            sale_price = room_result.price
+        else:
+            sale_price = house.sell(lot.item, self.episode.rng, self.episode.balance)
 
         stage_code = 0 if self.episode.auction_stage == "team" else 1
         visual_seed = self.episode.seed * 1_000_003 + stage_code * 10_000 + self.episode.auction_cursor
         self.visual_rng = random.Random(visual_seed)
 
-        start_price = max(5.0, min(lot.item.shop_price * 0.8, sale_price * 0.85))
-        if start_price >= sale_price:
-            start_price = sale_price * 0.55
-
-        self.bid_steps, total_time = self._build_bid_script(start_price, sale_price)
+        if room_result is not None:
+            start_price = room_result.bids[0].amount
+            self.bid_steps, total_time = self._room_bid_script(room_result)
+        else:
+            start_price = max(5.0, min(lot.item.shop_price * 0.8, sale_price * 0.85))
+            if start_price >= sale_price:
+                start_price = sale_price * 0.55
+            self.bid_steps, total_time = self._build_bid_script(start_price, sale_price)
         self.bid_total_duration = total_time + 0.9
         self.current_bid_idx = -1
         self.display_price = start_price
@@ -111,6 +124,7 @@ class AuctionScreen(Screen):
         self.current_team = lot.team
         self.hammer_idx = 0
         self.bid_history.clear()
+        self._prefetch_upcoming()
 
     def _build_bid_script(self, start_price: float, sale_price: float):
         rng = self.visual_rng or random.Random()
@@ -131,6 +145,15 @@ class AuctionScreen(Screen):
             steps[-1]["amount"] = sale_price
         return steps, time_cursor
 
+    def _room_bid_script(self, result):
+        rng = self.visual_rng or random.Random()
+        steps = []
+        time_cursor = 0.7
+        for bid in result.bids:
+            steps.append({"time": time_cursor, "amount": bid.amount, "bidder": bid.name})
+            time_cursor += rng.uniform(0.85, 1.15)
+        return steps, time_cursor
+
     def _finalize_sale(self):
         if not self.current_lot:
             return
@@ -185,51 +208,26 @@ class AuctionScreen(Screen):
         if not self.current_lot:
             self._prepare_next_lot()
 
-    def _resolve_image_path(self, candidate: Path) -> Path | None:
-        """Resolve an image path whether the game is launched from the repo root or elsewhere."""
-        if candidate.is_absolute():
-            return candidate if candidate.exists() else None
-
-        for root in (Path.cwd(), self.assets_root):
-            path = root / candidate
-            if path.exists():
-                return path
-        return None
+    def _image_file(self, name: str, image_path: str | None = None) -> Path | None:
+        resolved = self.assets.resolve(image_path) if image_path else None
+        return resolved or self.assets.find_image(name)
 
     def _get_item_image(self, name: str, image_path: str | None = None):
-        cache_key = image_path or name
-        if cache_key in self.image_cache:
-            return self.image_cache[cache_key]
-
-        candidate_path = Path(image_path) if image_path else None
-        if candidate_path:
-            resolved = self._resolve_image_path(candidate_path)
-            if resolved:
-                try:
-                    img = pygame.image.load(str(resolved)).convert_alpha()
-                    self.image_cache[cache_key] = img
-                    return img
-                except pygame.error:
-                    self.image_cache[cache_key] = None
-                    return None
-
-        possible_names = [name, name.replace("/", "-")]
-        search_roots = [self.assets_root, Path.cwd()]
-        for base in possible_names:
-            for ext in (".png", ".jpg", ".jpeg"):
-                for root in search_roots:
-                    path = root / "assets" / f"{base}{ext}"
-                    if path.exists():
-                        try:
-                            img = pygame.image.load(str(path)).convert_alpha()
-                            self.image_cache[cache_key] = img
-                            return img
-                        except pygame.error:
-                            self.image_cache[cache_key] = None
-                            return None
-
-        self.image_cache[cache_key] = None
-        return None
+        """Return the decoded image, or None while it loads in the background."""
+        path = self._image_file(name, image_path)
+        if path is None:
+            return None
+        if path in self.atlas:
+            return self.atlas.get(path)
+        return self.image_loader.get(path)
+
+    def _prefetch_upcoming(self, count: int = 4):
+        """Queue images for the next few lots so they are decoded before they show."""
+        start = self.episode.auction_cursor
+        for lot in self.episode.auction_queue[start : start + count]:
+            path = self._image_file(lot.item.name, getattr(lot.item, "image_path", None))
+            if path is not None and path not in self.atlas:
+                self.image_loader.request(path)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN and self.flow_state == "summary" and self.allow_summary_skip:
@@ -263,7 +261,7 @@ class AuctionScreen(Screen):
             max_side = max(1, min(rect.width, rect.height) - padding * 2)
             scale = min(max_side / img.get_width(), max_side / img.get_height())
             scaled_size = (int(img.get_width() * scale), int(img.get_height() * scale))
-            scaled = pygame.transform.smoothscale(img, scaled_size)
+            scaled = self.thumbnails.get(image_path or name, scaled_size, img)
             pos = (
                 rect.x + (rect.width - scaled_size[0]) // 2,
                 rect.y + (rect.height - scaled_size[1]) // 2,
@@ -274,7 +272,7 @@ class AuctionScreen(Screen):
         placeholder = self._placeholder_surface(category or "item")
         padding = 6
         max_side = max(1, min(rect.width, rect.height) - padding * 2)
-        scaled = pygame.transform.smoothscale(placeholder, (max_side, max_side))
+        scaled = self.thumbnails.get(("placeholder", category or "item"), (max_side, max_side), placeholder)
         pos = (rect.x + (rect.width - max_side) // 2, rect.y + (rect.height - max_side) // 2)
         surface.blit(scaled, pos)
 
@@ -390,7 +388,8 @@ class AuctionScreen(Screen):
             bx = rect[0] + spacing * (sidx + 1)
             color = self._blend(CANVAS, ACCENT, 0.55)
             label = self.bidder_names[sidx % len(self.bidder_names)]
-            highlight = label == self.active_bidder and self.stage != "sold"
+            # Room bidders are named "<channel> #<paddle>"; light their channel's seat.
+            highlight = bool(self.active_bidder) and self.active_bidder.startswith(label) and self.stage != "sold"
             radius = 14 + (5 if highlight else 0)
             pygame.draw.circle(surface, self._shade(INK, 12), (bx, row_y + 4), radius + 4)
             pygame.draw.circle(surface, color if not highlight else ACCENT, (bx, row_y), radius)
@@ -580,4 +579,6 @@ class AuctionScreen(Screen):
             phase_label,
             time_left=None,
             speed=getattr(self.episode, "time_scale", 1.0),
+            turbo=self.turbo,
+            sim_rate=self.sim_rate,
         )
@@ -3,14 +3,15 @@ from ui.screens.screen_base import Screen
 from ui.render.hud import render_hud
 from ui.render.draw import draw_text
 from constants import BG, TEXT, GOOD, BAD, GOLD
+from ui.render.text_cache import get_font
 
 
 class ExpertBudgetScreen(Screen):
     def __init__(self, cfg, episode):
         self.cfg = cfg
         self.episode = episode
-        self.font = pygame.font.SysFont(None, 28)
-        self.small = pygame.font.SysFont(None, 18)
+        self.font = get_font(None, 28)
+        self.small = get_font(None, 18)
         self.is_done = False
         self.timer = 0.0
 
@@ -45,4 +46,6 @@ class ExpertBudgetScreen(Screen):
             "EXPERT_HANDOFF",
             time_left=None,
             speed=getattr(self.episode, "time_scale", 1.0),
+            turbo=self.turbo,
+            sim_rate=self.sim_rate,
         )
@@ -3,14 +3,15 @@ from ui.screens.screen_base import Screen
 from ui.render.hud import render_hud
 from ui.render.draw import draw_text
 from constants import BG, TEXT, MUTED, GOOD, BAD
+from ui.render.text_cache import get_font
 
 
 class ExpertDecisionScreen(Screen):
     def __init__(self, cfg, episode):
         self.cfg = cfg
         self.episode = episode
-        self.font = pygame.font.SysFont(None, 26)
-        self.small = pygame.font.SysFont(None, 18)
+        self.font = get_font(None, 26)
+        self.small = get_font(None, 18)
         self.cursor = 0
         self.decision_timer = 0.0
         self._sync_cursor()
@@ -79,4 +80,6 @@ class ExpertDecisionScreen(Screen):
             "EXPERT_DECISION",
             time_left=None,
             speed=getattr(self.episode, "time_scale", 1.0),
+            turbo=self.turbo,
+            sim_rate=self.sim_rate,
         )
@@ -3,15 +3,16 @@ from ui.screens.screen_base import Screen
 from ui.render.hud import render_hud
 from ui.render.draw import draw_text, draw_panel
 from constants import BG, TEXT, MUTED, GOOD, BAD, GOLD
+from ui.render.text_cache import get_font
 
 
 class ExpertRevealScreen(Screen):
     def __init__(self, cfg, episode):
         self.cfg = cfg
         self.episode = episode
-        self.font = pygame.font.SysFont(None, 28)
-        self.small = pygame.font.SysFont(None, 18)
-        self.micro = pygame.font.SysFont(None, 16)
+        self.font = get_font(None, 28)
+        self.small = get_font(None, 18)
+        self.micro = get_font(None, 16)
         self.choice_include = True
         self.cursor = 0
         self.is_done = False
@@ -105,32 +106,6 @@ class ExpertRevealScreen(Screen):
         elif self.state == "host_reveal" and self.phase_timer >= self.post_reveal_delay:
             self._advance_to_next_team()
 
-    def _performance_signal(self, team) -> float:
-        margins = []
-        for it in team.team_items:
-            if it.auction_price is None:
-                continue
-            margins.append((it.auction_price - it.shop_price) / max(1.0, it.shop_price))
-        if not margins:
-            return 0.0
-        avg_margin = sum(margins) / len(margins)
-        return max(-0.5, min(0.5, avg_margin))
-
-    def _rapport_signal(self, team) -> float:
-        # Confidence in the expert + track record of accuracy.
-        trust = (team.average_confidence - 0.5) * 0.6
-        expert_trust = (team.expert.appraisal_accuracy - 0.75) * 0.8
-        return max(-0.4, min(0.6, trust + expert_trust))
-
-    def _liking_signal(self, team, pick) -> float:
-        affinity = team.style_affinity(pick)
-        return max(0.0, min(1.0, affinity))
-
-    def _expert_margin_signal(self, pick) -> float:
-        est = pick.attributes.get("expert_estimate", pick.shop_price)
-        margin = (est - pick.shop_price) / max(1.0, pick.shop_price)
-        return max(-0.5, min(0.8, margin))
-
     def _automate_choice(self, team):
         pick = team.expert_pick_item
         if not pick:
@@ -138,16 +113,12 @@ class ExpertRevealScreen(Screen):
             self._apply_choice(team)
             return
 
-        perf = self._performance_signal(team)
-        rapport = self._rapport_signal(team)
-        liking = self._liking_signal(team, pick)
-        expert_margin = self._expert_margin_signal(pick)
-        noise = (self.episode.rng.random() - 0.5) * 0.1
-
-        score = 0.35 * expert_margin + 0.25 * liking + 0.2 * rapport + 0.15 * perf + noise
-        self.auto_score = score
-        self.choice_include = score >= 0.05
-        self.decision_reason = self._format_reason(perf, rapport, liking, expert_margin)
+        decision = self.episode.decide_expert_pick(team)
+        self.auto_score = decision.score
+        self.choice_include = decision.include
+        self.decision_reason = self._format_reason(
+            decision.performance, decision.rapport, decision.liking, decision.expert_margin
+        )
         self._apply_choice(team)
         self.state = "decision"
         self.phase_timer = 0.0
@@ -225,4 +196,6 @@ class ExpertRevealScreen(Screen):
             "EXPERT_REVEAL",
             time_left=None,
             speed=getattr(self.episode, "time_scale", 1.0),
+            turbo=self.turbo,
+            sim_rate=self.sim_rate,
         )
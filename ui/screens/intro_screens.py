@@ -1,8 +1,10 @@
-from pathlib import Path
 import pygame
 from ui.screens.screen_base import Screen
 from ui.render.draw import draw_panel, draw_text
 from constants import BG, TEXT, MUTED, ACCENT, GOLD, CANVAS, PANEL_EDGE, PANEL
+from ui.asset_index import get_asset_index
+from ui.render.atlas import get_atlas
+from ui.render.text_cache import get_font, render_text
 
 
 def _render_intro_panel(surface, cfg, title, subtitle, footer=True):
@@ -11,9 +13,9 @@ def _render_intro_panel(surface, cfg, title, subtitle, footer=True):
     panel_rect = (padding, padding, cfg.window_w - padding * 2, cfg.window_h - padding * 2)
     draw_panel(surface, panel_rect)
 
-    title_font = pygame.font.SysFont(None, 44)
-    subtitle_font = pygame.font.SysFont(None, 26)
-    footer_font = pygame.font.SysFont(None, 18)
+    title_font = get_font(None, 44)
+    subtitle_font = get_font(None, 26)
+    footer_font = get_font(None, 18)
     x = panel_rect[0] + cfg.margin
     y = panel_rect[1] + cfg.margin
 
@@ -33,8 +35,8 @@ def _render_intro_panel(surface, cfg, title, subtitle, footer=True):
 class HostWelcomeScreen(Screen):
     def __init__(self, cfg):
         self.cfg = cfg
-        self.body_font = pygame.font.SysFont(None, 26)
-        self.small = pygame.font.SysFont(None, 20)
+        self.body_font = get_font(None, 26)
+        self.small = get_font(None, 20)
 
     def render(self, surface):
         x, y = _render_intro_panel(surface, self.cfg, "Welcome to Bargain Hunt!", "Your host is ready to kick things off.")
@@ -48,9 +50,9 @@ class ContestantIntroScreen(Screen):
     def __init__(self, cfg, episode):
         self.cfg = cfg
         self.episode = episode
-        self.title_font = pygame.font.SysFont(None, 28)
-        self.body_font = pygame.font.SysFont(None, 22)
-        self.small = pygame.font.SysFont(None, 18)
+        self.title_font = get_font(None, 28)
+        self.body_font = get_font(None, 22)
+        self.small = get_font(None, 18)
 
     def render(self, surface):
         x, y = _render_intro_panel(surface, self.cfg, "Meet the teams", "Contestants and starting budgets")
@@ -70,23 +72,15 @@ class ExpertAssignmentScreen(Screen):
     def __init__(self, cfg, episode):
         self.cfg = cfg
         self.episode = episode
-        self.title_font = pygame.font.SysFont(None, 28)
-        self.body_font = pygame.font.SysFont(None, 22)
-        self.small = pygame.font.SysFont(None, 18)
-        self.stat_font = pygame.font.SysFont(None, 20)
-        self.badge_font = pygame.font.SysFont(None, 16)
-        self.assets_root = Path(__file__).resolve().parent.parent.parent
+        self.title_font = get_font(None, 28)
+        self.body_font = get_font(None, 22)
+        self.small = get_font(None, 18)
+        self.stat_font = get_font(None, 20)
+        self.badge_font = get_font(None, 16)
+        self.assets = get_asset_index()
+        self.atlas = get_atlas()
         self.image_cache: dict[str, pygame.Surface | None] = {}
 
-    def _resolve_image_path(self, candidate: Path) -> Path | None:
-        if candidate.is_absolute():
-            return candidate if candidate.exists() else None
-        for root in (Path.cwd(), self.assets_root):
-            path = root / candidate
-            if path.exists():
-                return path
-        return None
-
     def _get_portrait(self, expert) -> pygame.Surface | None:
         cache_key = getattr(expert, "name", None) or getattr(expert, "id", None)
         if cache_key and cache_key in self.image_cache:
@@ -98,16 +92,19 @@ class ExpertAssignmentScreen(Screen):
                 self.image_cache[cache_key] = None
             return None
 
-        resolved = self._resolve_image_path(Path(img_path))
+        resolved = self.assets.resolve(img_path)
         if not resolved:
             if cache_key:
                 self.image_cache[cache_key] = None
             return None
 
-        try:
-            surface = pygame.image.load(str(resolved)).convert_alpha()
-        except pygame.error:
-            surface = None
+        if resolved in self.atlas:
+            surface = self.atlas.get(resolved, block=True)
+        else:
+            try:
+                surface = pygame.image.load(str(resolved)).convert_alpha()
+            except pygame.error:
+                surface = None
         if cache_key:
             self.image_cache[cache_key] = surface
         return surface
@@ -160,7 +157,7 @@ class ExpertAssignmentScreen(Screen):
             else:
                 initials = "".join(part[0] for part in team.expert.name.split()[:2]).upper()
                 placeholder = initials or "?"
-                label_img = self.body_font.render(placeholder, True, MUTED)
+                label_img = render_text(self.body_font, placeholder, MUTED)
                 label_pos = (
                     portrait_rect.centerx - label_img.get_width() // 2,
                     portrait_rect.centery - label_img.get_height() // 2,
@@ -194,8 +191,8 @@ class ExpertAssignmentScreen(Screen):
 class MarketSendoffScreen(Screen):
     def __init__(self, cfg):
         self.cfg = cfg
-        self.body_font = pygame.font.SysFont(None, 26)
-        self.small = pygame.font.SysFont(None, 20)
+        self.body_font = get_font(None, 26)
+        self.small = get_font(None, 20)
 
     def render(self, surface):
         x, y = _render_intro_panel(surface, self.cfg, "Ready, set, bargain!", "The hunt begins at the market.")
@@ -4,6 +4,7 @@ from ui.render.footprints import FootprintSpriteResolver, FootprintTrailManager
 from ui.render.hud import render_hud
 from ui.render.draw import draw_text
 from ui.render.stall_card import StallCardRenderer
+from ui.render.text_cache import get_font
 from constants import (
     BG,
     GOOD,
@@ -21,15 +22,40 @@ class MarketScreen(Screen):
         self.cfg = cfg
         self.episode = episode
         self.time_left = None
-        self.font = pygame.font.SysFont(None, 22)
-        self.small = pygame.font.SysFont(None, 18)
+        self.font = get_font(None, 22)
+        self.small = get_font(None, 18)
         self.stall_renderer = StallCardRenderer()
         self.trails = FootprintTrailManager()
         self.footprint_sprites = FootprintSpriteResolver()
+        # Background and stall cards, re-rendered only when stock changes.
+        self._static_layer: pygame.Surface | None = None
+        self._static_key = None
+        self._last_dirty: list[pygame.Rect] = []
+        # Positions after the last two sim steps; markers are drawn between
+        # them at `alpha` so motion stays smooth whatever the step rate.
+        self._prev_positions: dict[str, tuple[float, float]] = {}
+        self._positions: dict[str, tuple[float, float]] = {}
+        self.alpha = 1.0
 
     def set_time_left(self, t):
         self.time_left = t
 
+    def set_interpolation(self, alpha: float):
+        self.alpha = alpha
+
+    def reset_motion(self):
+        """Forget trails and interpolation, e.g. after jumping in a replay."""
+        self.trails = FootprintTrailManager()
+        self._prev_positions = {}
+        self._positions = {}
+        self.alpha = 1.0
+
+    def _draw_pos(self, key: str, current: tuple[float, float]) -> tuple[float, float]:
+        cur = self._positions.get(key, current)
+        prev = self._prev_positions.get(key, cur)
+        a = self.alpha
+        return (prev[0] + (cur[0] - prev[0]) * a, prev[1] + (cur[1] - prev[1]) * a)
+
     def update(self, dt: float):
         actor_positions = {}
         actor_sprites = {}
@@ -44,16 +70,24 @@ class MarketScreen(Screen):
 
         self.trails.update(dt, actor_positions, actor_sprites)
 
-    def _draw_team_members(self, surface, team):
+        positions = dict(actor_positions)
+        for team in self.episode.teams:
+            positions[team.name] = team.pos()
+        self._prev_positions = self._positions or positions
+        self._positions = positions
+
+    def _draw_team_members(self, surface, team, dirty=None):
         for member in team.members:
-            px, py = team.member_pos(member.key)
+            px, py = self._draw_pos(f"{team.name}:{member.key}", team.member_pos(member.key))
             pos = (int(px), int(py))
             is_expert = member.kind == "expert"
             radius = TEAM_EXPERT_RADIUS if is_expert else TEAM_MEMBER_RADIUS
             fill = TEAM_EXPERT_ACCENT if is_expert else team.color
 
-            pygame.draw.circle(surface, TEAM_MARKER_OUTLINE, pos, radius + 2)
+            outline = pygame.draw.circle(surface, TEAM_MARKER_OUTLINE, pos, radius + 2)
             pygame.draw.circle(surface, fill, pos, radius)
+            if dirty is not None:
+                dirty.append(outline)
 
     def _draw_host(self, surface):
         host = getattr(self.episode, "host", None)
@@ -71,10 +105,31 @@ class MarketScreen(Screen):
         ]
         pygame.draw.polygon(surface, HOST_OUTLINE, footprint_points)
 
+    def _static_signature(self, play_w: int):
+        market = self.episode.market
+        return (play_w, self.cfg.window_h, id(market), tuple(len(st.items) for st in market.stalls))
+
+    def _static_surface(self, play_w: int) -> tuple[pygame.Surface, bool]:
+        """The cached static layer, and whether it was just rebuilt."""
+        key = self._static_signature(play_w)
+        if self._static_layer is not None and key == self._static_key:
+            return self._static_layer, False
+
+        layer = pygame.Surface((play_w, self.cfg.window_h))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.fill(BG)
+        for st in self.episode.market.stalls:
+            self.stall_renderer.draw_static(layer, st, self.small, self.small)
+        self._static_layer, self._static_key = layer, key
+        return layer, True
+
     def render(self, surface):
-        # play area
+        """Composite the frame; returns the rects that changed, or None when
+        the whole window needs presenting (see GameConfig.dirty_rect_updates)."""
         play_w = self.cfg.window_w - self.cfg.hud_w
-        pygame.draw.rect(surface, BG, (0, 0, play_w, self.cfg.window_h))
+        static_layer, rebuilt = self._static_surface(play_w)
+        surface.blit(static_layer, (0, 0))
 
         active_stalls = set()
         for team in self.episode.teams:
@@ -84,29 +139,35 @@ class MarketScreen(Screen):
             if ctx.get("stall_id") is not None:
                 active_stalls.add(ctx.get("stall_id"))
 
-        for st in self.episode.market.stalls:
-            self.stall_renderer.draw(
-                surface,
-                st,
-                self.small,
-                self.small,
-                is_active=st.stall_id in active_stalls,
-            )
+        dirty = []
+        if active_stalls:
+            for st in self.episode.market.stalls:
+                if st.stall_id in active_stalls:
+                    dirty.append(self.stall_renderer.draw_highlight(surface, st))
 
-        self.trails.draw(surface)
+        dirty.extend(self.trails.draw(surface))
 
         # teams
         for team in self.episode.teams:
-            self._draw_team_members(surface, team)
-            draw_text(surface, team.duo_label(), int(team.x)+12, int(team.y)-10, self.small, team.color)
+            self._draw_team_members(surface, team, dirty)
+            tx, ty = self._draw_pos(team.name, team.pos())
+            dirty.append(draw_text(surface, team.duo_label(), int(tx)+12, int(ty)-10, self.small, team.color))
             if len(team.team_items) >= self.cfg.items_per_team:
-                draw_text(surface, "Done shopping", int(team.x)+12, int(team.y)+8, self.small, GOOD)
+                dirty.append(draw_text(surface, "Done shopping", int(tx)+12, int(ty)+8, self.small, GOOD))
 
-        render_hud(
+        dirty.append(render_hud(
             surface,
             self.cfg,
             self.episode,
             "MARKET",
             time_left=self.time_left,
             speed=getattr(self.episode, "time_scale", 1.0),
-        )
+            turbo=self.turbo,
+            sim_rate=self.sim_rate,
+        ))
+
+        # Whatever moved needs presenting at both its old and new position.
+        previous, self._last_dirty = self._last_dirty, dirty
+        if rebuilt:
+            return None
+        return previous + dirty
@@ -0,0 +1,227 @@
+import pygame
+from ui.screens.screen_base import Screen
+from ui.screens.market_screen import MarketScreen
+from ui.screens.results_screen import ResultsScreen
+from ui.render.hud import render_hud
+from ui.render.draw import draw_text, draw_panel
+from ui.render.text_cache import get_font
+from constants import BG, TEXT, MUTED, GOLD, GOOD, BAD, PANEL_EDGE
+from sim.timeline import PHASES
+
+# Timeline seconds per wall second, cycled with [ and ].
+REPLAY_SPEEDS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0)
+# Share of the scrub bar given to the market; the (much shorter) rest of the
+# episode gets the other part so auctions stay easy to hit with the mouse.
+MARKET_BAR_SHARE = 0.6
+# Jumps longer than this (in timeline seconds) clear footprint trails.
+TRAIL_JUMP_SECONDS = 1.0
+BAR_HEIGHT = 10
+
+
+class RecordingScreen(Screen):
+    """Shown while the episode is simulated before playback starts."""
+
+    def __init__(self, cfg):
+        self.cfg = cfg
+        self.font = get_font(None, 30)
+        self.small = get_font(None, 18)
+        self.progress = 0.0
+
+    def render(self, surface):
+        surface.fill(BG)
+        cx = self.cfg.window_w // 2
+        cy = self.cfg.window_h // 2
+        draw_text(surface, "Simulating episode...", cx - 120, cy - 40, self.font, TEXT)
+        bar = pygame.Rect(cx - 200, cy + 4, 400, BAR_HEIGHT)
+        pygame.draw.rect(surface, PANEL_EDGE, bar, border_radius=4)
+        fill = bar.copy()
+        fill.w = int(bar.w * max(0.0, min(1.0, self.progress)))
+        if fill.w:
+            pygame.draw.rect(surface, GOLD, fill, border_radius=4)
+        draw_text(surface, "Playback starts when the recording is done", cx - 150, cy + 26, self.small, MUTED)
+
+
+class ReplayScreen(Screen):
+    """Plays a recorded Timeline with pause, seeking and variable speed.
+
+    Controls: SPACE play/pause, LEFT/RIGHT skip, HOME/END jump to the ends,
+    1-8 jump to the start of a phase, [ and ] change speed, and clicking or
+    dragging on the bar seeks.
+    """
+
+    def __init__(self, cfg, player):
+        self.cfg = cfg
+        self.player = player
+        self.timeline = player.timeline
+        self.playing = True
+        self.speed = 1.0
+        self.font = get_font(None, 26)
+        self.small = get_font(None, 18)
+        self.market_screen = MarketScreen(cfg, player.view)
+        self.results_screen = ResultsScreen(cfg, player.view)
+        self._dragging = False
+        self.seek(0.0)
+
+    # -- time -----------------------------------------------------------
+    @property
+    def t(self) -> float:
+        return self.player.t
+
+    def seek(self, t: float):
+        previous = self.player.t
+        self.player.seek(t)
+        jump = self.player.t - previous
+        if jump < 0 or jump > TRAIL_JUMP_SECONDS:
+            self.market_screen.reset_motion()
+        if self.player.t <= self.timeline.market_end:
+            self.market_screen.update(max(0.0, min(jump, TRAIL_JUMP_SECONDS)))
+        self.market_screen.set_time_left(max(0.0, self.cfg.market_seconds - self.player.t))
+
+    def update(self, dt: float):
+        if not self.playing:
+            return
+        self.seek(self.t + dt * self.speed)
+        if self.t >= self.timeline.duration:
+            self.playing = False
+
+    def _change_speed(self, direction: int):
+        idx = REPLAY_SPEEDS.index(self.speed) if self.speed in REPLAY_SPEEDS else 1
+        idx = max(0, min(len(REPLAY_SPEEDS) - 1, idx + direction))
+        self.speed = REPLAY_SPEEDS[idx]
+
+    # -- input ----------------------------------------------------------
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            skip = max(1.0, self.timeline.duration / 50)
+            if event.key == pygame.K_SPACE:
+                if not self.playing and self.t >= self.timeline.duration:
+                    self.seek(0.0)
+                self.playing = not self.playing
+            elif event.key == pygame.K_LEFT:
+                self.seek(self.t - skip)
+            elif event.key == pygame.K_RIGHT:
+                self.seek(self.t + skip)
+            elif event.key == pygame.K_HOME:
+                self.seek(0.0)
+            elif event.key == pygame.K_END:
+                self.seek(self.timeline.duration)
+            elif event.key == pygame.K_LEFTBRACKET:
+                self._change_speed(-1)
+            elif event.key == pygame.K_RIGHTBRACKET:
+                self._change_speed(1)
+            elif pygame.K_1 <= event.key <= pygame.K_8:
+                start = self.timeline.phase_starts.get(PHASES[event.key - pygame.K_1])
+                if start is not None:
+                    self.seek(start)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self._bar_rect().inflate(0, 16).collidepoint(event.pos):
+                self._dragging = True
+                self.seek(self._x_to_t(event.pos[0]))
+        elif event.type == pygame.MOUSEMOTION and self._dragging:
+            self.seek(self._x_to_t(event.pos[0]))
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self._dragging = False
+
+    # -- scrub bar ------------------------------------------------------
+    def _bar_rect(self) -> pygame.Rect:
+        play_w = self.cfg.window_w - self.cfg.hud_w
+        m = self.cfg.margin
+        return pygame.Rect(m, self.cfg.window_h - m - 30, play_w - 2 * m, BAR_HEIGHT)
+
+    def _t_to_x(self, t: float) -> int:
+        bar = self._bar_rect()
+        end, total = self.timeline.market_end, self.timeline.duration
+        if t <= end:
+            frac = MARKET_BAR_SHARE * (t / end if end > 0 else 1.0)
+        else:
+            rest = total - end
+            frac = MARKET_BAR_SHARE + (1 - MARKET_BAR_SHARE) * ((t - end) / rest if rest > 0 else 1.0)
+        return bar.x + int(bar.w * frac)
+
+    def _x_to_t(self, x: int) -> float:
+        bar = self._bar_rect()
+        frac = max(0.0, min(1.0, (x - bar.x) / bar.w))
+        end, total = self.timeline.market_end, self.timeline.duration
+        if frac <= MARKET_BAR_SHARE:
+            return end * frac / MARKET_BAR_SHARE
+        return end + (total - end) * (frac - MARKET_BAR_SHARE) / (1 - MARKET_BAR_SHARE)
+
+    def _draw_bar(self, surface):
+        bar = self._bar_rect()
+        strip = pygame.Rect(0, bar.y - 26, self.cfg.window_w - self.cfg.hud_w, self.cfg.window_h - bar.y + 26)
+        pygame.draw.rect(surface, BG, strip)
+        pygame.draw.rect(surface, PANEL_EDGE, bar, border_radius=4)
+        played = bar.copy()
+        played.w = self._t_to_x(self.t) - bar.x
+        if played.w > 0:
+            pygame.draw.rect(surface, GOLD, played, border_radius=4)
+        for n, phase in enumerate(PHASES, start=1):
+            start = self.timeline.phase_starts.get(phase)
+            if start is None:
+                continue
+            x = self._t_to_x(start)
+            pygame.draw.line(surface, TEXT, (x, bar.y - 4), (x, bar.bottom + 3), 2)
+            draw_text(surface, str(n), x + 2, bar.bottom + 2, self.small, MUTED)
+        state = "playing" if self.playing else "paused"
+        draw_text(
+            surface,
+            f"{self.player.phase}  t={self.t:0.1f}s  {self.speed:g}x {state}"
+            "   SPACE play/pause  <-/-> skip  [ ] speed  1-8 phase",
+            bar.x,
+            bar.y - 22,
+            self.small,
+            TEXT,
+        )
+
+    # -- drawing --------------------------------------------------------
+    def _describe(self, event) -> tuple[str, tuple]:
+        view = self.player.view
+        team = view.teams[event.team].name if event.team >= 0 else ""
+        item = self.player.item(event.item_id)
+        name = item.name if item is not None else "?"
+        if event.kind == "purchase":
+            return f"{team} bought {name} for ${event.value:0.0f}", TEXT
+        if event.kind == "reserve":
+            return f"{team} handed ${event.value:0.0f} to the expert", MUTED
+        if event.kind == "expert_pick":
+            if event.item_id < 0:
+                return f"{team}'s expert found nothing", MUTED
+            return f"{team}'s expert bought {name}", GOLD
+        if event.kind == "expert_choice":
+            verdict = "kept" if event.flag else "declined"
+            return f"{team} {verdict} the expert's {name}", GOLD
+        if event.kind == "appraisal":
+            return f"{name} appraised at ${event.value:0.0f}", MUTED
+        if event.kind == "sale":
+            paid = item.shop_price if item is not None else event.value
+            return f"{name} sold for ${event.value:0.0f}", GOOD if event.value >= paid else BAD
+        winner = getattr(view, "winner", None)
+        return (f"Winner: {winner.name}" if winner else "Results"), GOLD
+
+    def _draw_event_log(self, surface):
+        play_w = self.cfg.window_w - self.cfg.hud_w
+        m = self.cfg.margin
+        panel = pygame.Rect(m, m, play_w - 2 * m, self._bar_rect().y - 34 - m)
+        draw_panel(surface, panel)
+        draw_text(surface, f"Replay - {self.player.phase}", panel.x + 16, panel.y + 12, self.font, TEXT)
+        line_h = 20
+        rows = max(1, (panel.h - 52) // line_h)
+        y = panel.y + 44
+        for event in self.player.events_until()[-rows:]:
+            text, color = self._describe(event)
+            draw_text(surface, f"{event.t:7.1f}s  {text}", panel.x + 16, y, self.small, color)
+            y += line_h
+
+    def render(self, surface):
+        self.player.view.time_scale = self.speed
+        phase = self.player.phase
+        if phase == "MARKET":
+            self.market_screen.render(surface)
+        elif phase == "RESULTS":
+            self.results_screen.render(surface)
+        else:
+            play_w = self.cfg.window_w - self.cfg.hud_w
+            pygame.draw.rect(surface, BG, (0, 0, play_w, self.cfg.window_h))
+            self._draw_event_log(surface)
+            render_hud(surface, self.cfg, self.player.view, phase, speed=self.speed)
+        self._draw_bar(surface)
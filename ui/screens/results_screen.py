@@ -3,14 +3,15 @@ from ui.screens.screen_base import Screen
 from ui.render.hud import render_hud
 from ui.render.draw import draw_text
 from constants import BG, CANVAS, TEXT, MUTED, GOLD, GOOD, BAD
+from ui.render.text_cache import get_font
 
 class ResultsScreen(Screen):
     def __init__(self, cfg, episode):
         self.cfg = cfg
         self.episode = episode
-        self.font = pygame.font.SysFont(None, 30)
-        self.small = pygame.font.SysFont(None, 18)
-        self.micro = pygame.font.SysFont(None, 16)
+        self.font = get_font(None, 30)
+        self.small = get_font(None, 18)
+        self.micro = get_font(None, 16)
 
     def _shade(self, color, amount):
         return tuple(max(0, min(255, c + amount)) for c in color)
@@ -99,4 +100,6 @@ class ResultsScreen(Screen):
             "RESULTS",
             time_left=None,
             speed=getattr(self.episode, "time_scale", 1.0),
+            turbo=self.turbo,
+            sim_rate=self.sim_rate,
         )
@@ -1,4 +1,9 @@
 class Screen:
+    # Turbo speed (None when off) and measured sim rate for the HUD; set by
+    # GameState before each render.
+    turbo: float | None = None
+    sim_rate: float = 0.0
+
     def handle_event(self, event):
         pass
     def update(self, dt: float):
@@ -1,65 +1,275 @@
+import hashlib
+import json
+import os
+import queue
+import threading
 import time
 from pathlib import Path
 
 import pygame
-import moviepy
-
-try:
-    from moviepy.editor import VideoFileClip
-except ImportError:
-    VideoFileClip = None
 
 from config import GameConfig
 
+_END = object()
 
-def play_splash(screen: pygame.Surface, clock: pygame.time.Clock, cfg: GameConfig) -> bool:
-    """Play the intro splash video and return False if the window is closed."""
-    video_path = Path(cfg.splash_video_path)
-    if not cfg.show_splash_video:
-        return True
 
+def _video_clip_class():
+    # moviepy pulls in numpy, imageio and ffmpeg probing, so it is only
+    # imported once a splash is actually going to play.
+    try:
+        from moviepy.editor import VideoFileClip
+    except ImportError:
+        return None
+    return VideoFileClip
+
+
+def _scale_frame(frame, size: tuple[int, int]):
+    """Turn a decoded (h, w, 3) frame into a (w, h, 3) array of `size` for blit_array."""
+    if (frame.shape[1], frame.shape[0]) != size:
+        surf = pygame.transform.smoothscale(pygame.surfarray.make_surface(frame.swapaxes(0, 1)), size)
+        return pygame.surfarray.array3d(surf)
+    return frame.swapaxes(0, 1).copy()
+
+
+class SplashFrameCache:
+    """Decoded, pre-scaled splash frames on disk, for instant replays.
+
+    Frames are stored raw (uint8, blit_array layout) next to a small JSON
+    header and memory-mapped on load, so replaying needs neither moviepy nor
+    any decoding. Raw frames are large (about 2 MB each at the default
+    window size), which is why the cache is opt-in. Entries are keyed by the
+    video file's path, size and mtime plus the window size and length limit.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def key(self, video_path: Path, cfg: GameConfig) -> str:
+        # Only inputs known before opening the clip, so a hit skips moviepy.
+        stat = video_path.stat()
+        parts = (
+            str(video_path.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            (cfg.window_w, cfg.window_h),
+            cfg.splash_video_max_seconds,
+        )
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    def load(self, key: str):
+        """Return (frames, fps) for a complete entry, or None."""
+        import numpy as np
+
+        meta_path = self.root / f"{key}.json"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            w, h = meta["size"]
+            frames = np.memmap(self.root / f"{key}.raw", dtype=np.uint8, mode="r", shape=(meta["frames"], w, h, 3))
+        except (OSError, ValueError, KeyError):
+            return None
+        return frames, meta["fps"]
+
+    def writer(self, key: str, size: tuple[int, int], fps: float) -> "_FrameCacheWriter | None":
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            return _FrameCacheWriter(self.root, key, size, fps)
+        except OSError:
+            return None
+
+
+class _FrameCacheWriter:
+    def __init__(self, root: Path, key: str, size: tuple[int, int], fps: float):
+        self.root, self.key, self.size, self.fps = root, key, size, fps
+        self.count = 0
+        self._tmp = root / f"{key}.{os.getpid()}.tmp"
+        self._file = open(self._tmp, "wb")
+
+    def append(self, frame):
+        self._file.write(frame.tobytes())
+        self.count += 1
+
+    def commit(self):
+        self._file.close()
+        if not self.count:
+            self.abort()
+            return
+        os.replace(self._tmp, self.root / f"{self.key}.raw")
+        # The header goes last: an entry without one is never read.
+        meta = {"frames": self.count, "size": list(self.size), "fps": self.fps}
+        (self.root / f"{self.key}.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    def abort(self):
+        self._file.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+class SplashDecoder:
+    """Decode and scale frames on a producer thread into a bounded queue.
+
+    The main thread asks for the frame due at the current playback time with
+    `frame_for`; frames the producer delivered too late are skipped rather
+    than shown late. `frames` yields (h, w, 3) arrays unless `prescaled`, in
+    which case they are already (w, h, 3) at `size` (e.g. from the cache).
+    """
+
+    def __init__(self, frames, size: tuple[int, int], *, max_queued: int = 8, prescaled: bool = False, cache_writer=None):
+        self.size = size
+        self.dropped = 0
+        self.finished = False
+        self._frames = frames
+        self._prescaled = prescaled
+        self._cache_writer = cache_writer
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queued))
+        self._stop = threading.Event()
+        self._pending = None
+        self._thread = threading.Thread(target=self._run, name="splash-decoder", daemon=True)
+
+    def start(self) -> "SplashDecoder":
+        self._thread.start()
+        return self
+
+    def frame_for(self, due_index: int):
+        """Newest decoded frame with index <= `due_index`, or None if none is new."""
+        frame = None
+        while True:
+            if self._pending is None:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    return frame
+                if item is _END:
+                    self.finished = True
+                    return frame
+                self._pending = item
+            index, data = self._pending
+            if index > due_index:
+                return frame
+            if frame is not None:
+                self.dropped += 1
+            frame = data
+            self._pending = None
+
+    def stop(self):
+        self._stop.set()
+        # Unblock a producer waiting on a full queue.
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        self._thread.join()
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        writer = self._cache_writer
+        completed = False
+        try:
+            for index, frame in enumerate(self._frames):
+                if self._stop.is_set():
+                    break
+                data = frame if self._prescaled else _scale_frame(frame, self.size)
+                if writer is not None:
+                    writer.append(data)
+                if not self._put((index, data)):
+                    break
+            else:
+                completed = True
+        except Exception as exc:  # noqa: BLE001 - a broken video just ends the splash
+            print(f"Splash video decoding failed; skipping the rest. ({exc})")
+        finally:
+            if writer is not None and completed:
+                writer.commit()
+            elif writer is not None:
+                writer.abort()
+            self._put(_END)
+
+
+def _open_frames(video_path: Path, cfg: GameConfig, cache: SplashFrameCache | None):
+    """Return (decoder, fps, duration, clip) for the splash, or None to skip it."""
+    VideoFileClip = _video_clip_class()
     if VideoFileClip is None:
         print("moviepy is not installed; skipping intro video.")
-        return True
-
-    if not video_path.exists():
-        print(f"Splash video not found at {video_path}; skipping intro.")
-        return True
+        return None
 
     try:
         clip = VideoFileClip(str(video_path))
     except Exception as exc:  # noqa: BLE001
         print(f"Could not load splash video at {video_path}; skipping intro. ({exc})")
-        return True
+        return None
 
     duration = min(cfg.splash_video_max_seconds, clip.duration)
     scale = min(cfg.window_w / clip.w, cfg.window_h / clip.h)
-    new_size = (int(clip.w * scale), int(clip.h * scale))
-    offset = ((cfg.window_w - new_size[0]) // 2, (cfg.window_h - new_size[1]) // 2)
-    resized_clip = clip.resize(newsize=new_size)
-
-    start = time.perf_counter()
-    for frame in resized_clip.iter_frames(fps=clip.fps, dtype="uint8"):
-        elapsed = time.perf_counter() - start
-        if elapsed >= duration:
-            break
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                clip.close()
-                return False
-            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
-                if event.type == pygame.KEYDOWN and event.key not in (pygame.K_ESCAPE, pygame.K_SPACE):
-                    # Only specific keys skip the video to avoid accidental dismissals.
-                    continue
-                clip.close()
-                return True
+    size = (int(clip.w * scale), int(clip.h * scale))
+    writer = None
+    if cache is not None:
+        writer = cache.writer(cache.key(video_path, cfg), size, clip.fps)
+    n_frames = int(duration * clip.fps)
+    frames = (frame for _, frame in zip(range(n_frames), clip.iter_frames(fps=clip.fps, dtype="uint8")))
+    decoder = SplashDecoder(frames, size, max_queued=cfg.splash_queue_frames, cache_writer=writer)
+    return decoder, clip.fps, duration, clip
+
+
+def play_splash(screen: pygame.Surface, clock: pygame.time.Clock, cfg: GameConfig) -> bool:
+    """Play the intro splash video and return False if the window is closed."""
+    video_path = Path(cfg.splash_video_path)
+    if not cfg.show_splash_video:
+        return True
+
+    if not video_path.exists():
+        print(f"Splash video not found at {video_path}; skipping intro.")
+        return True
+
+    cache = SplashFrameCache(cfg.splash_frame_cache_dir) if cfg.splash_frame_cache_dir else None
+    clip = None
+    cached = cache.load(cache.key(video_path, cfg)) if cache is not None else None
+    if cached is not None:
+        frames, fps = cached
+        size = (frames.shape[1], frames.shape[2])
+        duration = len(frames) / fps
+        decoder = SplashDecoder(iter(frames), size, max_queued=cfg.splash_queue_frames, prescaled=True)
+    else:
+        opened = _open_frames(video_path, cfg, cache)
+        if opened is None:
+            return True
+        decoder, fps, duration, clip = opened
+        size = decoder.size
+
+    offset = ((cfg.window_w - size[0]) // 2, (cfg.window_h - size[1]) // 2)
+    frame_surface = pygame.Surface(size, 0, 24)
+    decoder.start()
+    try:
+        start = time.perf_counter()
+        while not decoder.finished:
+            elapsed = time.perf_counter() - start
+            if elapsed >= duration:
+                break
 
-        frame_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-        screen.fill((0, 0, 0))
-        screen.blit(frame_surface, offset)
-        pygame.display.flip()
-        clock.tick(clip.fps)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return False
+                if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                    if event.type == pygame.KEYDOWN and event.key not in (pygame.K_ESCAPE, pygame.K_SPACE):
+                        # Only specific keys skip the video to avoid accidental dismissals.
+                        continue
+                    return True
 
-    clip.close()
+            frame = decoder.frame_for(int(elapsed * fps))
+            if frame is not None:
+                pygame.surfarray.blit_array(frame_surface, frame)
+                screen.fill((0, 0, 0))
+                screen.blit(frame_surface, offset)
+                pygame.display.flip()
+            clock.tick(fps)
+    finally:
+        decoder.stop()
+        if clip is not None:
+            clip.close()
     return True